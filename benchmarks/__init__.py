@@ -0,0 +1,5 @@
+"""
+Speed and accuracy benchmarks for bestdist (asv-compatible).
+
+Run them with ``python -m benchmarks``.
+"""
@@ -0,0 +1,8 @@
+"""``python -m benchmarks run|compare``, see :mod:`benchmarks.runner`."""
+
+import sys
+
+from .runner import main
+
+if __name__ == '__main__':
+    sys.exit(main())
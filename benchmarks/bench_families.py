@@ -0,0 +1,48 @@
+"""Per-family benchmarks: fit, goodness-of-fit test, density and CDF, and accuracy."""
+
+from bestdist.core.base_discrete import BaseDiscreteDistribution
+
+from .common import FAMILIES, SIZES, ground_truth, parameter_error
+
+
+class FamilySuite:
+    """Each family on seeded data drawn from it, over the benchmark sizes."""
+
+    params = [list(FAMILIES), SIZES]
+    param_names = ['family', 'n']
+    number = 1
+    repeat = 3
+    timeout = 600
+
+    def setup(self, family, n):
+        """Draw the data and fit it once for the evaluation benchmarks."""
+        self.dist_class, self.truth = FAMILIES[family]
+        self.data = ground_truth(family, n)
+        self.fitted = self.dist_class(self.data)
+        self.fitted.fit()
+        if issubclass(self.dist_class, BaseDiscreteDistribution):
+            self.density = self.fitted.pmf
+        else:
+            self.density = self.fitted.pdf
+
+    def time_fit(self, family, n):
+        """Validate the data and fit the family."""
+        self.dist_class(self.data).fit()
+
+    def time_gof(self, family, n):
+        """Default goodness-of-fit test of the fitted family."""
+        self.fitted.test_goodness_of_fit()
+
+    def time_density(self, family, n):
+        """pdf (pmf for discrete families) at every observation."""
+        self.density(self.data)
+
+    def time_cdf(self, family, n):
+        """CDF at every observation."""
+        self.fitted.cdf(self.data)
+
+    def track_parameter_error(self, family, n):
+        """Largest scaled error of the fitted parameters against the truth."""
+        return parameter_error(self.fitted.params, self.truth)
+
+    track_parameter_error.unit = 'scaled error'
@@ -0,0 +1,42 @@
+"""End-to-end DistributionFitter.fit benchmarks, serial and parallel."""
+
+from bestdist import DistributionFitter, MetricsRegistry
+
+from .common import FAMILIES, SIZES, ground_truth, parameter_error
+
+# Family the data of each dist_type is drawn from
+TRUTH = {'continuous': 'Gamma', 'discrete': 'NegativeBinomial'}
+
+
+class FitterSuite:
+    """All default candidates on seeded data, in one process or a pool of four."""
+
+    params = [['continuous', 'discrete'], SIZES, [1, 4]]
+    param_names = ['dist_type', 'n', 'n_jobs']
+    number = 1
+    repeat = 3
+    timeout = 1800
+
+    def setup(self, dist_type, n, n_jobs):
+        """Draw the data of the dist_type's true family."""
+        self.data = ground_truth(TRUTH[dist_type], n)
+
+    def _fit(self, dist_type, n_jobs):
+        # A private registry keeps benchmark fits out of the process metrics
+        fitter = DistributionFitter(
+            self.data, dist_type=dist_type, metrics=MetricsRegistry()
+        )
+        return fitter.fit(verbose=False, n_jobs=n_jobs)
+
+    def time_fit(self, dist_type, n, n_jobs):
+        """Fit, test and rank every default candidate."""
+        self._fit(dist_type, n_jobs)
+
+    def track_parameter_error(self, dist_type, n, n_jobs):
+        """Largest scaled parameter error of the true family's fit."""
+        family = TRUTH[dist_type]
+        results = self._fit(dist_type, n_jobs)
+        result = next(r for r in results if r['distribution'] == family)
+        return parameter_error(result['parameters'], FAMILIES[family][1])
+
+    track_parameter_error.unit = 'scaled error'
@@ -0,0 +1,65 @@
+"""Import time of the package, measured in fresh interpreters."""
+
+from typing import Tuple
+import json
+import subprocess
+import sys
+
+# Modules that the import path should not pull in before they are needed
+HEAVY_MODULES = ('pandas', 'matplotlib', 'scipy.stats')
+
+# Statement -> what it stands for in a user's script
+STATEMENTS = {
+    'import bestdist': 'import bestdist',
+    'fitter': 'from bestdist import DistributionFitter',
+    'distribution': 'from bestdist.distributions.continuous import Gamma',
+}
+
+_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [m for m in {heavy!r} if m in sys.modules]]))
+'''
+
+
+def measure(statement: str) -> Tuple[float, list]:
+    """
+    Run ``statement`` in a new interpreter.
+
+    Returns:
+        Tuple of (seconds taken, heavy modules loaded)
+    """
+    script = _SCRIPT.format(statement=statement, heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True, check=True
+    ).stdout
+    elapsed, loaded = json.loads(output.splitlines()[-1])
+    return elapsed, loaded
+
+
+class ImportSuite:
+    """Cold import of the package, the fitter and one distribution.
+
+    Each measurement needs a new interpreter (a second import in the same
+    process is a dictionary lookup), so the times are tracked from inside
+    the subprocess rather than timed around it, leaving out interpreter
+    startup.
+    """
+
+    params = list(STATEMENTS)
+    param_names = ['statement']
+    repeat = 5
+
+    def track_import_time(self, statement):
+        """Best of ``repeat`` cold imports, in seconds."""
+        return min(measure(STATEMENTS[statement])[0] for _ in range(self.repeat))
+
+    track_import_time.unit = 'seconds'
+
+    def track_heavy_modules_loaded(self, statement):
+        """How many of pandas, matplotlib and scipy.stats the import loaded."""
+        return len(measure(STATEMENTS[statement])[1])
+
+    track_heavy_modules_loaded.unit = 'modules'
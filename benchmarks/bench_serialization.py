@@ -0,0 +1,56 @@
+"""Saving and loading fitted models and result tables."""
+
+from bestdist import DistributionFitter, FittedModel, MetricsRegistry, ResultTable
+
+from .common import ground_truth
+
+
+class SerializationSuite:
+    """A model and the ranked table of every default continuous candidate."""
+
+    params = ['json', 'bytes']
+    param_names = ['format']
+    number = 1000
+    repeat = 5
+
+    def setup(self, format):
+        """Fit once and serialize the best model and the table."""
+        fitter = DistributionFitter(
+            ground_truth('Gamma', 10**4), metrics=MetricsRegistry()
+        )
+        fitter.fit(verbose=False)
+        self.table = fitter.result_table()
+        self.model = fitter.get_best_distribution()['distribution_object']
+        if format == 'json':
+            self.model_payload = self.model.to_json()
+            self.table_payload = self.table.to_json()
+        else:
+            self.model_payload = self.model.to_bytes()
+            self.table_payload = self.table.to_bytes()
+
+    def time_load_model(self, format):
+        """Rebuild the best model."""
+        if format == 'json':
+            FittedModel.from_json(self.model_payload)
+        else:
+            FittedModel.from_bytes(self.model_payload)
+
+    def time_load_table(self, format):
+        """Rebuild the ranked table with its models."""
+        if format == 'json':
+            ResultTable.from_json(self.table_payload)
+        else:
+            ResultTable.from_bytes(self.table_payload)
+
+    def time_dump_table(self, format):
+        """Serialize the ranked table."""
+        if format == 'json':
+            self.table.to_json()
+        else:
+            self.table.to_bytes()
+
+    def track_table_size(self, format):
+        """Size of the serialized table in bytes."""
+        return len(self.table_payload)
+
+    track_table_size.unit = 'bytes'
@@ -0,0 +1,79 @@
+"""Sample sizes and seeded ground-truth data shared by the benchmarks."""
+
+from typing import Dict, List, Tuple, Type
+from functools import lru_cache
+import os
+
+import numpy as np
+
+from bestdist.distributions.continuous import (
+    Normal, Gamma, Beta, Weibull, Lognormal, Exponential, Uniform, Cauchy, StudentT
+)
+from bestdist.distributions.discrete import (
+    Poisson, Binomial, NegativeBinomial, Geometric
+)
+
+# Largest sample size benchmarked. Sizes go up to 10**8 (800 MB of float64
+# per dataset), so larger runs are opt-in
+MAX_N = int(float(os.environ.get('BESTDIST_BENCH_MAX_N', 10**6)))
+SIZES: List[int] = [10**k for k in range(3, 9) if 10**k <= MAX_N]
+
+SEED = 20240601
+
+# Family name -> (class, true parameters) of the ground-truth generators
+CONTINUOUS: Dict[str, Tuple[Type, Dict[str, float]]] = {
+    'Normal': (Normal, {'loc': 3.0, 'scale': 2.0}),
+    'Gamma': (Gamma, {'a': 2.5, 'loc': 0.0, 'scale': 1.5}),
+    'Beta': (Beta, {'a': 2.0, 'b': 5.0, 'loc': 0.0, 'scale': 1.0}),
+    'Weibull': (Weibull, {'c': 1.5, 'loc': 0.0, 'scale': 2.0}),
+    'Lognormal': (Lognormal, {'s': 0.5, 'loc': 0.0, 'scale': 1.0}),
+    'Exponential': (Exponential, {'loc': 0.0, 'scale': 2.0}),
+    'Uniform': (Uniform, {'loc': -1.0, 'scale': 4.0}),
+    'Cauchy': (Cauchy, {'loc': 0.5, 'scale': 1.0}),
+    'StudentT': (StudentT, {'df': 5.0, 'loc': 0.0, 'scale': 1.0}),
+}
+DISCRETE: Dict[str, Tuple[Type, Dict[str, float]]] = {
+    'Poisson': (Poisson, {'mu': 4.0}),
+    'Binomial': (Binomial, {'n': 20, 'p': 0.3}),
+    'NegativeBinomial': (NegativeBinomial, {'n': 3.0, 'p': 0.4}),
+    'Geometric': (Geometric, {'p': 0.25}),
+}
+FAMILIES = {**CONTINUOUS, **DISCRETE}
+
+
+@lru_cache(maxsize=2)
+def ground_truth(family: str, n: int, seed: int = SEED) -> np.ndarray:
+    """
+    Seeded sample of ``n`` points from a family with its true parameters.
+
+    Args:
+        family: Name of a family in ``FAMILIES``
+        n: Sample size
+        seed: Random seed
+
+    Returns:
+        Sample (read-only, shared between benchmarks)
+    """
+    dist_class, params = FAMILIES[family]
+    placeholder = dist_class(np.array([1.0, 2.0, 3.0]))
+    sample = placeholder._get_scipy_dist()(**params).rvs(
+        size=n, random_state=np.random.default_rng(seed)
+    )
+    sample.setflags(write=False)
+    return sample
+
+
+def parameter_error(estimated: Dict[str, float], truth: Dict[str, float]) -> float:
+    """
+    Largest scaled error of estimated parameters.
+
+    Each error is ``|estimate - truth| / max(|truth|, 1)``: relative for
+    large parameters, absolute for those near zero (e.g. loc = 0).
+
+    Returns:
+        Maximum error over the true parameters
+    """
+    return max(
+        abs(estimated[name] - value) / max(abs(value), 1.0)
+        for name, value in truth.items()
+    )
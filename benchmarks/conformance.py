@@ -0,0 +1,388 @@
+"""
+Accuracy conformance of bestdist's fast paths against scipy's maximum likelihood.
+
+Data is drawn from every built-in family with parameters sampled at
+random over wide ranges (``PARAMETER_RANGES``) and several sample sizes,
+from a seed, so every failing case can be replayed. Two levels are
+checked:
+
+- Family fits: parameters and log-likelihood of a family's ``fit()`` in
+  each mode of ``FAMILY_MODES`` against ``scipy_dist.fit`` (continuous)
+  or ``scipy.stats.fit`` (discrete, bounded search).
+- Fitter runs: ``get_best_distribution()`` of a ``DistributionFitter``
+  in each mode of ``FITTER_MODES`` against the default fitter.
+
+A case conforms within these tolerances:
+
+- ``LOGLIK_TOL``: the fast fit may lose at most this much mean
+  log-likelihood per observation to the reference (it may gain any
+  amount). Closed-form moment estimators of discrete families are
+  allowed ``MOMENTS_LOGLIK_TOL`` instead, as they are not maximum
+  likelihood estimators.
+- ``PARAM_TOL``: the largest scaled parameter difference
+  (``|fast - reference| / max(|reference|, 1)``), unless the
+  log-likelihoods agree within ``LOGLIK_TOL``: flat or multimodal
+  likelihoods (e.g. a free ``loc``) legitimately have distant optima.
+- ``AIC_TOL``: a different best distribution is equivalent when its
+  AIC is at most this much above the reference choice's (Burnham and
+  Anderson's "substantial support"), or below it: a fast optimizer may
+  fit a family better than the reference did and rightly rank it first.
+
+Example:
+    ```bash
+    python -m benchmarks conformance --cases 5 --sizes 1000 100000
+    ```
+"""
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+import time
+import warnings
+
+import numpy as np
+from scipy import stats
+from scipy.optimize import differential_evolution
+
+from bestdist import DistributionFitter, MetricsRegistry
+from bestdist.core.base_discrete import BaseDiscreteDistribution
+
+from .common import CONTINUOUS, FAMILIES
+
+LOGLIK_TOL = 1e-4
+MOMENTS_LOGLIK_TOL = 1e-2
+PARAM_TOL = 1e-2
+AIC_TOL = 2.0
+
+# Family -> parameter -> (kind, low, high), kind one of 'log' (log-uniform),
+# 'uniform', 'int' (uniform integer, inclusive) or 'fixed' (low)
+PARAMETER_RANGES: Dict[str, Dict[str, Tuple[str, float, float]]] = {
+    'Normal': {'loc': ('uniform', -100, 100), 'scale': ('log', 0.01, 100)},
+    'Gamma': {
+        'a': ('log', 0.5, 20), 'loc': ('fixed', 0, 0), 'scale': ('log', 0.1, 100)
+    },
+    'Beta': {
+        'a': ('log', 0.5, 10), 'b': ('log', 0.5, 10),
+        'loc': ('fixed', 0, 0), 'scale': ('fixed', 1, 1),
+    },
+    'Weibull': {
+        'c': ('log', 0.5, 5), 'loc': ('fixed', 0, 0), 'scale': ('log', 0.1, 100)
+    },
+    'Lognormal': {
+        's': ('log', 0.1, 1.5), 'loc': ('fixed', 0, 0), 'scale': ('log', 0.1, 100)
+    },
+    'Exponential': {'loc': ('fixed', 0, 0), 'scale': ('log', 0.1, 100)},
+    'Uniform': {'loc': ('uniform', -100, 100), 'scale': ('log', 0.1, 100)},
+    'Cauchy': {'loc': ('uniform', -100, 100), 'scale': ('log', 0.1, 10)},
+    'StudentT': {
+        'df': ('log', 1.5, 30), 'loc': ('uniform', -10, 10), 'scale': ('log', 0.1, 10)
+    },
+    'Poisson': {'mu': ('log', 0.5, 50)},
+    'Binomial': {'n': ('int', 5, 100), 'p': ('uniform', 0.05, 0.95)},
+    'NegativeBinomial': {'n': ('log', 0.5, 20), 'p': ('uniform', 0.1, 0.9)},
+    'Geometric': {'p': ('uniform', 0.05, 0.9)},
+}
+
+# Mode -> keyword arguments of a family's fit() (continuous families only;
+# discrete families have a single closed-form estimator, mode 'default')
+FAMILY_MODES: Dict[str, Dict[str, Any]] = {
+    'default': {},
+    'newton': {'optimizer': 'newton'},
+    'lbfgsb': {'optimizer': 'lbfgsb'},
+}
+
+# Mode -> (DistributionFitter keyword arguments, fit() keyword arguments)
+FITTER_MODES: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {
+    'newton': ({}, {'optimizer': 'newton'}),
+    'racing': ({}, {'racing': True}),
+    'screening': ({}, {'screening': 'conservative'}),
+    'compact': ({'compact': True}, {}),
+    'ks_sketch': ({'method': 'ks_sketch'}, {}),
+}
+# Modes that only apply to continuous data
+CONTINUOUS_ONLY = {'newton', 'ks_sketch'}
+
+
+class Case(NamedTuple):
+    """One generated dataset: its family, true parameters, size and seed."""
+
+    family: str
+    params: Dict[str, float]
+    n: int
+    seed: int
+
+    def data(self) -> np.ndarray:
+        """Draw the case's sample."""
+        dist_class, _ = FAMILIES[self.family]
+        scipy_dist = dist_class(np.array([1.0, 2.0, 3.0]))._get_scipy_dist()
+        return scipy_dist(**self.params).rvs(size=self.n, random_state=self.seed)
+
+
+def draw_params(family: str, rng: np.random.Generator) -> Dict[str, float]:
+    """Random true parameters of a family within ``PARAMETER_RANGES``."""
+    params = {}
+    for name, (kind, low, high) in PARAMETER_RANGES[family].items():
+        if kind == 'log':
+            params[name] = float(np.exp(rng.uniform(np.log(low), np.log(high))))
+        elif kind == 'uniform':
+            params[name] = float(rng.uniform(low, high))
+        elif kind == 'int':
+            params[name] = int(rng.integers(low, high + 1))
+        else:
+            params[name] = low
+    return params
+
+
+def draw_cases(
+    families: Optional[List[str]] = None,
+    sizes: Tuple[int, ...] = (1_000, 10_000),
+    n_cases: int = 3,
+    seed: int = 0
+) -> Iterator[Case]:
+    """
+    Generate cases: ``n_cases`` random parameter sets per family and size.
+
+    Args:
+        families: Family names (defaults to all built-in families)
+        sizes: Sample sizes
+        n_cases: Parameter sets per family and size
+        seed: Seed of the whole run; the same seed gives the same cases
+    """
+    rng = np.random.default_rng(seed)
+    for family in families or list(FAMILIES):
+        for n in sizes:
+            for _ in range(n_cases):
+                params = draw_params(family, rng)
+                yield Case(family, params, n, int(rng.integers(2**31)))
+
+
+def _scaled_difference(params: Dict[str, float], reference: Dict[str, float]) -> float:
+    """Largest ``|param - reference| / max(|reference|, 1)``."""
+    return max(
+        abs(params[name] - value) / max(abs(value), 1.0)
+        for name, value in reference.items()
+    )
+
+
+def _log_likelihood(frozen: Any, data: np.ndarray) -> float:
+    """Log-likelihood of data under a frozen scipy distribution."""
+    density = frozen.logpmf if hasattr(frozen, 'logpmf') else frozen.logpdf
+    return float(np.sum(density(data)))
+
+
+def reference_fit(family: str, data: np.ndarray) -> Dict[str, float]:
+    """
+    Maximum likelihood parameters from scipy.
+
+    Continuous families use ``scipy_dist.fit``; discrete families, which
+    scipy can't fit with a method, use ``scipy.stats.fit`` with bounds
+    derived from the data.
+    """
+    dist_class, _ = FAMILIES[family]
+    placeholder = dist_class(np.array([1.0, 2.0, 3.0]))
+    scipy_dist = placeholder._get_scipy_dist()
+    if family in CONTINUOUS:
+        return dict(zip(placeholder.param_names, map(float, scipy_dist.fit(data))))
+    high = float(np.max(data))
+    bounds = {
+        'Poisson': {'mu': (0, high + 1)},
+        'Binomial': {'n': (high, 10 * high + 10), 'p': (0, 1)},
+        'NegativeBinomial': {'n': (1e-3, 1e3), 'p': (1e-6, 1)},
+        'Geometric': {'p': (1e-6, 1)},
+    }[family]
+    result = stats.fit(scipy_dist, data, bounds, optimizer=_seeded_optimizer)
+    return {name: float(getattr(result.params, name)) for name in bounds}
+
+
+def _seeded_optimizer(func, bounds, integrality):
+    """``scipy.stats.fit``'s default optimizer, seeded for reproducible references."""
+    return differential_evolution(func, bounds, integrality=integrality, seed=0)
+
+
+def check_family(case: Case, modes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Compare a family's fits in each mode with the scipy reference.
+
+    Returns:
+        One row per mode with the case, the 'reference_time' and
+        'fast_time' in seconds, their 'speedup', the 'param_difference',
+        the 'loglik_deficit' per observation (negative when the fast fit
+        is better) and whether it 'conforms'
+    """
+    dist_class, _ = FAMILIES[case.family]
+    data = case.data()
+    discrete = issubclass(dist_class, BaseDiscreteDistribution)
+    if modes is None:
+        modes = ['default'] if discrete else list(FAMILY_MODES)
+    elif discrete:
+        modes = [mode for mode in modes if mode == 'default']
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=RuntimeWarning)
+        started = time.perf_counter()
+        reference = reference_fit(case.family, data)
+        reference_time = time.perf_counter() - started
+        scipy_dist = dist_class(data)._get_scipy_dist()
+        reference_loglik = _log_likelihood(scipy_dist(**reference), data)
+
+        rows = []
+        for mode in modes:
+            started = time.perf_counter()
+            dist = dist_class(data)
+            params = dist.fit(**FAMILY_MODES[mode])
+            fast_time = time.perf_counter() - started
+            deficit = (reference_loglik - _log_likelihood(dist.dist, data)) / case.n
+            difference = _scaled_difference(params, reference)
+            tolerance = MOMENTS_LOGLIK_TOL if discrete else LOGLIK_TOL
+            rows.append({
+                'level': 'family',
+                'family': case.family,
+                'mode': mode,
+                'n': case.n,
+                'seed': case.seed,
+                'true_params': case.params,
+                'reference_time': reference_time,
+                'fast_time': fast_time,
+                'speedup': reference_time / fast_time,
+                'param_difference': difference,
+                'loglik_deficit': deficit,
+                'conforms': bool(
+                    deficit <= tolerance
+                    and (difference <= PARAM_TOL or deficit <= LOGLIK_TOL)
+                ),
+            })
+    return rows
+
+
+def check_fitter(case: Case, modes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Compare the best distribution of a fitter in each mode with the default fitter.
+
+    Returns:
+        One row per mode with the case, the 'reference_time' and
+        'fast_time' in seconds, their 'speedup', both best distributions,
+        whether they are the 'same', and whether the fast choice
+        'conforms' (same, or its AIC within ``AIC_TOL`` of the reference
+        choice's)
+    """
+    dist_class, _ = FAMILIES[case.family]
+    discrete = issubclass(dist_class, BaseDiscreteDistribution)
+    dist_type = 'discrete' if discrete else 'continuous'
+    if modes is None:
+        modes = list(FITTER_MODES)
+    if dist_type == 'discrete':
+        modes = [mode for mode in modes if mode not in CONTINUOUS_ONLY]
+    data = case.data()
+
+    def run(
+        init: Dict[str, Any], options: Dict[str, Any]
+    ) -> Tuple[DistributionFitter, float]:
+        fitter = DistributionFitter(
+            data, dist_type=dist_type, metrics=MetricsRegistry(), **init
+        )
+        started = time.perf_counter()
+        fitter.fit(verbose=False, **options)
+        return fitter, time.perf_counter() - started
+
+    reference, reference_time = run({}, {})
+    reference_best = reference.get_best_distribution()
+
+    rows = []
+    for mode in modes:
+        fitter, fast_time = run(*FITTER_MODES[mode])
+        best = fitter.get_best_distribution()
+        same = best['distribution'] == reference_best['distribution']
+        gap = best['aic'] - reference_best['aic']
+        rows.append({
+            'level': 'fitter',
+            'family': case.family,
+            'mode': mode,
+            'n': case.n,
+            'seed': case.seed,
+            'true_params': case.params,
+            'reference_time': reference_time,
+            'fast_time': fast_time,
+            'speedup': reference_time / fast_time,
+            'reference_best': reference_best['distribution'],
+            'fast_best': best['distribution'],
+            'same': same,
+            'conforms': bool(same or gap <= AIC_TOL),
+        })
+    return rows
+
+
+def summarize(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Speedup and accuracy side by side per (level, family, mode).
+
+    Returns:
+        Rows with the number of 'cases', 'median_speedup', the worst
+        'max_param_difference' and 'max_loglik_deficit' (family level) or
+        the 'same_best' fraction (fitter level), and the 'conforming'
+        fraction
+    """
+    groups: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault((row['level'], row['family'], row['mode']), []).append(row)
+    summary = []
+    for (level, family, mode), group in groups.items():
+        entry = {
+            'level': level,
+            'family': family,
+            'mode': mode,
+            'cases': len(group),
+            'median_speedup': float(np.median([row['speedup'] for row in group])),
+            'conforming': sum(row['conforms'] for row in group) / len(group),
+        }
+        if level == 'family':
+            entry['max_param_difference'] = max(
+                row['param_difference'] for row in group
+            )
+            entry['max_loglik_deficit'] = max(row['loglik_deficit'] for row in group)
+        else:
+            entry['same_best'] = sum(row['same'] for row in group) / len(group)
+        summary.append(entry)
+    return summary
+
+
+def run_conformance(
+    families: Optional[List[str]] = None,
+    sizes: Tuple[int, ...] = (1_000, 10_000),
+    n_cases: int = 3,
+    seed: int = 0,
+    levels: Tuple[str, ...] = ('family', 'fitter'),
+    verbose: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Check every generated case at the requested levels.
+
+    Returns:
+        All rows of :func:`check_family` and :func:`check_fitter`
+    """
+    rows = []
+    for case in draw_cases(families, sizes, n_cases, seed):
+        if 'family' in levels:
+            rows.extend(check_family(case))
+        if 'fitter' in levels:
+            rows.extend(check_fitter(case))
+        if verbose:
+            print(f'{case.family} n={case.n} seed={case.seed}', flush=True)
+    return rows
+
+
+def format_summary(summary: List[Dict[str, Any]]) -> str:
+    """Plain-text table of :func:`summarize` rows."""
+    lines = [
+        f"{'level':<7} {'family':<17} {'mode':<10} {'cases':>5} {'speedup':>8} "
+        f"{'max dparam':>10} {'max dloglik':>11} {'same best':>9} {'conform':>8}"
+    ]
+    for row in summary:
+        parameter = row.get('max_param_difference')
+        deficit = row.get('max_loglik_deficit')
+        same = row.get('same_best')
+        lines.append(
+            f"{row['level']:<7} {row['family']:<17} {row['mode']:<10} "
+            f"{row['cases']:>5} {row['median_speedup']:>7.2f}x "
+            f"{'' if parameter is None else f'{parameter:.2e}':>10} "
+            f"{'' if deficit is None else f'{deficit:.2e}':>11} "
+            f"{'' if same is None else f'{same:.0%}':>9} {row['conforming']:>8.0%}"
+        )
+    return '\n'.join(lines)
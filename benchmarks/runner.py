@@ -0,0 +1,326 @@
+"""
+Run the benchmarks without asv, save JSON baselines and compare them.
+
+Benchmarks follow asv's conventions: classes in ``bench_*`` modules with
+``params``/``param_names``, a ``setup`` method, ``time_*`` methods (timed,
+best of ``repeat`` runs of ``number`` calls) and ``track_*`` methods
+(returned value recorded, e.g. a parameter error). The same files run
+under ``asv run`` with the repository's ``asv.conf.json``.
+
+Example:
+    ```bash
+    python -m benchmarks run --bench 'FamilySuite.*Gamma' -o base.json
+    # ... change the code ...
+    python -m benchmarks run --bench 'FamilySuite.*Gamma' -o new.json
+    python -m benchmarks compare base.json new.json --factor 1.2
+    ```
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import argparse
+import importlib
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Version of the JSON baseline format
+FORMAT_VERSION = 1
+
+DEFAULT_RESULTS_DIR = Path(__file__).parent / 'results'
+
+
+def discover() -> Iterator[Tuple[str, type]]:
+    """Yield (module.Class, class) of every benchmark class, by name."""
+    package = Path(__file__).parent
+    for info in sorted(pkgutil.iter_modules([str(package)]), key=lambda m: m.name):
+        if not info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module(f'{__package__}.{info.name}')
+        for name, obj in sorted(vars(module).items()):
+            if isinstance(obj, type) and obj.__module__ == module.__name__ and any(
+                attr.startswith(('time_', 'track_')) for attr in vars(obj)
+            ):
+                yield f'{info.name}.{name}', obj
+
+
+def _combinations(suite: type) -> List[Dict[str, Any]]:
+    """Parameter combinations of a suite, as name -> value mappings."""
+    params = getattr(suite, 'params', [])
+    names = getattr(suite, 'param_names', [])
+    if not params:
+        return [{}]
+    if not isinstance(params[0], list):
+        params = [params]
+    return [dict(zip(names, values)) for values in itertools.product(*params)]
+
+
+def run(pattern: Optional[str] = None, verbose: bool = True) -> List[Dict[str, Any]]:
+    """
+    Run the benchmarks whose 'module.Class.method' name matches ``pattern``.
+
+    Args:
+        pattern: Regular expression searched in each benchmark's name
+                 followed by its parameters, e.g. ``'time_fit.*Gamma'``
+        verbose: If True, print each result as it's measured
+
+    Returns:
+        One record per benchmark and parameter combination, with its
+        'name', 'params', 'kind' ('time' in seconds or 'track') and
+        'value' (None if setup or the benchmark raised NotImplementedError)
+    """
+    matcher = re.compile(pattern) if pattern else None
+    records = []
+    for suite_name, suite in discover():
+        methods = sorted(
+            attr for attr in vars(suite) if attr.startswith(('time_', 'track_'))
+        )
+        for params in _combinations(suite):
+            label = ', '.join(f'{key}={value}' for key, value in params.items())
+            selected = [
+                method for method in methods
+                if matcher is None or matcher.search(f'{suite_name}.{method}({label})')
+            ]
+            if not selected:
+                continue
+            instance = suite()
+            try:
+                if hasattr(instance, 'setup'):
+                    instance.setup(*params.values())
+            except NotImplementedError:
+                continue
+            for method in selected:
+                func = getattr(instance, method)
+                kind = 'time' if method.startswith('time_') else 'track'
+                try:
+                    if kind == 'time':
+                        value = min(timeit.repeat(
+                            lambda: func(*params.values()),
+                            number=getattr(suite, 'number', 1),
+                            repeat=getattr(suite, 'repeat', 3)
+                        )) / getattr(suite, 'number', 1)
+                    else:
+                        value = float(func(*params.values()))
+                except NotImplementedError:
+                    value = None
+                records.append({
+                    'name': f'{suite_name}.{method}',
+                    'params': params,
+                    'kind': kind,
+                    'value': value,
+                })
+                if verbose:
+                    shown = 'n/a' if value is None else f'{value:.4g}'
+                    print(f'{suite_name}.{method}({label}): {shown}', flush=True)
+    return records
+
+
+def save(records: List[Dict[str, Any]], path: Path) -> None:
+    """Write benchmark records to a JSON baseline, with the environment they ran in."""
+    import numpy
+    import scipy
+    import bestdist
+
+    baseline = {
+        'format_version': FORMAT_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'machine': {
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+        },
+        'versions': {
+            'python': platform.python_version(),
+            'bestdist': bestdist.__version__,
+            'numpy': numpy.__version__,
+            'scipy': scipy.__version__,
+        },
+        'results': records,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, indent=1))
+
+
+def load(path: Path) -> Dict[str, Any]:
+    """
+    Read a JSON baseline.
+
+    Raises:
+        ValueError: If the file is not a baseline of a known format version
+    """
+    baseline = json.loads(Path(path).read_text())
+    if baseline.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} benchmark baseline")
+    return baseline
+
+
+def compare(
+    base: Dict[str, Any],
+    new: Dict[str, Any],
+    factor: float = 1.2,
+    tolerance: float = 1e-9
+) -> List[Dict[str, Any]]:
+    """
+    Compare two baselines benchmark by benchmark.
+
+    Times regress when they grow by more than ``factor``. Tracked values
+    (parameter errors, lower is better) regress when they grow by more
+    than ``factor`` and by more than ``tolerance`` in absolute terms, so
+    that errors near zero don't flag on rounding noise.
+
+    Args:
+        base: Baseline from :func:`load`
+        new: Baseline to compare against it
+        factor: Ratio beyond which a change counts
+        tolerance: Smallest absolute change of a tracked value that counts
+
+    Returns:
+        One row per benchmark present in both, with 'name', 'params',
+        'kind', 'base', 'new', 'ratio' and 'change' ('regression',
+        'improvement' or 'same')
+    """
+    def key(record: Dict[str, Any]) -> Tuple[str, str]:
+        return record['name'], json.dumps(record['params'], sort_keys=True)
+
+    before = {key(record): record for record in base['results']}
+    rows = []
+    for record in new['results']:
+        old = before.get(key(record))
+        if old is None or old['value'] is None or record['value'] is None:
+            continue
+        old_value, new_value = old['value'], record['value']
+        if old_value > 0:
+            ratio = new_value / old_value
+        else:
+            ratio = float('inf') if new_value > 0 else 1.0
+        significant = record['kind'] == 'time' or abs(new_value - old_value) > tolerance
+        if significant and ratio > factor:
+            change = 'regression'
+        elif significant and ratio < 1 / factor:
+            change = 'improvement'
+        else:
+            change = 'same'
+        rows.append({
+            'name': record['name'],
+            'params': record['params'],
+            'kind': record['kind'],
+            'base': old_value,
+            'new': new_value,
+            'ratio': ratio,
+            'change': change,
+        })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point (``python -m benchmarks``).
+
+    Returns:
+        Exit status: 1 if ``compare`` found regressions or ``conformance``
+        non-conforming cases, else 0
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description=__doc__.split('\n')[1]
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser(
+        'run', help='run benchmarks and save a JSON baseline'
+    )
+    run_parser.add_argument(
+        '-b', '--bench', help='regular expression selecting benchmarks'
+    )
+    run_parser.add_argument('-o', '--output', type=Path, help='baseline file to write')
+    run_parser.add_argument(
+        '--max-n', type=float,
+        help='largest sample size (default 1e6, or $BESTDIST_BENCH_MAX_N; up to 1e8)'
+    )
+    run_parser.add_argument(
+        '-q', '--quiet', action='store_true', help='print nothing per benchmark'
+    )
+
+    compare_parser = commands.add_parser('compare', help='compare two baselines')
+    compare_parser.add_argument('base', type=Path)
+    compare_parser.add_argument('new', type=Path)
+    compare_parser.add_argument(
+        '--factor', type=float, default=1.2,
+        help='ratio that counts as a change (default 1.2)'
+    )
+    compare_parser.add_argument(
+        '--all', action='store_true', help='list unchanged benchmarks too'
+    )
+
+    conformance_parser = commands.add_parser(
+        'conformance', help='check fast paths against scipy maximum likelihood'
+    )
+    conformance_parser.add_argument(
+        '--families', nargs='+', help='families (default: all)'
+    )
+    conformance_parser.add_argument(
+        '--sizes', nargs='+', type=int, default=[1_000, 10_000], help='sample sizes'
+    )
+    conformance_parser.add_argument(
+        '--cases', type=int, default=3, help='random parameter sets per family and size'
+    )
+    conformance_parser.add_argument('--seed', type=int, default=0)
+    conformance_parser.add_argument(
+        '--level', choices=['family', 'fitter', 'all'], default='all',
+        help='compare family fits, fitter choices or both'
+    )
+    conformance_parser.add_argument(
+        '-o', '--output', type=Path, help='JSON file for every case'
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == 'conformance':
+        from .conformance import format_summary, run_conformance, summarize
+
+        levels = ('family', 'fitter') if args.level == 'all' else (args.level,)
+        rows = run_conformance(
+            args.families, tuple(args.sizes), args.cases, args.seed, levels,
+            verbose=True
+        )
+        print(format_summary(summarize(rows)))
+        failures = [row for row in rows if not row['conforms']]
+        for row in failures:
+            print(f"non-conforming: {row['level']} {row['family']} {row['mode']} "
+                  f"n={row['n']} seed={row['seed']} params={row['true_params']}")
+        if args.output is not None:
+            args.output.write_text(json.dumps(rows, indent=1))
+        return 1 if failures else 0
+    if args.command == 'run':
+        if args.max_n is not None:
+            # Read by benchmarks.common when the suites are imported
+            os.environ['BESTDIST_BENCH_MAX_N'] = str(int(args.max_n))
+        output = args.output or (
+            DEFAULT_RESULTS_DIR / time.strftime('%Y%m%d-%H%M%S.json')
+        )
+        records = run(args.bench, verbose=not args.quiet)
+        save(records, output)
+        print(f'Saved {len(records)} results to {output}')
+        return 0
+
+    rows = compare(load(args.base), load(args.new), factor=args.factor)
+    regressions = [row for row in rows if row['change'] == 'regression']
+    for row in rows:
+        if row['change'] == 'same' and not args.all:
+            continue
+        label = ', '.join(f'{key}={value}' for key, value in row['params'].items())
+        print(
+            f"{row['change']:>11}  {row['ratio']:7.2f}x  "
+            f"{row['base']:.4g} -> {row['new']:.4g}  {row['name']}({label})"
+        )
+    print(f'{len(regressions)} regression(s) in {len(rows)} compared benchmarks')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
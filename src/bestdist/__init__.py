@@ -36,29 +36,10 @@ __version__ = "0.1.0"
 __author__ = "Wilmar Sepulveda"
 __license__ = "MIT"
 
-# Core functionality
-from .core.fitter import DistributionFitter
-from .core.base import BaseDistribution
-from .core.base_discrete import BaseDiscreteDistribution
-
-# Continuous distributions
-from .distributions.continuous.normal import Normal
-from .distributions.continuous.gamma import Gamma
-from .distributions.continuous.beta import Beta
-from .distributions.continuous.weibull import Weibull
-from .distributions.continuous.lognormal import Lognormal
-from .distributions.continuous.exponential import Exponential
-from .distributions.continuous.uniform import Uniform
-from .distributions.continuous.cauchy import Cauchy
-from .distributions.continuous.student_t import StudentT
-
-# Discrete distributions
-from .distributions.discrete.poisson import Poisson
-from .distributions.discrete.binomial import Binomial
-from .distributions.discrete.negative_binomial import NegativeBinomial
-from .distributions.discrete.geometric import Geometric
-
-# Exceptions
+from typing import TYPE_CHECKING
+import importlib
+
+# Exceptions are cheap and needed to catch errors, so import them eagerly
 from .utils.exceptions import (
     BestdistException,
     DataValidationError,
@@ -66,13 +47,96 @@ from .utils.exceptions import (
     InsufficientDataError,
     InvalidDistributionError,
     ConvergenceError,
+    FitTimeoutError,
+    WorkerCrashError,
 )
 
+# Everything else is imported on first access (PEP 562), so that
+# ``import bestdist`` doesn't load scipy.stats, pandas or the 13
+# distribution modules until they are used.
+_LAZY = {
+    # Core functionality
+    "DistributionFitter": ".core.fitter",
+    "BaseDistribution": ".core.base",
+    "BaseDiscreteDistribution": ".core.base_discrete",
+    "CountHistogram": ".core.histogram",
+    "FittedModel": ".core.model",
+    "ResultTable": ".core.model",
+    "MetricsRegistry": ".core.metrics",
+    "CostModel": ".core.scheduler",
+    "ResultCache": ".core.cache",
+    "QuantileSketch": ".core.sketch",
+    "StreamingDiscreteFitter": ".core.streaming",
+    "StageTimer": ".core.tracing",
+    "StageTracer": ".core.tracing",
+    "ParameterStore": ".core.warm_start",
+    
+    # Continuous distributions
+    "Normal": ".distributions.continuous.normal",
+    "Gamma": ".distributions.continuous.gamma",
+    "Beta": ".distributions.continuous.beta",
+    "Weibull": ".distributions.continuous.weibull",
+    "Lognormal": ".distributions.continuous.lognormal",
+    "Exponential": ".distributions.continuous.exponential",
+    "Uniform": ".distributions.continuous.uniform",
+    "Cauchy": ".distributions.continuous.cauchy",
+    "StudentT": ".distributions.continuous.student_t",
+    
+    # Discrete distributions
+    "Poisson": ".distributions.discrete.poisson",
+    "Binomial": ".distributions.discrete.binomial",
+    "NegativeBinomial": ".distributions.discrete.negative_binomial",
+    "Geometric": ".distributions.discrete.geometric",
+}
+
+if TYPE_CHECKING:
+    from .core.fitter import DistributionFitter
+    from .core.base import BaseDistribution
+    from .core.base_discrete import BaseDiscreteDistribution
+    from .core.histogram import CountHistogram
+    from .core.model import FittedModel, ResultTable
+    from .core.metrics import MetricsRegistry
+    from .core.scheduler import CostModel
+    from .core.cache import ResultCache
+    from .core.sketch import QuantileSketch
+    from .core.streaming import StreamingDiscreteFitter
+    from .core.tracing import StageTimer, StageTracer
+    from .core.warm_start import ParameterStore
+    from .distributions.continuous import (
+        Normal, Gamma, Beta, Weibull, Lognormal, Exponential, Uniform, Cauchy, StudentT
+    )
+    from .distributions.discrete import Poisson, Binomial, NegativeBinomial, Geometric
+
+
+def __getattr__(name):
+    """Import a lazily exported class on first access and cache it."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __all__ = [
     # Main classes
     "DistributionFitter",
     "BaseDistribution",
     "BaseDiscreteDistribution",
+    "CountHistogram",
+    "CostModel",
+    "FittedModel",
+    "QuantileSketch",
+    "ResultCache",
+    "ResultTable",
+    "MetricsRegistry",
+    "StreamingDiscreteFitter",
+    "StageTracer",
+    "StageTimer",
+    "ParameterStore",
     
     # Continuous distributions
     "Normal",
@@ -98,6 +162,8 @@ __all__ = [
     "InsufficientDataError",
     "InvalidDistributionError",
     "ConvergenceError",
+    "FitTimeoutError",
+    "WorkerCrashError",
     
     # Metadata
     "__version__",
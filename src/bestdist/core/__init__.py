@@ -1,10 +1,63 @@
 """Core functionality for pdist."""
 
-from .base import BaseDistribution
-from .fitter import DistributionFitter
+from typing import TYPE_CHECKING
+import importlib
+
+# Imported on first access (PEP 562), see bestdist/__init__.py
+_LAZY = {
+    "BaseDistribution": ".base",
+    "ResultCache": ".cache",
+    "DistributionFitter": ".fitter",
+    "CountHistogram": ".histogram",
+    "MetricsRegistry": ".metrics",
+    "FittedModel": ".model",
+    "ResultTable": ".model",
+    "CostModel": ".scheduler",
+    "QuantileSketch": ".sketch",
+    "StreamingDiscreteFitter": ".streaming",
+    "StageTimer": ".tracing",
+    "StageTracer": ".tracing",
+    "ParameterStore": ".warm_start",
+}
+
+if TYPE_CHECKING:
+    from .base import BaseDistribution
+    from .cache import ResultCache
+    from .fitter import DistributionFitter
+    from .histogram import CountHistogram
+    from .metrics import MetricsRegistry
+    from .model import FittedModel, ResultTable
+    from .scheduler import CostModel
+    from .sketch import QuantileSketch
+    from .streaming import StreamingDiscreteFitter
+    from .tracing import StageTimer, StageTracer
+    from .warm_start import ParameterStore
 
 __all__ = [
     "BaseDistribution",
     "DistributionFitter",
+    "CountHistogram",
+    "CostModel",
+    "FittedModel",
+    "QuantileSketch",
+    "ResultCache",
+    "ResultTable",
+    "MetricsRegistry",
+    "StreamingDiscreteFitter",
+    "StageTracer",
+    "StageTimer",
+    "ParameterStore",
 ]
 
+
+def __getattr__(name):
+    """Import a lazily exported class on first access and cache it."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
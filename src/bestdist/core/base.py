@@ -1,13 +1,21 @@
 """Abstract base class for probability distributions."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
+import time
 import numpy as np
-from scipy.stats import rv_continuous
 
+from .likelihood import (
+    OPTIMIZERS, SimplexOptimizer, has_derivatives, maximize_likelihood, screen_starts
+)
+from ..utils.arrays import robust_standardization, to_clean_array
 from ..utils.types import ArrayLike, TestResult, Parameters
 from ..utils.exceptions import FittingError, InsufficientDataError
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_continuous
+    from .sketch import QuantileSketch
+
 
 class BaseDistribution(ABC):
     """
@@ -34,22 +42,52 @@ class BaseDistribution(ABC):
         ```
     """
     
-    def __init__(self, data: ArrayLike, name: Optional[str] = None):
+    # Whether fit() can start the optimizer from earlier parameters.
+    # Families with closed-form estimates gain nothing from it
+    SUPPORTS_WARM_START = False
+    
+    # Whether fit() standardizes badly scaled data with a robust location
+    # and scale before optimizing, back-transforming loc and scale after
+    STANDARDIZE = False
+    
+    # Optimizer backend used by fit() unless one is given (see OPTIMIZERS)
+    DEFAULT_OPTIMIZER = 'scipy'
+    
+    def __init__(
+        self,
+        data: ArrayLike,
+        name: Optional[str] = None,
+        fixed: Optional[Parameters] = None
+    ):
         """
         Initialize the distribution with data.
         
         Args:
             data: Input data to fit the distribution to
             name: Optional name for the distribution (defaults to class name)
+            fixed: Parameters held at known values instead of being fitted,
+                   e.g. ``{'loc': 0}`` for positive data with a natural
+                   origin or ``{'loc': 0, 'scale': 1}`` for Beta on [0, 1].
+                   Passed to scipy as ``floc``, ``fscale``, ``fa``, ...
             
         Raises:
             InsufficientDataError: If data has fewer than 3 observations
-            ValueError: If data contains NaN or infinite values
+            ValueError: If data contains NaN or infinite values, or a fixed
+                        parameter is not a parameter of the distribution
         """
         self.name = name or self.__class__.__name__
         self.data = self._validate_and_prepare_data(data)
+        self.fixed: Parameters = dict(fixed or {})
+        unknown = set(self.fixed) - set(self.param_names)
+        if unknown:
+            raise ValueError(
+                f"{self.name} has no parameter(s) {sorted(unknown)} to fix; "
+                f"parameters are {self.param_names}"
+            )
         self.params: Optional[Parameters] = None
-        self.dist: Optional[rv_continuous] = None
+        self.dist: Optional['rv_continuous'] = None
+        # Optimizer diagnostics of the last fit
+        self.fit_info: Optional[Dict[str, Any]] = None
         self._fitted = False
         
     def _validate_and_prepare_data(self, data: ArrayLike) -> np.ndarray:
@@ -66,16 +104,11 @@ class BaseDistribution(ABC):
             InsufficientDataError: If data has fewer than 3 observations
             ValueError: If data contains NaN or infinite values
         """
-        # Convert to numpy array
-        if isinstance(data, (list, tuple)):
-            arr = np.array(data, dtype=float)
-        elif hasattr(data, 'values'):  # pandas Series
-            arr = data.values
-        else:
-            arr = np.asarray(data, dtype=float)
-            
-        # Remove NaN values
-        arr = arr[~np.isnan(arr)]
+        # Convert to numpy array and remove NaN values (without copying
+        # data that is already a clean float array; float32 stays float32)
+        arr = to_clean_array(data)
+        if arr.dtype != np.float32:
+            arr = np.asarray(arr, dtype=float)
         
         # Check for insufficient data
         if len(arr) < 3:
@@ -89,8 +122,46 @@ class BaseDistribution(ABC):
             
         return arr
     
+    @property
+    def param_names(self) -> List[str]:
+        """Names of the distribution's parameters: shapes, then loc and scale."""
+        shapes = self._get_scipy_dist().shapes or ''
+        return [name.strip() for name in shapes.split(',') if name.strip()] + ['loc', 'scale']
+    
+    @property
+    def n_free_params(self) -> int:
+        """Number of parameters estimated from the data (not fixed)."""
+        return len(self.param_names) - len(self.fixed)
+    
+    def _fixed_standardized(self, shift: float = 0.0, spread: float = 1.0) -> Dict[str, float]:
+        """Fixed parameters, with loc and scale mapped to standardized data."""
+        fixed = {name: float(value) for name, value in self.fixed.items()}
+        if 'loc' in fixed:
+            fixed['loc'] = (fixed['loc'] - shift) / spread
+        if 'scale' in fixed:
+            fixed['scale'] = fixed['scale'] / spread
+        return fixed
+    
+    def _fixed_kwargs(self, shift: float = 0.0, spread: float = 1.0) -> Dict[str, float]:
+        """Fixed parameters as scipy ``fit`` keywords (``floc``, ``fscale``, ``fa``, ...)."""
+        fixed = self._fixed_standardized(shift, spread)
+        return {f"f{name}": value for name, value in fixed.items()}
+    
+    def _standardization(self) -> Tuple[float, float]:
+        """
+        Robust location and scale used to standardize the data for the optimizer.
+        
+        Returns:
+            Tuple of (shift, spread), see
+            :func:`~bestdist.utils.arrays.robust_standardization`, or (0, 1)
+            if the family is not standardized
+        """
+        if not self.STANDARDIZE:
+            return 0.0, 1.0
+        return robust_standardization(self.data)
+    
     @abstractmethod
-    def _get_scipy_dist(self) -> rv_continuous:
+    def _get_scipy_dist(self) -> 'rv_continuous':
         """
         Return the scipy.stats distribution object.
         
@@ -112,20 +183,136 @@ class BaseDistribution(ABC):
         """
         pass
     
-    def fit(self) -> Parameters:
+    def fit(
+        self,
+        initial: Optional[Parameters] = None,
+        optimizer: Optional[str] = None,
+        n_starts: int = 1,
+        maxiter: Optional[int] = None,
+        tol: Optional[float] = None
+    ) -> Parameters:
         """
         Fit the distribution to the data.
         
+        Args:
+            initial: Parameters of an earlier fit to start the optimizer
+                     from (warm start). Used only by families with
+                     ``SUPPORTS_WARM_START``. With the 'scipy' optimizer,
+                     families with analytic derivatives refine the start by
+                     trust-region Newton, which needs a few likelihood
+                     evaluations from a nearby point where Nelder-Mead needs
+                     about as many as from scratch. If the warm-started fit
+                     does not converge (to a likelihood at least as good as
+                     its starting point's), it is redone from the default
+                     starting guesses
+            optimizer: 'scipy' (scipy's own fit: Nelder-Mead or closed
+                       form), or 'newton' (trust-region Newton) or 'lbfgsb'
+                       (L-BFGS-B) with analytic score and Hessian for
+                       Gamma, Weibull, Beta, Lognormal, StudentT and
+                       Cauchy; other families use scipy. Defaults to
+                       ``DEFAULT_OPTIMIZER``
+            n_starts: Number of starting points for multimodal likelihoods
+                      (families with analytic derivatives). The points are
+                      advanced together in batched passes over the data and
+                      only the best two are refined with ``optimizer``, see
+                      :func:`~bestdist.core.likelihood.screen_starts`
+            maxiter: Iteration limit of the optimizer (Nelder-Mead, passed
+                     to scipy's ``fit`` through its ``optimizer`` hook, or
+                     the gradient backends). Defaults to each optimizer's own
+            tol: Convergence tolerance of the optimizer (``xtol``/``ftol``
+                 for Nelder-Mead, gradient norm for the gradient backends)
+        
         Returns:
-            Dictionary of fitted parameters
+            Dictionary of fitted parameters. Diagnostics of the fit are kept
+            in ``fit_info``: the 'optimizer' and its 'method', whether it
+            'converged', 'iterations', function evaluations 'nfev' and the
+            wall time 'fit_time' in seconds (plus backend-specific entries).
+            Given ``initial``, 'warm_start' tells whether the result comes
+            from it or from a cold refit
             
         Raises:
+            ValueError: If the optimizer is unknown or ``n_starts`` < 1
             FittingError: If fitting fails
         """
+        optimizer = optimizer or self.DEFAULT_OPTIMIZER
+        if optimizer not in OPTIMIZERS:
+            raise ValueError(f"Unknown optimizer: {optimizer}. Choose from {OPTIMIZERS}")
+        if n_starts < 1:
+            raise ValueError(f"n_starts must be at least 1, got {n_starts}")
+        limits = {
+            name: value for name, value in (('maxiter', maxiter), ('tol', tol))
+            if value is not None
+        }
+        started = time.perf_counter()
         try:
             scipy_dist = self._get_scipy_dist()
-            fit_result = scipy_dist.fit(self.data)
-            self.params = self._extract_params(fit_result)
+            shift, spread = self._standardization()
+            data = self.data if (shift, spread) == (0.0, 1.0) else (self.data - shift) / spread
+            
+            warm_start = None
+            if initial is not None and self.SUPPORTS_WARM_START:
+                warm_start = self._standardized_start(initial, shift, spread)
+            if warm_start is not None and not np.isfinite(
+                self._negative_log_likelihood(scipy_dist, warm_start, data, spread)
+            ):
+                # The data moved outside the prior's support
+                warm_start = None
+            # Whether the result comes from warm_start
+            warm = False
+            
+            fit_result = None
+            simplex = SimplexOptimizer(maxiter, tol)
+            if has_derivatives(scipy_dist):
+                if n_starts > 1:
+                    start = warm_start
+                    if start is None:
+                        start = np.asarray(scipy_dist._fitstart(data), dtype=float)
+                    fit_result = self._multi_start_fit(
+                        scipy_dist, data, start, shift, spread, optimizer, n_starts,
+                        simplex, limits
+                    )
+                    warm = warm_start is not None and fit_result is not None
+                else:
+                    if warm_start is not None:
+                        # Newton converges in a few steps from a nearby start,
+                        # whereas Nelder-Mead's cost barely depends on its start
+                        fit_result = self._gradient_fit(
+                            scipy_dist, data, warm_start, shift, spread,
+                            'newton' if optimizer == 'scipy' else optimizer, limits
+                        )
+                        if fit_result is not None:
+                            warm = self.fit_info['converged']
+                            # Not converged from the prior: refit cold
+                            fit_result = fit_result if warm else None
+                            warm_start = None
+                    if fit_result is None and optimizer != 'scipy':
+                        fit_result = self._gradient_fit(
+                            scipy_dist, data,
+                            np.asarray(scipy_dist._fitstart(data), dtype=float),
+                            shift, spread, optimizer, limits
+                        )
+            if fit_result is None:
+                if warm_start is not None:
+                    warm_simplex = SimplexOptimizer(maxiter, tol)
+                    fit_result = self._warm_fit(
+                        scipy_dist, data, warm_start, shift, spread, warm_simplex
+                    )
+                    if fit_result is not None:
+                        simplex, warm = warm_simplex, True
+                if fit_result is None:
+                    fit_result = scipy_dist.fit(
+                        data, optimizer=simplex, **self._fixed_kwargs(shift, spread)
+                    )
+                self.fit_info = simplex.info
+            if initial is not None and self.SUPPORTS_WARM_START:
+                self.fit_info['warm_start'] = warm
+            self.fit_info['fit_time'] = time.perf_counter() - started
+            
+            # Back-transform: shapes are scale-free, loc and scale map linearly
+            theta = np.asarray(fit_result, dtype=float)
+            theta[-2] = shift + spread * theta[-2]
+            theta[-1] = spread * theta[-1]
+            self.params = self._extract_params(tuple(theta))
             self.dist = scipy_dist(**self.params)
             self._fitted = True
             return self.params
@@ -135,16 +322,199 @@ class BaseDistribution(ABC):
                 f"Failed to fit {self.name} distribution: {str(e)}"
             ) from e
     
+    def _standardized_start(
+        self,
+        initial: Parameters,
+        shift: float,
+        spread: float
+    ) -> Optional[np.ndarray]:
+        """Earlier parameters mapped to standardized data, or None if unusable."""
+        try:
+            start = np.array([
+                self.fixed[name] if name in self.fixed else initial[name]
+                for name in self.param_names
+            ], dtype=float)
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not np.isfinite(start).all() or start[-1] <= 0:
+            return None
+        start[-2] = (start[-2] - shift) / spread
+        start[-1] = start[-1] / spread
+        return start
+    
+    def _warm_fit(
+        self,
+        scipy_dist: 'rv_continuous',
+        data: np.ndarray,
+        start: np.ndarray,
+        shift: float,
+        spread: float,
+        simplex: SimplexOptimizer
+    ) -> Optional[Tuple]:
+        """
+        Fit (standardized) data by Nelder-Mead from earlier parameters.
+        
+        ``start`` comes from :meth:`_standardized_start`; ``simplex`` must
+        be fresh, as its convergence flag decides whether the fit is kept.
+        
+        Returns:
+            Fit result on ``data``, or None if the optimizer did not
+            converge to a likelihood at least as good as the start's (cold
+            start needed)
+        """
+        start_nll = self._negative_log_likelihood(scipy_dist, start, data, spread)
+        fit_result = scipy_dist.fit(
+            data, *start[:-2], loc=start[-2], scale=start[-1], optimizer=simplex,
+            **self._fixed_kwargs(shift, spread)
+        )
+        if not simplex.converged:
+            return None
+        fit_nll = self._negative_log_likelihood(scipy_dist, fit_result, data, spread)
+        if not np.isfinite(fit_nll) or fit_nll > start_nll:
+            return None
+        return fit_result
+    
+    def _gradient_fit(
+        self,
+        scipy_dist: 'rv_continuous',
+        data: np.ndarray,
+        start: np.ndarray,
+        shift: float,
+        spread: float,
+        optimizer: str,
+        limits: Dict[str, Any]
+    ) -> Optional[np.ndarray]:
+        """
+        Fit (standardized) data with analytic derivatives from a starting point.
+        
+        ``limits`` are the ``maxiter``/``tol`` given to :meth:`fit`. Sets
+        ``fit_info``.
+        
+        Returns:
+            Fit result on ``data``, or None if the optimizer can't handle
+            the fixed parameters or ends outside the support (use scipy)
+        """
+        try:
+            theta, info = maximize_likelihood(
+                scipy_dist, data, start, self._fixed_standardized(shift, spread),
+                method=optimizer, **limits
+            )
+        except ValueError:
+            return None
+        if not np.isfinite(info['log_likelihood']):
+            return None
+        # Jacobian of the standardization: log-likelihood of the original data
+        info['log_likelihood'] -= len(data) * np.log(spread)
+        info['method'] = 'analytic-gradient'
+        self.fit_info = info
+        return theta
+    
+    def _multi_start_fit(
+        self,
+        scipy_dist: 'rv_continuous',
+        data: np.ndarray,
+        start: np.ndarray,
+        shift: float,
+        spread: float,
+        optimizer: str,
+        n_starts: int,
+        simplex: SimplexOptimizer,
+        limits: Dict[str, Any]
+    ) -> Optional[np.ndarray]:
+        """
+        Screen ``n_starts`` points in lockstep, refine the best ones, keep the best fit.
+        
+        Refinement uses the gradient ``optimizer``, or scipy's fit started
+        at each point for 'scipy'. Sets ``fit_info``, with the iterations
+        and evaluations of all refinements.
+        
+        Returns:
+            Fit result on ``data``, or None if no refinement succeeded
+        """
+        try:
+            points, screening = screen_starts(
+                scipy_dist, data, start, self._fixed_standardized(shift, spread), n_starts
+            )
+        except ValueError:
+            return None
+        
+        best, best_nll, best_info = None, np.inf, None
+        totals = {'iterations': 0, 'nfev': 0, 'data_passes': 0}
+        for point in points:
+            if optimizer == 'scipy':
+                theta = scipy_dist.fit(
+                    data, *point[:-2], loc=point[-2], scale=point[-1], optimizer=simplex,
+                    **self._fixed_kwargs(shift, spread)
+                )
+                info = simplex.info
+            else:
+                theta = self._gradient_fit(
+                    scipy_dist, data, point, shift, spread, optimizer, limits
+                )
+                info = self.fit_info
+                if theta is not None:
+                    for name in totals:
+                        totals[name] += info[name]
+            if theta is None:
+                continue
+            nll = self._negative_log_likelihood(scipy_dist, theta, data, spread)
+            if nll < best_nll:
+                best, best_nll, best_info = theta, nll, info
+        if best is None:
+            return None
+        self.fit_info = {**best_info, **screening}
+        if optimizer != 'scipy':
+            self.fit_info.update(totals)
+        return best
+    
+    @staticmethod
+    def _negative_log_likelihood(
+        scipy_dist: 'rv_continuous',
+        theta: Any,
+        data: np.ndarray,
+        spread: float
+    ) -> float:
+        """
+        Negative log-likelihood of the original data from standardized values.
+        
+        For z = (x - shift) / spread, log f_X(x) = log f_Z(z) - log(spread),
+        so the Jacobian adds n * log(spread).
+        """
+        nll = scipy_dist.nnlf(np.asarray(theta, dtype=float), data)
+        return float(nll + len(data) * np.log(spread))
+    
+    def set_params(self, params: Parameters) -> Parameters:
+        """
+        Use known parameters instead of fitting them.
+        
+        Useful for parameters estimated elsewhere (another process, a cache).
+        
+        Args:
+            params: Parameters as returned by :meth:`fit`
+            
+        Returns:
+            Dictionary of parameters
+        """
+        self.params = dict(params)
+        self.dist = self._get_scipy_dist()(**self.params)
+        self.fit_info = None
+        self._fitted = True
+        return self.params
+    
     def test_goodness_of_fit(
         self, 
-        method: str = 'ks'
+        method: str = 'ks',
+        sketch: Optional['QuantileSketch'] = None
     ) -> TestResult:
         """
         Perform goodness-of-fit test.
         
         Args:
             method: Test method ('ks' for Kolmogorov-Smirnov,
+                   'ks_sketch' for approximate KS over a quantile sketch,
                    'ad' for Anderson-Darling, 'chi2' for Chi-square)
+            sketch: Prebuilt QuantileSketch of the data for 'ks_sketch'
+                   (e.g. merged from shards). Built from the data if None
                    
         Returns:
             Tuple of (test_statistic, p_value)
@@ -158,6 +528,11 @@ class BaseDistribution(ABC):
         if method == 'ks':
             from scipy.stats import ks_1samp
             statistic, p_value = ks_1samp(self.data, self.dist.cdf)
+        elif method == 'ks_sketch':
+            from .sketch import QuantileSketch
+            if sketch is None:
+                sketch = QuantileSketch.from_data(self.data)
+            statistic, p_value = sketch.ks_test(self.dist.cdf)
         elif method == 'ad':
             from scipy.stats import anderson
             result = anderson(self.data)
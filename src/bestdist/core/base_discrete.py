@@ -1,13 +1,18 @@
 """Abstract base class for discrete probability distributions."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, Union, TYPE_CHECKING
+import time
 import numpy as np
-from scipy.stats import rv_discrete
 
+from .histogram import CountHistogram, ks_statistic_from_frequencies, ks_pvalue
+from ..utils.arrays import to_clean_array
 from ..utils.types import ArrayLike, TestResult, Parameters
 from ..utils.exceptions import FittingError, InsufficientDataError
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_discrete
+
 
 class BaseDiscreteDistribution(ABC):
     """
@@ -18,7 +23,8 @@ class BaseDiscreteDistribution(ABC):
     
     Attributes:
         name: Name of the distribution
-        data: Input data array (integers)
+        data: Input data array (integers), or None when built from a histogram
+        histogram: Count histogram the distribution is fitted from, if any
         params: Fitted distribution parameters
         dist: Fitted scipy distribution object
         
@@ -34,22 +40,54 @@ class BaseDiscreteDistribution(ABC):
         ```
     """
     
-    def __init__(self, data: ArrayLike, name: Optional[str] = None):
+    # Parameters that may be held at known values (see ``fixed``)
+    FIXABLE_PARAMS: Tuple[str, ...] = ()
+    
+    def __init__(
+        self,
+        data: Union[ArrayLike, CountHistogram],
+        name: Optional[str] = None,
+        fixed: Optional[Parameters] = None
+    ):
         """
         Initialize the distribution with data.
         
         Args:
-            data: Input data to fit the distribution to (should be integers)
+            data: Input data to fit the distribution to (should be integers),
+                  or a CountHistogram summarizing it. Fitting and testing
+                  from a histogram never materializes the raw observations.
             name: Optional name for the distribution (defaults to class name)
+            fixed: Parameters held at known values instead of being fitted,
+                   among ``FIXABLE_PARAMS`` (e.g. ``{'n': 10}`` for a
+                   Binomial with a known number of trials)
             
         Raises:
             InsufficientDataError: If data has fewer than 3 observations
-            ValueError: If data contains NaN or infinite values
+            ValueError: If data contains NaN or infinite values, or a fixed
+                        parameter cannot be fixed
         """
         self.name = name or self.__class__.__name__
-        self.data = self._validate_and_prepare_data(data)
+        self.fixed: Parameters = dict(fixed or {})
+        unknown = set(self.fixed) - set(self.FIXABLE_PARAMS)
+        if unknown:
+            raise ValueError(
+                f"{self.name} cannot fix parameter(s) {sorted(unknown)}; "
+                f"fixable parameters are {list(self.FIXABLE_PARAMS)}"
+            )
+        if isinstance(data, CountHistogram):
+            if data.n < 3:
+                raise InsufficientDataError(
+                    f"Need at least 3 observations, got {data.n}"
+                )
+            self.histogram: Optional[CountHistogram] = data
+            self.data: Optional[np.ndarray] = None
+        else:
+            self.histogram = None
+            self.data = self._validate_and_prepare_data(data)
         self.params: Optional[Parameters] = None
-        self.dist: Optional[rv_discrete] = None
+        self.dist: Optional['rv_discrete'] = None
+        # Estimator diagnostics of the last fit
+        self.fit_info: Optional[Dict[str, Any]] = None
         self._fitted = False
         
     def _validate_and_prepare_data(self, data: ArrayLike) -> np.ndarray:
@@ -66,17 +104,11 @@ class BaseDiscreteDistribution(ABC):
             InsufficientDataError: If data has fewer than 3 observations
             ValueError: If data contains NaN or infinite values
         """
-        # Convert to numpy array
-        if isinstance(data, (list, tuple)):
-            arr = np.array(data, dtype=int)
-        elif hasattr(data, 'values'):  # pandas Series
-            arr = data.values.astype(int)
-        else:
-            arr = np.asarray(data, dtype=int)
-            
-        # Remove NaN values (convert to int first removes floats)
-        original_arr = np.asarray(data, dtype=float)
-        arr = arr[~np.isnan(original_arr)]
+        # Convert to numpy array of integers, removing NaN values first
+        # (integer data keeps its width, e.g. compact unsigned types)
+        arr = to_clean_array(data)
+        if arr.dtype.kind not in 'iu':
+            arr = np.asarray(arr, dtype=int)
         
         # Check for insufficient data
         if len(arr) < 3:
@@ -90,8 +122,46 @@ class BaseDiscreteDistribution(ABC):
             
         return arr
     
+    @property
+    def n_observations(self) -> int:
+        """Number of observations the distribution is fitted to."""
+        if self.histogram is not None:
+            return self.histogram.n
+        return len(self.data)
+    
+    def _frequencies(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Distinct observed values and their counts."""
+        if self.histogram is not None:
+            return self.histogram.frequencies()
+        return np.unique(self.data, return_counts=True)
+    
+    def _sample_mean(self) -> float:
+        """Sample mean of the data."""
+        if self.histogram is not None:
+            return self.histogram.mean()
+        return float(np.mean(self.data))
+    
+    def _sample_var(self) -> float:
+        """Sample variance (ddof=0) of the data."""
+        if self.histogram is not None:
+            return self.histogram.var()
+        return float(np.var(self.data))
+    
+    def _sample_max(self) -> int:
+        """Largest observed value."""
+        if self.histogram is not None:
+            return self.histogram.max()
+        return int(np.max(self.data))
+    
+    @property
+    def n_free_params(self) -> int:
+        """Number of parameters estimated from the data (not fixed)."""
+        if self.params is None:
+            self.fit()
+        return len(self.params) - len(self.fixed)
+    
     @abstractmethod
-    def _get_scipy_dist(self) -> rv_discrete:
+    def _get_scipy_dist(self) -> 'rv_discrete':
         """
         Return the scipy.stats distribution object.
         
@@ -118,11 +188,14 @@ class BaseDiscreteDistribution(ABC):
         Fit the distribution to the data.
         
         Returns:
-            Dictionary of fitted parameters
+            Dictionary of fitted parameters. Diagnostics are kept in
+            ``fit_info`` in the format of continuous distributions; the
+            built-in moment estimators are closed form (no iterations)
             
         Raises:
             FittingError: If fitting fails
         """
+        started = time.perf_counter()
         try:
             scipy_dist = self._get_scipy_dist()
             
@@ -130,10 +203,30 @@ class BaseDiscreteDistribution(ABC):
             # or maximum likelihood estimation
             if hasattr(self, '_fit_custom'):
                 self.params = self._fit_custom()
+                self.fit_info = {
+                    'optimizer': 'moments',
+                    'method': 'closed-form',
+                    'converged': True,
+                    'iterations': 0,
+                    'nfev': 0,
+                }
             else:
                 # Default: use scipy's fit method
+                if self.data is None:
+                    raise FittingError(
+                        f"{self.name} needs raw data and cannot be fitted "
+                        f"from a histogram"
+                    )
                 fit_result = scipy_dist.fit(self.data)
                 self.params = self._extract_params(fit_result)
+                self.fit_info = {
+                    'optimizer': 'scipy',
+                    'method': None,
+                    'converged': None,
+                    'iterations': None,
+                    'nfev': None,
+                }
+            self.fit_info['fit_time'] = time.perf_counter() - started
             
             self.dist = scipy_dist(**self.params)
             self._fitted = True
@@ -144,6 +237,24 @@ class BaseDiscreteDistribution(ABC):
                 f"Failed to fit {self.name} distribution: {str(e)}"
             ) from e
     
+    def set_params(self, params: Parameters) -> Parameters:
+        """
+        Use known parameters instead of fitting them.
+        
+        Useful for parameters estimated elsewhere (another process, a cache).
+        
+        Args:
+            params: Parameters as returned by :meth:`fit`
+            
+        Returns:
+            Dictionary of parameters
+        """
+        self.params = dict(params)
+        self.dist = self._get_scipy_dist()(**self.params)
+        self.fit_info = None
+        self._fitted = True
+        return self.params
+    
     def test_goodness_of_fit(
         self, 
         method: str = 'chi2'
@@ -167,11 +278,11 @@ class BaseDiscreteDistribution(ABC):
             from scipy.stats import chisquare
             
             # Get observed frequencies
-            unique_vals, observed_counts = np.unique(self.data, return_counts=True)
+            unique_vals, observed_counts = self._frequencies()
             
             # Get expected frequencies
             expected_probs = self.pmf(unique_vals)
-            expected_counts = len(self.data) * expected_probs
+            expected_counts = self.n_observations * expected_probs
             
             # Remove categories with expected count < 5
             mask = expected_counts >= 5
@@ -187,8 +298,15 @@ class BaseDiscreteDistribution(ABC):
             statistic, p_value = chisquare(observed_counts, expected_counts)
             
         elif method == 'ks':
-            from scipy.stats import ks_1samp
-            statistic, p_value = ks_1samp(self.data, self.dist.cdf)
+            if self.histogram is not None:
+                values, counts = self.histogram.frequencies()
+                statistic = ks_statistic_from_frequencies(
+                    values, counts, self.dist.cdf(values)
+                )
+                p_value = ks_pvalue(statistic, self.histogram.n)
+            else:
+                from scipy.stats import ks_1samp
+                statistic, p_value = ks_1samp(self.data, self.dist.cdf)
         else:
             raise ValueError(f"Unknown test method: {method}")
             
@@ -269,7 +387,7 @@ class BaseDiscreteDistribution(ABC):
             'parameters': self.params,
             'chi2_statistic': chi2_stat,
             'p_value': p_value,
-            'n_observations': len(self.data),
+            'n_observations': self.n_observations,
         }
     
     def __repr__(self) -> str:
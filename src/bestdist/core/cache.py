@@ -0,0 +1,237 @@
+"""Cache of per-candidate fit results, in memory and optionally on disk."""
+
+from typing import Any, Dict, Optional, Union
+from collections import OrderedDict
+from pathlib import Path
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import numpy as np
+
+from ..core.histogram import CountHistogram
+
+# In-memory budget of a ResultCache (bytes of serialized entries)
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+# Hashed per update call, so arbitrarily large arrays need no extra memory
+_HASH_CHUNK_BYTES = 16 * 2**20
+
+
+def fingerprint(data: Union[np.ndarray, CountHistogram]) -> str:
+    """
+    Fast content hash of validated data.
+
+    BLAKE2b over the raw buffer (in bounded chunks), the dtype and the
+    length; a CountHistogram is hashed by its frequency table. Arrays
+    with the same values but different dtypes (e.g. compact float32) get
+    different fingerprints, since their fits can differ.
+
+    Args:
+        data: Flat array or CountHistogram
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(data, CountHistogram):
+        values, counts = data.frequencies()
+        digest.update(b'histogram')
+        digest.update(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+        digest.update(np.ascontiguousarray(counts, dtype=np.int64).tobytes())
+        return digest.hexdigest()
+
+    arr = np.ascontiguousarray(data)
+    digest.update(f"{arr.dtype.str}:{arr.size}".encode())
+    buffer = memoryview(arr).cast('B')
+    for start in range(0, len(buffer), _HASH_CHUNK_BYTES):
+        digest.update(buffer[start:start + _HASH_CHUNK_BYTES])
+    return digest.hexdigest()
+
+
+def make_key(data_key: str, dist_class: type, method: str, **options: Any) -> str:
+    """
+    Cache key of one candidate fit.
+
+    Combines the data fingerprint (or caller key), the distribution class
+    with the bestdist and scipy versions, the goodness-of-fit method and
+    any fit options that change the result.
+
+    Args:
+        data_key: Fingerprint of the data or caller-supplied key
+        dist_class: Distribution class
+        method: Goodness-of-fit method
+        **options: Further options affecting the fit (JSON-serializable)
+
+    Returns:
+        Key string
+    """
+    import scipy
+    from .. import __version__
+
+    parts = [
+        data_key,
+        f"{dist_class.__module__}.{dist_class.__qualname__}",
+        f"bestdist={__version__}",
+        f"scipy={scipy.__version__}",
+        method,
+    ]
+    if options:
+        parts.append(json.dumps(options, sort_keys=True, default=str))
+    return '|'.join(parts)
+
+
+class ResultCache:
+    """
+    Two-tier cache of fit results: in-process LRU plus optional SQLite.
+
+    Entries are small JSON-serializable dictionaries (fitted parameters
+    and goodness-of-fit results). The memory tier evicts least recently
+    used entries beyond ``max_bytes`` of serialized size; the disk tier,
+    if a directory is given, keeps every entry across restarts and
+    refills the memory tier on hits. The cache is safe to share between
+    threads and fitters.
+
+    Example:
+        ```python
+        from bestdist import DistributionFitter, ResultCache
+
+        cache = ResultCache(directory='~/.cache/bestdist')
+        DistributionFitter(data, cache=cache).fit()   # fits and stores
+        DistributionFitter(data, cache=cache).fit()   # served from the cache
+        ```
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        directory: Optional[Union[str, Path]] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Budget of the in-memory tier, in bytes of serialized
+                       entries
+            directory: Directory of the on-disk SQLite tier; memory only
+                       if None
+        """
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.path: Optional[Path] = None
+        if directory is not None:
+            directory = Path(directory).expanduser()
+            directory.mkdir(parents=True, exist_ok=True)
+            self.path = directory / 'results.sqlite'
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an entry, promoting disk hits to the memory tier.
+
+        Args:
+            key: Cache key (see :func:`make_key`)
+
+        Returns:
+            Stored entry, or None on a miss
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value = row[0]
+                    self._remember(key, value)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(value)
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an entry in both tiers.
+
+        Args:
+            key: Cache key (see :func:`make_key`)
+            entry: JSON-serializable dictionary
+        """
+        value = json.dumps(entry)
+        with self._lock:
+            self._remember(key, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (key, value, created) VALUES (?, ?, ?)",
+                    (key, value, time.time())
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, value: str) -> None:
+        """Insert into the memory tier and evict down to the byte budget."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= len(key) + len(old)
+        size = len(key) + len(value)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = value
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self.nbytes -= len(evicted_key) + len(evicted)
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the on-disk tier; the memory tier stays usable."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and memory-tier size."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'nbytes': self.nbytes,
+        }
+
+    def __contains__(self, key: str) -> bool:
+        """True if the key is in the memory tier."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Number of entries in the memory tier."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """String representation of the cache."""
+        location = f", directory='{self.path.parent}'" if self.path is not None else ''
+        return (
+            f"ResultCache(entries={len(self._entries)}, nbytes={self.nbytes}, "
+            f"max_bytes={self.max_bytes}{location})"
+        )
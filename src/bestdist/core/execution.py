@@ -0,0 +1,351 @@
+"""Execution of candidate fits: serial, process pool, or isolated subprocesses."""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.connection import wait
+import multiprocessing
+import os
+import time
+import warnings
+
+from ..core.memory import tracing_memory
+from ..core.scheduler import ScheduledTask
+from ..core.tracing import StageTracer, run_stage
+from ..utils.exceptions import FitTimeoutError, FittingError, WorkerCrashError
+
+# Longest wait between checks of running isolated fits (seconds)
+POLL_INTERVAL = 0.5
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """Number of workers for an ``n_jobs`` argument (-1 for all cores)."""
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f"n_jobs must be positive or -1, got {n_jobs}")
+    return int(n_jobs)
+
+
+def make_distribution(dist_class: type, data: Any, fixed: Optional[Dict[str, float]] = None) -> Any:
+    """Build a candidate on data, with fixed parameters when given."""
+    if not fixed:
+        return dist_class(data)
+    return dist_class(data, fixed=fixed)
+
+
+def fit_distribution(
+    dist: Any,
+    initial: Optional[Dict[str, float]] = None,
+    options: Optional[Dict[str, Any]] = None
+) -> Dict[str, float]:
+    """Fit a distribution, warm-started from ``initial`` and with fit ``options`` when given."""
+    kwargs = dict(options or {})
+    if initial is not None:
+        kwargs['initial'] = initial
+    return dist.fit(**kwargs)
+
+
+def fit_params(
+    dist_class: type,
+    data: Any,
+    suppress_warnings: bool,
+    initial: Optional[Dict[str, float]] = None,
+    fixed: Optional[Dict[str, float]] = None,
+    options: Optional[Dict[str, Any]] = None,
+    trace_memory: bool = False
+) -> Tuple[Dict[str, float], Optional[Dict[str, Any]], Dict[str, float], Dict[str, Any]]:
+    """
+    Fit one candidate (runs in worker processes).
+
+    Returns:
+        Tuple of (parameters, fit diagnostics ``fit_info``, seconds spent
+        in the 'validate' and 'fit' stages, and their memory use if
+        ``trace_memory`` is set, else an empty dictionary)
+    """
+    timings: Dict[str, float] = {}
+    memory: Optional[Dict[str, Any]] = {} if trace_memory else None
+    name = dist_class.__name__
+    with warnings.catch_warnings(), tracing_memory(trace_memory):
+        if suppress_warnings:
+            warnings.filterwarnings('ignore', category=RuntimeWarning)
+        dist = run_stage(
+            None, timings, 'validate', name, len(data),
+            make_distribution, dist_class, data, fixed, memory=memory
+        )
+        run_stage(
+            None, timings, 'fit', name, len(data),
+            fit_distribution, dist, initial, options, memory=memory
+        )
+    return dist.params, dist.fit_info, timings, memory or {}
+
+
+def _rebuild(
+    task: ScheduledTask,
+    data: Any,
+    fixed: Optional[Dict[str, float]],
+    payload: tuple,
+    tracer: Optional[StageTracer]
+) -> Tuple[Any, Dict[str, float], Dict[str, Any]]:
+    """
+    Distribution of a task fitted in another process, from its parameters and diagnostics.
+
+    Reports the worker's stages to ``tracer`` now that they are known.
+
+    Returns:
+        Tuple of (distribution, stage timings, stage memory use)
+    """
+    params, fit_info, timings, memory = payload
+    if tracer is not None:
+        name = task.family.__name__
+        for stage, seconds in timings.items():
+            tracer.stage_start(stage, name, task.n)
+            tracer.stage_end(stage, name, task.n, seconds)
+    dist = make_distribution(task.family, data, fixed)
+    dist.set_params(params)
+    dist.fit_info = fit_info
+    return dist, timings, memory
+
+
+def _isolated_worker(
+    connection: Any,
+    dist_class: type,
+    data: Any,
+    suppress_warnings: bool,
+    initial: Optional[Dict[str, float]],
+    fixed: Optional[Dict[str, float]],
+    options: Optional[Dict[str, Any]],
+    trace_memory: bool
+) -> None:
+    """Entry point of an isolated fit: send back parameters and diagnostics, or the error."""
+    try:
+        message: Tuple[str, Any] = ('ok', fit_params(
+            dist_class, data, suppress_warnings, initial, fixed, options, trace_memory
+        ))
+    except BaseException as e:
+        # Exceptions may not pickle; the message is enough to report them
+        message = ('error', f"{type(e).__name__}: {e}")
+    try:
+        connection.send(message)
+    finally:
+        connection.close()
+
+
+def _nothing_for(task: ScheduledTask) -> None:
+    """Default per-task lookup of :func:`run_fits`: no value for any task."""
+    return None
+
+
+def run_fits(
+    tasks: List[ScheduledTask],
+    data_for: Callable[[ScheduledTask], Any],
+    n_workers: int,
+    suppress_warnings: bool,
+    timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    isolate: bool = False,
+    initial_for: Optional[Callable[[ScheduledTask], Optional[Dict[str, float]]]] = None,
+    fixed_for: Optional[Callable[[ScheduledTask], Optional[Dict[str, float]]]] = None,
+    options_for: Optional[Callable[[ScheduledTask], Optional[Dict[str, Any]]]] = None,
+    tracer_for: Optional[Callable[[ScheduledTask], Optional[StageTracer]]] = None,
+    trace_memory: bool = False
+) -> Iterator[Tuple[ScheduledTask, Any, Dict[str, float], Dict[str, Any]]]:
+    """
+    Fit scheduled candidates and yield them as they finish.
+
+    Tasks are dispatched in the given order. Fits run in separate,
+    killable processes when ``isolate`` is set, when a per-candidate
+    ``timeout`` is given, or when a ``deadline`` applies to parallel fits.
+    Otherwise they run in-process (``n_workers == 1``, where the deadline is
+    checked between candidates) or in a process pool.
+
+    Args:
+        tasks: Tasks in dispatch order
+        data_for: Returns the data of a task
+        n_workers: Number of fits run at the same time
+        suppress_warnings: If True, silence RuntimeWarnings in the fits
+        timeout: Seconds allowed for each fit
+        deadline: ``time.monotonic()`` value after which no fit may run
+        isolate: If True, always run fits in separate processes
+        initial_for: Returns the warm-start parameters of a task
+        fixed_for: Returns the fixed parameters of a task
+        options_for: Returns the keyword options of a task's ``fit()``
+                     (optimizer, maxiter, tol, ...)
+        tracer_for: Returns the tracer receiving a task's 'validate' and
+                    'fit' stage events, see
+                    :class:`~bestdist.core.tracing.StageTracer`
+        trace_memory: If True, measure the peak memory and allocations of
+                      the 'validate' and 'fit' stages with tracemalloc
+                      (in-process fits need the caller to be tracing, see
+                      :func:`~bestdist.core.memory.tracing_memory`)
+
+    Yields:
+        Tuples of (task, fitted distribution or the exception raised,
+        seconds spent in the 'validate' and 'fit' stages that ran, and
+        their memory use by stage when ``trace_memory`` is set).
+        Fits stopped by the timeout or the deadline yield FitTimeoutError;
+        isolated processes that die without a result yield WorkerCrashError
+    """
+    if initial_for is None:
+        initial_for = _nothing_for
+    if fixed_for is None:
+        fixed_for = _nothing_for
+    if options_for is None:
+        options_for = _nothing_for
+    if tracer_for is None:
+        tracer_for = _nothing_for
+    
+    if isolate or timeout is not None or (deadline is not None and n_workers > 1):
+        yield from _run_isolated(
+            tasks, data_for, initial_for, fixed_for, options_for, n_workers,
+            suppress_warnings, timeout, deadline, tracer_for, trace_memory
+        )
+        return
+
+    if n_workers == 1:
+        for task in tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                yield task, FitTimeoutError("deadline reached before the fit started"), {}, {}
+                continue
+            timings: Dict[str, float] = {}
+            memory: Dict[str, Any] = {}
+            tracer = tracer_for(task)
+            name = task.family.__name__
+            try:
+                dist = run_stage(
+                    tracer, timings, 'validate', name, task.n,
+                    make_distribution, task.family, data_for(task), fixed_for(task),
+                    memory=memory if trace_memory else None
+                )
+                run_stage(
+                    tracer, timings, 'fit', name, task.n,
+                    fit_distribution, dist, initial_for(task), options_for(task),
+                    memory=memory if trace_memory else None
+                )
+            except Exception as e:
+                yield task, e, timings, memory
+                continue
+            yield task, dist, timings, memory
+        return
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = {
+            pool.submit(
+                fit_params, task.family, data_for(task), suppress_warnings,
+                initial_for(task), fixed_for(task), options_for(task), trace_memory
+            ): task
+            for task in tasks
+        }
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                # Workers only return parameters; rebuild the distribution here
+                dist, timings, memory = _rebuild(
+                    task, data_for(task), fixed_for(task), future.result(), tracer_for(task)
+                )
+            except Exception as e:
+                yield task, e, {}, {}
+                continue
+            yield task, dist, timings, memory
+
+
+def _run_isolated(
+    tasks: List[ScheduledTask],
+    data_for: Callable[[ScheduledTask], Any],
+    initial_for: Callable[[ScheduledTask], Optional[Dict[str, float]]],
+    fixed_for: Callable[[ScheduledTask], Optional[Dict[str, float]]],
+    options_for: Callable[[ScheduledTask], Optional[Dict[str, Any]]],
+    n_workers: int,
+    suppress_warnings: bool,
+    timeout: Optional[float],
+    deadline: Optional[float],
+    tracer_for: Callable[[ScheduledTask], Optional[StageTracer]],
+    trace_memory: bool
+) -> Iterator[Tuple[ScheduledTask, Any, Dict[str, float], Dict[str, Any]]]:
+    """Run each fit in its own process, killing it on timeout or deadline."""
+    context = multiprocessing.get_context()
+    pending = deque(tasks)
+    # receiving end of the pipe -> (task, process, start time)
+    running: Dict[Any, Tuple[ScheduledTask, Any, float]] = {}
+
+    def stop(connection: Any) -> Tuple[ScheduledTask, float]:
+        task, process, started = running.pop(connection)
+        if process.is_alive():
+            process.kill()
+        process.join()
+        connection.close()
+        return task, time.monotonic() - started
+
+    try:
+        while pending or running:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                for connection in list(running):
+                    task, elapsed = stop(connection)
+                    yield task, FitTimeoutError(
+                        f"deadline reached after {elapsed:.3g}s of fitting"
+                    ), {}, {}
+                while pending:
+                    yield pending.popleft(), FitTimeoutError(
+                        "deadline reached before the fit started"
+                    ), {}, {}
+                return
+
+            while pending and len(running) < n_workers:
+                task = pending.popleft()
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(
+                    target=_isolated_worker,
+                    args=(
+                        sender, task.family, data_for(task), suppress_warnings,
+                        initial_for(task), fixed_for(task), options_for(task), trace_memory
+                    ),
+                    daemon=True
+                )
+                process.start()
+                sender.close()
+                running[receiver] = (task, process, time.monotonic())
+
+            # Sleep until a fit reports back, times out, or the deadline hits
+            limits = [POLL_INTERVAL]
+            if timeout is not None:
+                limits += [started + timeout - now for _, _, started in running.values()]
+            if deadline is not None:
+                limits.append(deadline - now)
+            ready = wait(list(running), timeout=max(min(limits), 0.0))
+
+            for connection in ready:
+                try:
+                    status, payload = connection.recv()
+                except (EOFError, OSError):
+                    # The process died before sending: let it finish exiting
+                    process = running[connection][1]
+                    process.join(POLL_INTERVAL)
+                    task, _ = stop(connection)
+                    yield task, WorkerCrashError(
+                        f"worker process died without a result (exit code {process.exitcode})"
+                    ), {}, {}
+                    continue
+                task, _ = stop(connection)
+                if status == 'error':
+                    yield task, FittingError(payload), {}, {}
+                    continue
+                try:
+                    dist, timings, memory = _rebuild(
+                        task, data_for(task), fixed_for(task), payload, tracer_for(task)
+                    )
+                except Exception as e:
+                    yield task, e, {}, {}
+                    continue
+                yield task, dist, timings, memory
+
+            if timeout is not None:
+                now = time.monotonic()
+                for connection, (_, _, started) in list(running.items()):
+                    if now - started >= timeout:
+                        task, _ = stop(connection)
+                        yield task, FitTimeoutError(f"timed out after {timeout:g}s"), {}, {}
+    finally:
+        # The consumer stopped early or an error occurred: leave no orphans
+        for connection in list(running):
+            stop(connection)
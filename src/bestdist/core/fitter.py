@@ -1,12 +1,29 @@
 """Main distribution fitter for finding the best distribution."""
 
-from typing import List, Optional, Dict, Any, Type, Union, Literal
+from typing import (
+    TYPE_CHECKING, List, Optional, Dict, Any, Callable, Hashable, Iterable, Type, Union, Literal
+)
+import time
 import warnings
 import numpy as np
-import pandas as pd
 
 from ..core.base import BaseDistribution
 from ..core.base_discrete import BaseDiscreteDistribution
+from ..core.cache import ResultCache, fingerprint, make_key
+from ..core.execution import fit_distribution, make_distribution, resolve_n_jobs, run_fits
+from ..core.histogram import CountHistogram
+from ..core.likelihood import OPTIMIZERS
+from ..core.memory import tracing_memory
+from ..core.metrics import (
+    MetricsRegistry, default_registry, record_cache_lookup, record_failure, record_fit
+)
+from ..core.model import FittedModel, ResultTable
+from ..core.sampling import DEFAULT_TAIL_SIZE, ReservoirSample, StratifiedSample
+from ..core.scheduler import CostModel, Schedule, ScheduledTask, lpt_schedule
+from ..core.screening import DataProfile, screen_candidates
+from ..core.sketch import QuantileSketch
+from ..core.tracing import PLOT_STAGE, STAGES, CallbackTracer, StageTracer, run_stage
+from ..core.warm_start import ParameterStore
 from ..distributions.continuous.normal import Normal
 from ..distributions.continuous.gamma import Gamma
 from ..distributions.continuous.beta import Beta
@@ -20,8 +37,20 @@ from ..distributions.discrete.poisson import Poisson
 from ..distributions.discrete.binomial import Binomial
 from ..distributions.discrete.negative_binomial import NegativeBinomial
 from ..distributions.discrete.geometric import Geometric
-from ..utils.types import ArrayLike, FitResult
-from ..utils.exceptions import FittingError, InvalidDistributionError
+from ..utils.types import ArrayLike, FitResult, Parameters
+from ..utils.arrays import robust_standardization, to_clean_array
+from ..utils.exceptions import FitTimeoutError, FittingError, InvalidDistributionError
+from ..utils.io import (
+    DEFAULT_CHUNK_SIZE,
+    PathLike,
+    iter_array_chunks,
+    iter_csv_chunks,
+    iter_parquet_chunks,
+    open_npy,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class DistributionFitter:
@@ -65,26 +94,105 @@ class DistributionFitter:
         Poisson, Binomial, NegativeBinomial, Geometric
     ]
     
+    # Points kept for parameter fitting when reading data that may not fit in memory
+    DEFAULT_SAMPLE_SIZE = 1_000_000
+    
+    # Points per density evaluation in compact mode
+    LOG_LIKELIHOOD_CHUNK_SIZE = 1 << 20
+    
+    # Successive-halving racing: first rung size, growth/halving factor
+    # and number of candidates that always get a full-data fit
+    RACE_MIN_SAMPLE = 2_000
+    RACE_ETA = 2
+    RACE_FINALISTS = 3
+    
     def __init__(
         self,
         data: ArrayLike,
         distributions: Optional[List[Union[Type[BaseDistribution], Type[BaseDiscreteDistribution]]]] = None,
         dist_type: Literal['continuous', 'discrete'] = 'continuous',
-        method: Optional[str] = None
+        method: Optional[str] = None,
+        sketch: Optional[QuantileSketch] = None,
+        compact: bool = False,
+        max_memory: Optional[int] = None,
+        tail_size: int = DEFAULT_TAIL_SIZE,
+        random_state: Optional[int] = None,
+        cache: Optional[ResultCache] = None,
+        cache_key: Optional[str] = None,
+        fixed: Optional[Dict[str, Parameters]] = None,
+        tracer: Optional[StageTracer] = None,
+        on_stage_start: Optional[Callable[[str, str, int], None]] = None,
+        on_stage_end: Optional[Callable[[str, str, int, float], None]] = None,
+        metrics: Optional[MetricsRegistry] = None
     ):
         """
         Initialize the fitter.
         
         Args:
-            data: Input data to fit distributions to
+            data: Input data to fit distributions to. For discrete
+                  distributions this may also be a CountHistogram, in which
+                  case every candidate is fitted and tested from the counts
             distributions: List of distribution classes to try.
                           If None, uses defaults based on dist_type
             dist_type: Type of distributions ('continuous' or 'discrete')
             method: Goodness-of-fit test method. 
-                   If None, uses 'ks' for continuous, 'chi2' for discrete
+                   If None, uses 'ks' for continuous, 'chi2' for discrete.
+                   'ks_sketch' runs an approximate KS test over a mergeable
+                   quantile sketch instead of the full sorted sample
+            sketch: Prebuilt QuantileSketch of the data for 'ks_sketch'
+                   (e.g. merged from shards sketched in parallel). Built
+                   from the data on first use if None
+            compact: If True, store continuous data as float32 and discrete
+                    data as the smallest unsigned integer type that holds
+                    its maximum. Log-likelihoods are then evaluated in
+                    bounded chunks and accumulated in float64
+            max_memory: Byte budget for the data candidates are fitted on.
+                       Larger continuous data is reduced to a uniform
+                       reservoir plus the ``tail_size`` smallest and largest
+                       values; AIC/BIC are estimated for the full data by
+                       strata. Larger non-negative discrete data is
+                       summarized exactly by a CountHistogram
+            tail_size: Number of extremes kept on each side under max_memory
+            random_state: Random seed for subsampling (max_memory, racing)
+            cache: ResultCache consulted before each candidate fit. Hits
+                  reuse the stored parameters and goodness-of-fit result
+                  instead of fitting; AIC/BIC are always recomputed
+            cache_key: Caller-supplied identifier of the data, used in
+                      cache keys instead of hashing the data. It must
+                      change whenever the data does
+            fixed: Known parameter values per distribution name, held
+                  fixed instead of fitted, e.g.
+                  ``{'Gamma': {'loc': 0}, 'Beta': {'loc': 0, 'scale': 1},
+                  'Binomial': {'n': 10}}``. AIC/BIC count free parameters only
+            tracer: Receives an event at the start and end of each stage of
+                   each candidate ('validate', 'fit', 'gof', 'aic_bic') and
+                   of plotting, with the family, number of observations and
+                   duration, see :class:`~bestdist.core.tracing.StageTracer`.
+                   Stage timings are recorded in the results either way
+            on_stage_start: Function called with (stage, family, n) when a
+                           stage starts; shorthand for a tracer
+            on_stage_end: Function called with (stage, family, n, seconds)
+                         when a stage ends
+            metrics: Registry counting fits, failures and cache lookups and
+                    recording fit latencies, see
+                    :class:`~bestdist.core.metrics.MetricsRegistry`.
+                    Defaults to the process-wide registry
+        
+        Raises:
+            ValueError: If fixed parameters name an unknown candidate, both
+                        a tracer and stage callbacks are given, or 'ks_sketch'
+                        is requested for discrete data
         """
         self.dist_type = dist_type
+        self.compact = compact
+        self.random_state = random_state
+        # Size of the full dataset when ``data`` is only a sample of it,
+        # and the exact extremes kept next to that sample
+        self.n_total: Optional[int] = None
+        self.tail: Optional[np.ndarray] = None
         self.data = self._prepare_data(data)
+        if max_memory is not None:
+            self._apply_memory_budget(max_memory, tail_size, random_state)
         
         # Set default distributions based on type
         if distributions is None:
@@ -100,45 +208,530 @@ class DistributionFitter:
             self.method = 'ks' if dist_type == 'continuous' else 'chi2'
         else:
             self.method = method
+        if self.method == 'ks_sketch' and dist_type == 'discrete':
+            raise ValueError(
+                "The 'ks_sketch' method is for continuous data; use 'chi2' or 'ks' "
+                "for discrete distributions"
+            )
             
+        self.sketch = sketch
+        self.cache = cache
+        self.cache_key = cache_key
+        self.fixed: Dict[str, Parameters] = dict(fixed or {})
+        unknown = set(self.fixed) - {dist_class.__name__ for dist_class in self.distributions}
+        if unknown:
+            raise ValueError(f"Fixed parameters given for unknown candidates: {sorted(unknown)}")
+        if tracer is not None and (on_stage_start or on_stage_end):
+            raise ValueError("Pass either a tracer or stage callbacks, not both")
+        if on_stage_start is not None or on_stage_end is not None:
+            tracer = CallbackTracer(on_stage_start, on_stage_end)
+        self.tracer = tracer
+        self.metrics = metrics if metrics is not None else default_registry()
+        self._fingerprint: Optional[str] = None
+        self._profile: Optional[DataProfile] = None
+        self._scale: Optional[float] = None
+        # Optimizer options of the current fit() call, see _fit_options
+        self._options: Dict[str, Any] = {}
+        # Whether the current fit() call measures memory per stage
+        self._trace_memory = False
+        # Whether results of the current fit() call keep distribution objects
+        self._retain_data = False
         self.results: List[FitResult] = []
+        self._failed: List[FitResult] = []
         self._fitted = False
+    
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: Iterable[ArrayLike],
+        dist_type: Literal['continuous', 'discrete'] = 'continuous',
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        random_state: Optional[int] = None,
+        max_memory: Optional[int] = None,
+        tail_size: int = DEFAULT_TAIL_SIZE,
+        **kwargs
+    ) -> 'DistributionFitter':
+        """
+        Build a fitter from a stream of chunks in a single pass.
+        
+        Discrete data is summarized exactly by a CountHistogram. Continuous
+        data feeds a QuantileSketch (for the 'ks_sketch' test over all data)
+        and a uniform reservoir of ``sample_size`` points that candidates are
+        fitted on; AIC/BIC are scaled up to the full data size. With
+        ``max_memory``, the reservoir is sized to the byte budget instead and
+        the ``tail_size`` extremes on each side are kept exactly, so
+        unbounded feeds are fitted in fixed memory.
+        
+        Args:
+            chunks: Iterable yielding arrays of observations
+            dist_type: Type of distributions ('continuous' or 'discrete')
+            sample_size: Maximum number of points kept for parameter fitting
+            random_state: Random seed for the reservoir and the sketch
+            max_memory: Byte budget for the retained sample and tails
+                       (overrides ``sample_size``)
+            tail_size: Number of extremes kept on each side under max_memory
+            **kwargs: Passed to the constructor (distributions, method, ...)
+            
+        Returns:
+            Fitter ready to ``fit()``
+        """
+        if dist_type == 'discrete':
+            histogram = CountHistogram()
+            for chunk in chunks:
+                histogram.update(chunk)
+            if histogram.n == 0:
+                raise ValueError("Data is empty after removing NaN values")
+            return cls(histogram, dist_type='discrete', **kwargs)
+        
+        dtype = np.float32 if kwargs.get('compact') else np.float64
+        sketch = QuantileSketch(seed=random_state)
+        if max_memory is not None:
+            sampler = StratifiedSample.from_budget(
+                max_memory, dtype, tail_size=tail_size, random_state=random_state
+            )
+        else:
+            sampler = ReservoirSample(sample_size, random_state=random_state)
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=float).ravel()
+            chunk = chunk[~np.isnan(chunk)]
+            sketch.update(chunk)
+            sampler.update(chunk.astype(dtype, copy=False))
+        tail = sampler.tail if isinstance(sampler, StratifiedSample) else None
+        return cls._from_sample(sampler.sample, sketch, tail=tail, **kwargs)
+    
+    @classmethod
+    def _from_sample(
+        cls,
+        sample: np.ndarray,
+        sketch: QuantileSketch,
+        tail: Optional[np.ndarray] = None,
+        **kwargs
+    ) -> 'DistributionFitter':
+        """Build a continuous fitter from a sample and a sketch of all data."""
+        if sketch.n == len(sample):
+            # Everything fitted in the sample: the data is used exactly
+            return cls(sample, dist_type='continuous', **kwargs)
+        kwargs.setdefault('method', 'ks_sketch')
+        fitter = cls(sample, dist_type='continuous', sketch=sketch, **kwargs)
+        fitter.n_total = sketch.n
+        if tail is not None and len(tail):
+            fitter.tail = np.asarray(tail, dtype=fitter.data.dtype)
+        return fitter
+    
+    @classmethod
+    def from_npy(
+        cls,
+        path: PathLike,
+        dist_type: Literal['continuous', 'discrete'] = 'continuous',
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        random_state: Optional[int] = None,
+        max_memory: Optional[int] = None,
+        tail_size: int = DEFAULT_TAIL_SIZE,
+        **kwargs
+    ) -> 'DistributionFitter':
+        """
+        Build a fitter from a ``.npy`` file without loading it into memory.
+        
+        The file is memory-mapped and scanned in chunks of ``chunk_size``
+        values. Files with at most ``sample_size`` values are fitted exactly;
+        for larger files the continuous subsample is read by random access
+        from the memory map, and discrete data is summarized by a histogram.
+        With ``max_memory``, continuous files are streamed as in
+        :meth:`from_chunks` to keep the extremes.
+        
+        Args:
+            path: Path to the ``.npy`` file
+            dist_type: Type of distributions ('continuous' or 'discrete')
+            chunk_size: Number of values read per chunk
+            sample_size: Maximum number of points kept for parameter fitting
+            random_state: Random seed for subsampling and the sketch
+            max_memory: Byte budget for the retained sample and tails
+                       (overrides ``sample_size``)
+            tail_size: Number of extremes kept on each side under max_memory
+            **kwargs: Passed to the constructor (distributions, method, ...)
+            
+        Returns:
+            Fitter ready to ``fit()``
+        """
+        array = open_npy(path)
+        if dist_type == 'discrete' or max_memory is not None:
+            return cls.from_chunks(
+                iter_array_chunks(array, chunk_size),
+                dist_type=dist_type,
+                random_state=random_state,
+                max_memory=max_memory,
+                tail_size=tail_size,
+                **kwargs
+            )
+        if len(array) <= sample_size:
+            return cls(np.array(array), dist_type='continuous', **kwargs)
+        
+        sketch = QuantileSketch(seed=random_state)
+        for chunk in iter_array_chunks(array, chunk_size):
+            sketch.update(chunk)
+        rng = np.random.default_rng(random_state)
+        indices = np.sort(rng.choice(len(array), size=sample_size, replace=False))
+        sample = np.asarray(array[indices], dtype=float)
+        return cls._from_sample(sample[~np.isnan(sample)], sketch, **kwargs)
+    
+    @classmethod
+    def from_csv(
+        cls,
+        path: PathLike,
+        column: Union[str, int],
+        dist_type: Literal['continuous', 'discrete'] = 'continuous',
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        random_state: Optional[int] = None,
+        **kwargs
+    ) -> 'DistributionFitter':
+        """
+        Build a fitter from one column of a CSV file, read in chunks.
+        
+        Args:
+            path: Path to the CSV file
+            column: Column name (or position)
+            dist_type: Type of distributions ('continuous' or 'discrete')
+            chunk_size: Number of rows read per chunk
+            sample_size: Maximum number of points kept for parameter fitting
+            random_state: Random seed for the reservoir and the sketch
+            **kwargs: Passed to the constructor (distributions, method, ...)
+            
+        Returns:
+            Fitter ready to ``fit()``
+        """
+        return cls.from_chunks(
+            iter_csv_chunks(path, column, chunk_size),
+            dist_type=dist_type,
+            sample_size=sample_size,
+            random_state=random_state,
+            **kwargs
+        )
+    
+    @classmethod
+    def from_parquet(
+        cls,
+        path: PathLike,
+        column: str,
+        dist_type: Literal['continuous', 'discrete'] = 'continuous',
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        random_state: Optional[int] = None,
+        **kwargs
+    ) -> 'DistributionFitter':
+        """
+        Build a fitter from one column of a Parquet file, read in batches.
+        
+        Requires ``pyarrow``.
+        
+        Args:
+            path: Path to the Parquet file
+            column: Column name
+            dist_type: Type of distributions ('continuous' or 'discrete')
+            chunk_size: Maximum number of rows per record batch
+            sample_size: Maximum number of points kept for parameter fitting
+            random_state: Random seed for the reservoir and the sketch
+            **kwargs: Passed to the constructor (distributions, method, ...)
+            
+        Returns:
+            Fitter ready to ``fit()``
+        """
+        return cls.from_chunks(
+            iter_parquet_chunks(path, column, chunk_size),
+            dist_type=dist_type,
+            sample_size=sample_size,
+            random_state=random_state,
+            **kwargs
+        )
         
     def _prepare_data(self, data: ArrayLike) -> np.ndarray:
         """Prepare and validate input data."""
-        if isinstance(data, pd.Series):
-            data = data.dropna().values
-        elif isinstance(data, (list, tuple)):
-            data = np.array(data)
-            
-        # Remove NaN values
-        data_float = np.asarray(data, dtype=float)
-        data = data[~np.isnan(data_float)]
+        if isinstance(data, CountHistogram):
+            if self.dist_type != 'discrete':
+                raise ValueError(
+                    "A CountHistogram can only be fitted with dist_type='discrete'"
+                )
+            return data
+        
+        # Missing values are dropped; clean numeric buffers (numpy arrays,
+        # memory maps, nullable pandas and Arrow columns) are not copied
+        data = to_clean_array(data)
         
         if len(data) == 0:
             raise ValueError("Data is empty after removing NaN values")
         
         # For discrete distributions, convert to integers
         if self.dist_type == 'discrete':
-            data = np.asarray(data, dtype=int)
+            dtype = int
+            if self.compact and data.min() >= 0:
+                dtype = np.min_scalar_type(int(data.max()))
+            data = np.asarray(data, dtype=dtype)
         else:
-            data = np.asarray(data, dtype=float)
+            data = np.asarray(data, dtype=np.float32 if self.compact else float)
             
         return data
     
-    def fit(self, verbose: bool = True, suppress_warnings: bool = True) -> List[FitResult]:
+    def _apply_memory_budget(
+        self,
+        max_memory: int,
+        tail_size: int,
+        random_state: Optional[int]
+    ) -> None:
+        """Reduce in-memory data larger than ``max_memory`` bytes."""
+        if isinstance(self.data, CountHistogram) or self.data.nbytes <= max_memory:
+            return
+        
+        if self.dist_type == 'discrete':
+            # Counts are summarized exactly; negative values can't be binned
+            if self.data.min() >= 0:
+                self.data = CountHistogram.from_data(self.data)
+            return
+        
+        sampler = StratifiedSample.from_budget(
+            max_memory, self.data.dtype, tail_size=tail_size, random_state=random_state
+        )
+        for chunk in iter_array_chunks(self.data):
+            sampler.update(chunk)
+        self.n_total = sampler.n_seen
+        self.data = sampler.sample
+        if len(sampler.tail):
+            self.tail = sampler.tail
+    
+    @property
+    def n_observations(self) -> int:
+        """Number of observations in the full dataset."""
+        if self.n_total is not None:
+            return self.n_total
+        return len(self.data)
+    
+    @property
+    def profile(self) -> DataProfile:
+        """Moments and bounds of the data, computed on first use."""
+        if self._profile is None:
+            if isinstance(self.data, CountHistogram):
+                self._profile = DataProfile.from_histogram(self.data)
+            else:
+                self._profile = DataProfile.from_data(self.data)
+        return self._profile
+    
+    @property
+    def fingerprint(self) -> str:
+        """Identifier of the data in cache keys: ``cache_key`` or a content hash."""
+        if self.cache_key is not None:
+            return self.cache_key
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint(self.data)
+        return self._fingerprint
+    
+    @property
+    def sample_fraction(self) -> float:
+        """Fraction of the full dataset that candidates are fitted on."""
+        if self.n_total is None:
+            return 1.0
+        return len(self.data) / self.n_total
+    
+    def _body_weight(self) -> tuple:
+        """
+        Split the sample into strata around the retained tails.
+        
+        The body lies strictly between the largest retained lower extreme
+        and the smallest retained upper one: reservoir points inside
+        either tail stratum are already counted exactly by the tail.
+        
+        Returns:
+            Tuple of (mask of sample points between the tails, weight of
+            each such point in the full dataset)
+        """
+        # self.tail is the sorted lower extremes followed by the upper ones
+        half = len(self.tail) // 2
+        body = (self.data > self.tail[half - 1]) & (self.data < self.tail[half])
+        n_body = max(int(body.sum()), 1)
+        return body, (self.n_total - len(self.tail)) / n_body
+    
+    @property
+    def effective_sample_size(self) -> float:
+        """
+        Kish effective sample size of the data used for ranking.
+        
+        Equals the number of observations when the data is used in full;
+        with a subsample it reflects the sample and tail weights.
+        """
+        if self.n_total is None:
+            return float(self.n_observations)
+        if self.tail is None:
+            return float(len(self.data))
+        body, weight = self._body_weight()
+        n_tail, n_body = len(self.tail), int(body.sum())
+        total = n_tail + n_body * weight
+        return float(total ** 2 / (n_tail + n_body * weight ** 2))
+    
+    def _frequencies(self) -> tuple:
+        """Distinct values and counts of (discrete) data."""
+        if isinstance(self.data, CountHistogram):
+            return self.data.frequencies()
+        return np.unique(self.data, return_counts=True)
+    
+    def _data_range(self) -> tuple:
+        """Smallest and largest observed values."""
+        return self.data.min(), self.data.max()
+    
+    def _empirical_quantiles(self, q: np.ndarray) -> np.ndarray:
+        """Empirical quantiles of the data at probabilities ``q``."""
+        if isinstance(self.data, CountHistogram):
+            return self.data.quantile(q).astype(float)
+        return np.percentile(self.data, q * 100)
+    
+    def fit(
+        self,
+        verbose: bool = True,
+        suppress_warnings: bool = True,
+        racing: bool = False,
+        race_metric: Literal['loglik', 'ks'] = 'loglik',
+        screening: Literal['off', 'conservative', 'aggressive'] = 'off',
+        n_jobs: int = 1,
+        cost_model: Optional[CostModel] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        isolate: bool = False,
+        warm_start: Optional[Union[str, Dict[str, Parameters]]] = None,
+        parameter_store: Optional[ParameterStore] = None,
+        optimizer: Optional[str] = None,
+        maxiter: Optional[int] = None,
+        tol: Optional[float] = None,
+        n_starts: int = 1,
+        trace_memory: bool = False,
+        retain_data: bool = False
+    ) -> List[FitResult]:
         """
         Fit all distributions to the data.
         
+        With ``racing=True``, candidates first race on random subsamples
+        (successive halving): every candidate is fitted on
+        ``RACE_MIN_SAMPLE`` points, the worse half by ``race_metric`` is
+        dropped, and the survivors move on to a sample ``RACE_ETA`` times
+        larger, until ``RACE_FINALISTS`` remain or the sample would cover the
+        data. Only the survivors are fitted on the full data. Pruned
+        candidates are kept at the end of the results with
+        ``status='pruned'``, the ``rung`` they were dropped at, the
+        ``sample_size`` of that rung and their ``race_score``.
+        
+        With ``screening`` enabled, candidates whose moment region (on a
+        Cullen-Frey map of skewness and kurtosis, or by dispersion index for
+        discrete data) is far from the data's, or whose support excludes
+        observed values, are skipped before any fitting. They are kept at
+        the end of the results with ``status='skipped'`` and a ``reason``.
+        
+        With ``n_jobs > 1``, candidates are fitted in worker processes,
+        dispatched longest predicted runtime first (see :meth:`plan`).
+        
+        ``timeout`` limits each full-data fit and ``deadline`` the whole
+        call. Fits then run in separate processes that are killed when
+        their time is up (as they are with ``isolate=True``, which also
+        survives crashes such as running out of memory); only a serial fit
+        with just a deadline runs in-process, checking it between
+        candidates. Once the deadline passes, ``fit()`` returns the ranking
+        of the candidates that finished (anytime results). Candidates
+        that timed out, crashed or raised are kept at the end of the
+        results with ``status='failed'`` and a ``reason``; ``timed_out``
+        tells timeouts apart.
+        
+        If the fitter has a ``cache``, candidates found in it are not
+        fitted (nor raced) at all; their results carry ``cached=True``.
+        New full-data fits are stored in the cache.
+        
+        ``warm_start`` starts the optimizers of Gamma, Beta, Weibull,
+        Student-t and Cauchy from earlier parameters instead of scipy's
+        default guesses, which saves most of the likelihood evaluations
+        when refitting data that changed little (Lognormal's scipy fit
+        needs none). A fit that
+        doesn't converge from them is redone cold. Given a key, the priors
+        come from ``parameter_store`` and the new fits are saved back to it.
+        
+        ``optimizer``, ``maxiter``, ``tol`` and ``n_starts`` configure the
+        fits of continuous candidates (see :meth:`BaseDistribution.fit`).
+        Every fitted result records the 'optimizer' used, whether it
+        'converged', its 'iterations', function evaluations 'nfev' and wall
+        time 'fit_time' in seconds, also shown by :meth:`summary`.
+        
+        With ``trace_memory=True``, every stage of every candidate is run
+        under ``tracemalloc`` and the results get a 'memory' entry: for
+        each stage that ran, its 'peak_bytes' above the memory in use when
+        it started, the 'retained_bytes' still held when it ended, and the
+        net 'allocated_blocks' of Python's allocator. numpy array buffers
+        are traced too. Fits in worker processes are measured in the
+        worker. Tracing makes the fits several times slower, so use it to
+        size chunks, memory budgets and worker counts rather than in
+        production runs.
+        
+        Each result's 'distribution_object' is a :class:`FittedModel`: the
+        family, parameters and fit statistics, evaluated through a cached
+        scipy frozen distribution, without a reference to the data. With
+        ``retain_data=True`` it is the fitted distribution object itself,
+        which holds its own copy of the data (as candidates fitted on a
+        subsample hold the subsample).
+        
         Args:
             verbose: If True, print progress and fitting errors
             suppress_warnings: If True, suppress scipy/numpy warnings during fitting
                               (recommended, as some distributions may not be suitable)
+            racing: If True, prune candidates on growing subsamples first.
+                   Ignored for CountHistogram data, whose fits are already
+                   independent of the number of observations
+            race_metric: Racing score, 'loglik' (mean log-likelihood per
+                        point, higher is better) or 'ks' (KS statistic,
+                        lower is better)
+            screening: Moment-based pre-screening, 'off', 'conservative'
+                      (skip only families far from the data) or 'aggressive'
+            n_jobs: Number of worker processes (-1 for all cores)
+            cost_model: Runtime model used to order parallel fits.
+                       Defaults to :meth:`CostModel.load`
+            timeout: Seconds allowed for each candidate's fit
+            deadline: Seconds allowed for the whole call, from when it starts
+            isolate: If True, run every fit in a separate, killable process
+            warm_start: Earlier parameters, as a mapping of distribution
+                       name to parameters (e.g. from a previous result
+                       list) or the key of a dataset in ``parameter_store``
+            parameter_store: Store used with a ``warm_start`` key.
+                            Defaults to the local store, see
+                            :func:`~bestdist.core.warm_start.default_parameter_store_path`
+            optimizer: Optimizer backend, 'scipy', 'newton' or 'lbfgsb'.
+                      Defaults to each family's ``DEFAULT_OPTIMIZER``
+            maxiter: Iteration limit of the optimizer
+            tol: Convergence tolerance of the optimizer
+            n_starts: Number of starting points for multimodal likelihoods
+            trace_memory: If True, record the peak memory and allocations
+                         of each stage of each candidate
+            retain_data: If True, results keep the fitted distribution
+                        objects, with the data they were fitted to,
+                        instead of FittedModel
             
         Returns:
-            List of fit results, sorted by p-value (descending)
+            List of fit results, sorted by p-value (descending), followed
+            by the candidates that were not fitted on the full data
+            
+        Raises:
+            ValueError: If race_metric, screening, n_jobs, optimizer or
+                        n_starts is invalid
         """
+        if race_metric not in ('loglik', 'ks'):
+            raise ValueError(f"Unknown race_metric: {race_metric}")
+        self._options = self._fit_options(optimizer, maxiter, tol, n_starts)
+        self._trace_memory = trace_memory
+        self._retain_data = retain_data
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        n_workers = resolve_n_jobs(n_jobs)
         self.results = []
+        self._failed: List[FitResult] = []
+        pruned: List[FitResult] = []
+        candidates, skipped = self._screen(screening)
+        hits, candidates = self._lookup_cache(candidates)
+        if isinstance(warm_start, str):
+            if parameter_store is None:
+                parameter_store = ParameterStore()
+            priors = parameter_store.get(warm_start)
+        else:
+            priors = dict(warm_start or {})
         
         # Context manager for suppressing warnings
         warning_context = warnings.catch_warnings() if suppress_warnings else None
@@ -146,66 +739,564 @@ class DistributionFitter:
         if suppress_warnings:
             warning_context.__enter__()
             warnings.filterwarnings('ignore', category=RuntimeWarning)
+        memory_context = tracing_memory(trace_memory)
+        memory_context.__enter__()
         
         try:
-            for dist_class in self.distributions:
-                try:
-                    # Create and fit distribution
-                    dist = dist_class(self.data)
-                    params = dist.fit()
-                    
-                    # Test goodness of fit
-                    statistic, p_value = dist.test_goodness_of_fit(method=self.method)
-                    
-                    # Store results
-                    result: FitResult = {
-                        'distribution': dist.name,
-                        'distribution_object': dist,
-                        'parameters': params,
-                        'test_statistic': float(statistic),
-                        'p_value': float(p_value) if p_value is not None else None,
-                        'aic': self._calculate_aic(dist),
-                        'bic': self._calculate_bic(dist),
-                    }
-                    
-                    self.results.append(result)
-                    
-                except Exception as e:
-                    if verbose:
-                        warnings.warn(
-                            f"Failed to fit {dist_class.__name__}: {str(e)}",
-                            RuntimeWarning
-                        )
-                    continue
+            for dist, entry in hits:
+                self._collect(type(dist), dist, verbose, cached=entry)
+            
+            if racing and not isinstance(self.data, CountHistogram):
+                candidates, pruned = self._race(candidates, race_metric, verbose, priors)
+            
+            if n_workers == 1:
+                # Serial fits keep the order of self.distributions
+                tasks = [ScheduledTask(None, c, len(self.data), 0.0) for c in candidates]
+            else:
+                tasks = self.plan(n_workers, cost_model, candidates).tasks
+            
+            for task, outcome, timings, memory in run_fits(
+                tasks, lambda task: self.data, n_workers, suppress_warnings,
+                timeout=timeout, deadline=deadline_at, isolate=isolate,
+                initial_for=lambda task: self._initial(task.family, priors),
+                fixed_for=lambda task: self._fixed_params(task.family),
+                options_for=lambda task: self._options_for(task.family),
+                tracer_for=lambda task: self.tracer,
+                trace_memory=trace_memory
+            ):
+                self._collect(task.family, outcome, verbose, timings=timings, memory=memory)
         finally:
+            memory_context.__exit__(None, None, None)
             if suppress_warnings and warning_context:
                 warning_context.__exit__(None, None, None)
         
+        self._finalize(pruned + self._skipped_results(skipped))
+        if isinstance(warm_start, str):
+            parameter_store.update(warm_start, self.results)
+            parameter_store.save()
+        return self.results
+    
+    @staticmethod
+    def fit_many(
+        fitters: Dict[Hashable, 'DistributionFitter'],
+        n_jobs: int = -1,
+        cost_model: Optional[CostModel] = None,
+        verbose: bool = True,
+        suppress_warnings: bool = True,
+        screening: Literal['off', 'conservative', 'aggressive'] = 'off',
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        isolate: bool = False,
+        optimizer: Optional[str] = None,
+        maxiter: Optional[int] = None,
+        tol: Optional[float] = None,
+        n_starts: int = 1,
+        trace_memory: bool = False,
+        retain_data: bool = False
+    ) -> Dict[Hashable, List[FitResult]]:
+        """
+        Fit several datasets at once, sharing one pool of workers.
+        
+        Every (dataset, candidate) fit is scheduled longest predicted
+        runtime first across all datasets (see :meth:`plan_many`), so that
+        a large dataset's slow fits start early instead of trailing at the
+        end while other workers sit idle. Candidates found in a fitter's
+        ``cache`` are not scheduled.
+        
+        Args:
+            fitters: Mapping of dataset key to fitter
+            n_jobs: Number of worker processes (-1 for all cores)
+            cost_model: Runtime model used for ordering.
+                       Defaults to :meth:`CostModel.load`
+            verbose: If True, warn about candidates that fail to fit
+            suppress_warnings: If True, suppress scipy/numpy warnings during fitting
+            screening: Moment-based pre-screening (see :meth:`fit`)
+            timeout: Seconds allowed for each fit (see :meth:`fit`)
+            deadline: Seconds allowed for all datasets together
+            isolate: If True, run every fit in a separate, killable process
+            optimizer: Optimizer backend (see :meth:`fit`)
+            maxiter: Iteration limit of the optimizer
+            tol: Convergence tolerance of the optimizer
+            n_starts: Number of starting points for multimodal likelihoods
+            trace_memory: If True, record the peak memory and allocations
+                         of each stage of each candidate (see :meth:`fit`)
+            retain_data: If True, results keep the fitted distribution
+                        objects (see :meth:`fit`)
+            
+        Returns:
+            Mapping of dataset key to that fitter's results
+            
+        Example:
+            ```python
+            results = DistributionFitter.fit_many({
+                'latency': DistributionFitter(latency),
+                'payload': DistributionFitter(payload),
+            }, n_jobs=4)
+            ```
+        """
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        n_workers = resolve_n_jobs(n_jobs)
+        options = DistributionFitter._fit_options(optimizer, maxiter, tol, n_starts)
+        skipped = {}
+        hits = {}
+        tasks = []
+        for key, fitter in fitters.items():
+            fitter.results = []
+            fitter._failed = []
+            fitter._options = options
+            fitter._trace_memory = trace_memory
+            fitter._retain_data = retain_data
+            candidates, skipped[key] = fitter._screen(screening)
+            hits[key], candidates = fitter._lookup_cache(candidates)
+            tasks.extend((key, dist_class, len(fitter.data)) for dist_class in candidates)
+        schedule = lpt_schedule(tasks, n_workers, cost_model)
+        
+        with warnings.catch_warnings(), tracing_memory(trace_memory):
+            if suppress_warnings:
+                warnings.filterwarnings('ignore', category=RuntimeWarning)
+            for key, fitter in fitters.items():
+                for dist, entry in hits[key]:
+                    fitter._collect(type(dist), dist, verbose, cached=entry)
+            for task, outcome, timings, memory in run_fits(
+                schedule.tasks, lambda task: fitters[task.group].data, n_workers,
+                suppress_warnings, timeout=timeout, deadline=deadline_at, isolate=isolate,
+                fixed_for=lambda task: fitters[task.group]._fixed_params(task.family),
+                options_for=lambda task: fitters[task.group]._options_for(task.family),
+                tracer_for=lambda task: fitters[task.group].tracer,
+                trace_memory=trace_memory
+            ):
+                fitters[task.group]._collect(
+                    task.family, outcome, verbose, timings=timings, memory=memory
+                )
+        
+        for key, fitter in fitters.items():
+            fitter._finalize(fitter._skipped_results(skipped[key]))
+        return {key: fitter.results for key, fitter in fitters.items()}
+    
+    def plan(
+        self,
+        n_jobs: int = 1,
+        cost_model: Optional[CostModel] = None,
+        candidates: Optional[List[Type[BaseDistribution]]] = None
+    ) -> Schedule:
+        """
+        Predict the dispatch order and timeline of fitting the candidates.
+        
+        Useful to choose a deadline: ``time_to_first_result`` is when the
+        first usable fit is expected, ``makespan`` when all are done.
+        
+        Args:
+            n_jobs: Number of parallel workers (-1 for all cores)
+            cost_model: Runtime model. Defaults to :meth:`CostModel.load`
+            candidates: Distribution classes. Defaults to self.distributions
+            
+        Returns:
+            Schedule with the candidates in longest-first dispatch order
+        """
+        if candidates is None:
+            candidates = self.distributions
+        return lpt_schedule(
+            [(None, dist_class, len(self.data)) for dist_class in candidates],
+            resolve_n_jobs(n_jobs),
+            cost_model
+        )
+    
+    @staticmethod
+    def plan_many(
+        fitters: Dict[Hashable, 'DistributionFitter'],
+        n_jobs: int = -1,
+        cost_model: Optional[CostModel] = None
+    ) -> Schedule:
+        """
+        Predict the shared schedule of :meth:`fit_many`.
+        
+        Use ``schedule.first_result(key)`` and ``schedule.completion(key)``
+        for per-dataset estimates.
+        
+        Args:
+            fitters: Mapping of dataset key to fitter
+            n_jobs: Number of parallel workers (-1 for all cores)
+            cost_model: Runtime model. Defaults to :meth:`CostModel.load`
+            
+        Returns:
+            Schedule of every (dataset, candidate) fit
+        """
+        return lpt_schedule(
+            [
+                (key, dist_class, len(fitter.data))
+                for key, fitter in fitters.items()
+                for dist_class in fitter.distributions
+            ],
+            resolve_n_jobs(n_jobs),
+            cost_model
+        )
+    
+    def _screen(self, screening: str) -> tuple:
+        """Split self.distributions into candidates to fit and skipped ones."""
+        return screen_candidates(
+            self.distributions,
+            self.profile if screening != 'off' else None,
+            screening,
+            discrete=self.dist_type == 'discrete'
+        )
+    
+    def _collect(
+        self,
+        dist_class: type,
+        outcome: Union[BaseDistribution, BaseDiscreteDistribution, Exception],
+        verbose: bool,
+        cached: Optional[Dict[str, Any]] = None,
+        timings: Optional[Dict[str, float]] = None,
+        memory: Optional[Dict[str, Dict[str, int]]] = None
+    ) -> None:
+        """
+        Evaluate a fitted candidate and store its result.
+        
+        ``cached`` is the cache entry the candidate was rebuilt from, whose
+        goodness-of-fit result is reused when present. ``timings`` holds
+        the seconds of the stages already run ('validate', 'fit'); the
+        'gof' and 'aic_bic' stages are timed here. ``memory`` likewise
+        holds their memory use when the fit traces memory.
+        """
+        timings = dict(timings or {})
+        memory = dict(memory or {}) if self._trace_memory else None
+        try:
+            if isinstance(outcome, Exception):
+                raise outcome
+            dist = outcome
+            n = len(self.data)
+            
+            # Test goodness of fit
+            if cached is not None and 'test_statistic' in cached:
+                statistic, p_value = cached['test_statistic'], cached['p_value']
+            else:
+                statistic, p_value = run_stage(
+                    self.tracer, timings, 'gof', dist.name, n, self._test_goodness_of_fit, dist,
+                    memory=memory
+                )
+            aic, bic = run_stage(
+                self.tracer, timings, 'aic_bic', dist.name, n, self._information_criteria, dist,
+                memory=memory
+            )
+            
+            # Store results
+            result: FitResult = {
+                'distribution': dist.name,
+                'distribution_object': self._result_object(
+                    dist,
+                    n_observations=n,
+                    test_statistic=float(statistic),
+                    p_value=float(p_value) if p_value is not None else None,
+                    aic=aic,
+                    bic=bic
+                ),
+                'parameters': dist.params,
+                'test_statistic': float(statistic),
+                'p_value': float(p_value) if p_value is not None else None,
+                'aic': aic,
+                'bic': bic,
+                'status': 'fitted',
+                **self._diagnostics(dist),
+                'timings': timings,
+            }
+            if memory is not None:
+                result['memory'] = memory
+            if self.method == 'ks_sketch':
+                result['test_error_bound'] = self.sketch.rank_error_bound()
+            if cached is None:
+                record_fit(self.metrics, dist.name, n, timings.get('fit'))
+            if self.cache is not None:
+                result['cached'] = cached is not None
+                if cached is None:
+                    self._store_in_cache(dist, result)
+            
+            self.results.append(result)
+            
+        except Exception as e:
+            record_failure(self.metrics, dist_class.__name__, e)
+            if verbose:
+                warnings.warn(
+                    f"Failed to fit {dist_class.__name__}: {str(e)}",
+                    RuntimeWarning
+                )
+            failure: FitResult = {
+                'distribution': dist_class.__name__,
+                'distribution_object': None,
+                'parameters': {},
+                'test_statistic': None,
+                'p_value': None,
+                'aic': None,
+                'bic': None,
+                'status': 'failed',
+                'reason': str(e),
+                'timed_out': isinstance(e, FitTimeoutError),
+                'timings': timings,
+            }
+            if memory is not None:
+                failure['memory'] = memory
+            self._failed.append(failure)
+    
+    @staticmethod
+    def _initial(dist_class: type, priors: Optional[Dict[str, Parameters]]) -> Optional[Parameters]:
+        """Warm-start parameters of a candidate, if it can use them."""
+        if not priors or not getattr(dist_class, 'SUPPORTS_WARM_START', False):
+            return None
+        return priors.get(dist_class.__name__)
+    
+    def _fixed_params(self, dist_class: type) -> Optional[Parameters]:
+        """Fixed parameters of a candidate, if any."""
+        return self.fixed.get(dist_class.__name__)
+    
+    @staticmethod
+    def _fit_options(
+        optimizer: Optional[str],
+        maxiter: Optional[int],
+        tol: Optional[float],
+        n_starts: int
+    ) -> Dict[str, Any]:
+        """
+        Validated ``fit()`` options of continuous candidates, defaults left out.
+        
+        Raises:
+            ValueError: If the optimizer is unknown or n_starts < 1
+        """
+        if optimizer is not None and optimizer not in OPTIMIZERS:
+            raise ValueError(f"Unknown optimizer: {optimizer}. Choose from {OPTIMIZERS}")
+        if n_starts < 1:
+            raise ValueError(f"n_starts must be at least 1, got {n_starts}")
+        options = {'optimizer': optimizer, 'maxiter': maxiter, 'tol': tol}
+        options = {name: value for name, value in options.items() if value is not None}
+        if n_starts > 1:
+            options['n_starts'] = n_starts
+        return options
+    
+    def _options_for(self, dist_class: type) -> Optional[Dict[str, Any]]:
+        """Optimizer options of a candidate; discrete estimators are closed form."""
+        if not self._options or not issubclass(dist_class, BaseDistribution):
+            return None
+        return self._options
+    
+    def _result_object(
+        self,
+        dist: Union[BaseDistribution, BaseDiscreteDistribution],
+        **stats: Any
+    ) -> Union[FittedModel, BaseDistribution, BaseDiscreteDistribution]:
+        """What a result holds of a fitted candidate: a FittedModel unless retaining data."""
+        if self._retain_data:
+            return dist
+        return FittedModel.from_distribution(dist, **stats)
+    
+    @staticmethod
+    def _diagnostics(dist: Union[BaseDistribution, BaseDiscreteDistribution]) -> Dict[str, Any]:
+        """Optimizer diagnostics of a fit for its result (None if it wasn't fitted here)."""
+        info = dist.fit_info or {}
+        return {
+            name: info.get(name)
+            for name in ('optimizer', 'converged', 'iterations', 'nfev', 'fit_time')
+        }
+    
+    def _cache_key(self, dist_class: type) -> str:
+        """Key of a candidate's fit to this fitter's data."""
+        extra: Dict[str, Any] = {}
+        fixed = self._fixed_params(dist_class)
+        if fixed:
+            extra['fixed'] = fixed
+        options = self._options_for(dist_class)
+        if options:
+            extra['options'] = options
+        return make_key(self.fingerprint, dist_class, self.method, **extra)
+    
+    def _lookup_cache(self, candidates: list) -> tuple:
+        """
+        Split candidates into cache hits and candidates still to fit.
+        
+        Returns:
+            Tuple of (list of (distribution rebuilt from cached parameters,
+            cache entry), remaining candidate classes)
+        """
+        if self.cache is None:
+            return [], list(candidates)
+        hits, misses = [], []
+        for dist_class in candidates:
+            entry = self.cache.get(self._cache_key(dist_class))
+            record_cache_lookup(self.metrics, entry is not None)
+            if entry is None:
+                misses.append(dist_class)
+                continue
+            dist = make_distribution(dist_class, self.data, self._fixed_params(dist_class))
+            dist.set_params(entry['params'])
+            hits.append((dist, entry))
+        return hits, misses
+    
+    def _store_in_cache(
+        self,
+        dist: Union[BaseDistribution, BaseDiscreteDistribution],
+        result: FitResult
+    ) -> None:
+        """Store a full-data fit's parameters and test result in the cache."""
+        entry: Dict[str, Any] = {
+            'params': {
+                name: value.item() if isinstance(value, np.generic) else value
+                for name, value in dist.params.items()
+            },
+        }
+        # A sketch-based test depends on the sketch, not only on the data
+        if self.method != 'ks_sketch':
+            entry['test_statistic'] = result['test_statistic']
+            entry['p_value'] = result['p_value']
+        self.cache.put(self._cache_key(type(dist)), entry)
+    
+    def _finalize(self, unfitted: List[FitResult]) -> None:
+        """Rank the fitted results and append the candidates not fitted."""
         # Sort by p-value (higher is better)
         self.results.sort(
             key=lambda x: x['p_value'] if x['p_value'] is not None else -1,
             reverse=True
         )
-        
+        self.results.extend(unfitted)
+        self.results.extend(self._failed)
+        self._failed = []
         self._fitted = True
-        return self.results
+    
+    @staticmethod
+    def _skipped_results(skipped: list) -> List[FitResult]:
+        """Results of candidates skipped by screening."""
+        return [
+            {
+                'distribution': dist_class.__name__,
+                'distribution_object': None,
+                'parameters': {},
+                'test_statistic': None,
+                'p_value': None,
+                'aic': None,
+                'bic': None,
+                'status': 'skipped',
+                'reason': reason,
+                'moment_distance': distance,
+            }
+            for dist_class, reason, distance in skipped
+        ]
+    
+    def _race(
+        self,
+        candidates: List[Type[BaseDistribution]],
+        metric: str,
+        verbose: bool,
+        priors: Optional[Dict[str, Parameters]] = None
+    ) -> tuple:
+        """
+        Successive halving of candidates on growing random subsamples.
+        
+        Returns:
+            Tuple of (surviving candidate classes, results of pruned
+            candidates, latest rungs first)
+        """
+        rng = np.random.default_rng(self.random_state)
+        n = len(self.data)
+        size = self.RACE_MIN_SAMPLE
+        rung = 0
+        pruned: List[FitResult] = []
+        
+        while len(candidates) > self.RACE_FINALISTS and size < n:
+            sample = self.data[np.sort(rng.choice(n, size=size, replace=False))]
+            
+            scored = []
+            for dist_class in candidates:
+                timings: Dict[str, float] = {}
+                memory: Optional[Dict[str, Dict[str, int]]] = {} if self._trace_memory else None
+                name = dist_class.__name__
+                try:
+                    dist = run_stage(
+                        self.tracer, timings, 'validate', name, size,
+                        make_distribution, dist_class, sample, self._fixed_params(dist_class),
+                        memory=memory
+                    )
+                    run_stage(
+                        self.tracer, timings, 'fit', name, size, fit_distribution,
+                        dist, self._initial(dist_class, priors), self._options_for(dist_class),
+                        memory=memory
+                    )
+                    score = self._race_score(dist, sample, metric)
+                except Exception as e:
+                    self._collect(dist_class, e, verbose, timings=timings, memory=memory)
+                    continue
+                scored.append((score, dist_class, dist, timings, memory))
+            
+            # Best first: highest log-likelihood or lowest KS statistic
+            scored.sort(key=lambda x: x[0], reverse=(metric == 'loglik'))
+            n_keep = max(self.RACE_FINALISTS, int(np.ceil(len(scored) / self.RACE_ETA)))
+            
+            pruned = [
+                {
+                    'distribution': dist.name,
+                    'distribution_object': self._result_object(dist, n_observations=size),
+                    'parameters': dist.params,
+                    'test_statistic': None,
+                    'p_value': None,
+                    'aic': None,
+                    'bic': None,
+                    'status': 'pruned',
+                    'reason': f"pruned at rung {rung} (n={size}, {metric}={score:.4g})",
+                    'rung': rung,
+                    'sample_size': size,
+                    'race_score': score,
+                    **self._diagnostics(dist),
+                    'timings': timings,
+                    **({'memory': memory} if memory is not None else {}),
+                }
+                for score, _, dist, timings, memory in scored[n_keep:]
+            ] + pruned
+            candidates = [dist_class for _, dist_class, _, _, _ in scored[:n_keep]]
+            size *= self.RACE_ETA
+            rung += 1
+        
+        return candidates, pruned
+    
+    @staticmethod
+    def _race_score(
+        dist: Union[BaseDistribution, BaseDiscreteDistribution],
+        sample: np.ndarray,
+        metric: str
+    ) -> float:
+        """Score of a candidate fitted on a racing subsample."""
+        if metric == 'ks':
+            statistic, _ = dist.test_goodness_of_fit(method='ks')
+            return float(statistic)
+        density = dist.pmf if isinstance(dist, BaseDiscreteDistribution) else dist.pdf
+        return float(np.mean(np.log(density(sample) + 1e-10)))
+    
+    def _fitted_results(self) -> List[FitResult]:
+        """Results of the candidates fitted on the full data, best first."""
+        return [r for r in self.results if r.get('status', 'fitted') == 'fitted']
+    
+    def _test_goodness_of_fit(
+        self,
+        dist: Union[BaseDistribution, BaseDiscreteDistribution]
+    ) -> tuple:
+        """Run the configured goodness-of-fit test on a fitted distribution."""
+        if self.method == 'ks_sketch':
+            if self.sketch is None:
+                # Built once and shared by every candidate
+                self.sketch = QuantileSketch.from_data(self.data)
+            return dist.test_goodness_of_fit(method='ks_sketch', sketch=self.sketch)
+        return dist.test_goodness_of_fit(method=self.method)
+    
+    def _information_criteria(
+        self,
+        dist: Union[BaseDistribution, BaseDiscreteDistribution]
+    ) -> tuple:
+        """AIC and BIC of a fitted candidate."""
+        return self._calculate_aic(dist), self._calculate_bic(dist)
     
     def _calculate_aic(self, dist: Union[BaseDistribution, BaseDiscreteDistribution]) -> float:
         """
         Calculate Akaike Information Criterion.
         
         AIC = 2k - 2ln(L)
-        where k is number of parameters and L is likelihood
+        where k is number of free (not fixed) parameters and L is likelihood
         """
-        k = len(dist.params)
-        
-        # Use pmf for discrete, pdf for continuous
-        if isinstance(dist, BaseDiscreteDistribution):
-            probs = dist.pmf(self.data)
-        else:
-            probs = dist.pdf(self.data)
-        
-        log_likelihood = np.sum(np.log(probs + 1e-10))
+        k = dist.n_free_params
+        log_likelihood = self._log_likelihood(dist)
         return 2 * k - 2 * log_likelihood
     
     def _calculate_bic(self, dist: Union[BaseDistribution, BaseDiscreteDistribution]) -> float:
@@ -213,19 +1304,67 @@ class DistributionFitter:
         Calculate Bayesian Information Criterion.
         
         BIC = k*ln(n) - 2ln(L)
-        where k is number of parameters, n is sample size, L is likelihood
+        where k is number of free parameters, n is sample size, L is likelihood
         """
-        k = len(dist.params)
-        n = len(self.data)
+        k = dist.n_free_params
+        n = self.n_observations
+        log_likelihood = self._log_likelihood(dist)
+        return k * np.log(n) - 2 * log_likelihood
+    
+    def _log_likelihood(self, dist: Union[BaseDistribution, BaseDiscreteDistribution]) -> float:
+        """Log-likelihood of the data under a fitted distribution."""
+        if isinstance(self.data, CountHistogram):
+            values, counts = self.data.frequencies()
+            return float(np.dot(counts, np.log(dist.pmf(values) + 1e-10)))
         
         # Use pmf for discrete, pdf for continuous
-        if isinstance(dist, BaseDiscreteDistribution):
-            probs = dist.pmf(self.data)
-        else:
-            probs = dist.pdf(self.data)
+        discrete = isinstance(dist, BaseDiscreteDistribution)
+        density = dist.pmf if discrete else dist.pdf
+        correction = 0.0
+        scale = 1.0 if discrete else self._data_scale
+        if scale != 1.0:
+            # Badly scaled data: evaluate the density of the standardized
+            # values so the 1e-10 floor is relative to the data's scale,
+            # and add back the Jacobian
+            pdf = dist.pdf
+
+            def scaled_pdf(values: np.ndarray) -> np.ndarray:
+                return pdf(values) * scale
+
+            density = scaled_pdf
+            correction = self.n_observations * np.log(scale)
         
-        log_likelihood = np.sum(np.log(probs + 1e-10))
-        return k * np.log(n) - 2 * log_likelihood
+        if self.tail is not None:
+            # Stratified estimate: exact tails plus the weighted body
+            body, weight = self._body_weight()
+            return (
+                self._sum_log_density(density, self.tail)
+                + weight * self._sum_log_density(density, self.data[body])
+                - correction
+            )
+        
+        # Scale a sample's log-likelihood up to the full dataset
+        return self._sum_log_density(density, self.data) / self.sample_fraction - correction
+    
+    @property
+    def _data_scale(self) -> float:
+        """Robust spread of badly scaled continuous data, 1.0 otherwise."""
+        if self._scale is None:
+            if self.dist_type == 'discrete' or isinstance(self.data, CountHistogram):
+                self._scale = 1.0
+            else:
+                self._scale = robust_standardization(self.data)[1]
+        return self._scale
+    
+    def _sum_log_density(self, density: Any, values: np.ndarray) -> float:
+        """Sum of log-densities, in bounded chunks in compact mode."""
+        if self.compact:
+            # Bounded float64 temporaries, float64 accumulation
+            log_likelihood = 0.0
+            for chunk in iter_array_chunks(values, self.LOG_LIKELIHOOD_CHUNK_SIZE):
+                log_likelihood += np.sum(np.log(density(chunk) + 1e-10), dtype=np.float64)
+            return log_likelihood
+        return np.sum(np.log(density(values) + 1e-10))
     
     def get_best_distribution(
         self,
@@ -245,38 +1384,101 @@ class DistributionFitter:
         """
         if not self._fitted:
             self.fit()
-            
-        if not self.results:
+        
+        results = self._fitted_results()
+        if not results:
             return None
             
         if criterion == 'p_value':
-            return self.results[0]  # Already sorted by p_value
+            return results[0]  # Already sorted by p_value
         elif criterion == 'aic':
-            return min(self.results, key=lambda x: x['aic'])
+            return min(results, key=lambda x: x['aic'])
         elif criterion == 'bic':
-            return min(self.results, key=lambda x: x['bic'])
+            return min(results, key=lambda x: x['bic'])
         else:
             raise ValueError(f"Unknown criterion: {criterion}")
     
-    def summary(self, top_n: int = None) -> pd.DataFrame:
+    def result_table(self) -> ResultTable:
+        """
+        The ranked results and fit options, ready to be saved or published.
+        
+        The table stores only family names, parameters, metrics and
+        options, as versioned JSON (``to_json()``) or a compact binary
+        payload (``to_bytes()``). ``ResultTable.from_bytes`` (or
+        ``from_json``) loads it back with usable models, without refitting
+        and without pandas or matplotlib.
+        
+        Returns:
+            ResultTable of the current results, fitting first if needed
+            
+        Example:
+            ```python
+            Path('fit.bin').write_bytes(fitter.result_table().to_bytes())
+            
+            # In another process
+            table = ResultTable.from_bytes(Path('fit.bin').read_bytes())
+            table.best()['distribution_object'].ppf(0.99)
+            ```
+        """
+        if not self._fitted:
+            self.fit()
+        return ResultTable(self.results, {
+            'dist_type': self.dist_type,
+            'method': self.method,
+            'n_observations': self.n_observations,
+            'candidates': [dist_class.__name__ for dist_class in self.distributions],
+            'fixed': self.fixed,
+            **self._options,
+        })
+    
+    def summary(
+        self,
+        top_n: int = None,
+        timings: bool = False,
+        memory: bool = False,
+        as_array: bool = False
+    ) -> Union['pd.DataFrame', np.ndarray]:
         """
         Get a summary DataFrame of all fitted distributions.
         
+        pandas is imported on the first call; nothing else in fitting
+        needs it. With ``as_array=True`` it isn't needed at all.
+        
         Args:
             top_n: Number of top results to include (None for all)
+            timings: If True, add the seconds spent in each stage of each
+                    candidate ('Validation (s)', 'Fitting (s)', 'GOF Test (s)',
+                    'AIC/BIC (s)'; empty for stages that did not run)
+            memory: If True, add the peak memory of each stage of each
+                   candidate in MiB ('Validation Peak (MiB)', ...), for fits
+                   run with ``trace_memory=True``
+            as_array: If True, return a numpy structured array with the
+                     same columns as fields instead of a DataFrame
+                     (numeric columns as float with NaN for missing
+                     values, others as objects)
             
         Returns:
-            DataFrame with distribution names, parameters, and test statistics
+            DataFrame with distribution names, parameters, test statistics
+            and optimizer diagnostics (optimizer, convergence, iterations,
+            function evaluations and wall time of each fit). When
+            candidates were fitted on a subsample of the data, it also
+            reports the effective sample size and the number of retained
+            tail points; when some candidates were not fitted on the full
+            data (e.g. pruned by racing), it adds their status and reason
         """
         if not self._fitted:
             self.fit()
             
         if not self.results:
-            return pd.DataFrame()
+            return self._summary_table([], as_array)
             
         results = self.results[:top_n] if top_n else self.results
         
         summary_data = []
+        show_status = any(r.get('status', 'fitted') != 'fitted' for r in results)
+        if self.n_total is not None:
+            effective_n = self.effective_sample_size
+            n_tail = 0 if self.tail is None else len(self.tail)
         for result in results:
             row = {
                 'Distribution': result['distribution'],
@@ -284,14 +1486,70 @@ class DistributionFitter:
                 'P-Value': result['p_value'],
                 'AIC': result['aic'],
                 'BIC': result['bic'],
+                'Optimizer': result.get('optimizer'),
+                'Converged': result.get('converged'),
+                'Iterations': result.get('iterations'),
+                'Evaluations': result.get('nfev'),
+                'Fit Time (s)': result.get('fit_time'),
             }
+            if self.n_total is not None:
+                row['Effective N'] = effective_n
+                row['Tail Points'] = n_tail
+            if show_status:
+                row['Status'] = result.get('status', 'fitted')
+                row['Reason'] = result.get('reason')
+            if timings:
+                stage_times = result.get('timings', {})
+                for stage, label in STAGES.items():
+                    row[f'{label} (s)'] = stage_times.get(stage)
+            if memory:
+                stage_memory = result.get('memory', {})
+                for stage, label in STAGES.items():
+                    peak = stage_memory.get(stage, {}).get('peak_bytes')
+                    row[f'{label} Peak (MiB)'] = None if peak is None else peak / 2**20
             # Add parameters
             for param_name, param_value in result['parameters'].items():
                 row[f'param_{param_name}'] = param_value
                 
             summary_data.append(row)
             
-        return pd.DataFrame(summary_data)
+        return self._summary_table(summary_data, as_array)
+    
+    @staticmethod
+    def _summary_table(
+        rows: List[Dict[str, Any]], as_array: bool
+    ) -> Union['pd.DataFrame', np.ndarray]:
+        """Summary rows as a DataFrame, or as a structured array without pandas."""
+        if not as_array:
+            import pandas as pd
+            return pd.DataFrame(rows)
+        
+        # Columns in order of first appearance, as pandas does
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+        fields = []
+        for column in columns:
+            values = [row.get(column) for row in rows]
+            if all(isinstance(value, (bool, np.bool_)) for value in values):
+                dtype = bool
+            elif all(
+                value is None or (
+                    isinstance(value, (int, float, np.integer, np.floating))
+                    and not isinstance(value, (bool, np.bool_))
+                )
+                for value in values
+            ):
+                dtype = float
+            else:
+                dtype = object
+            fields.append((column, dtype))
+        
+        table = np.empty(len(rows), dtype=fields)
+        for column, dtype in fields:
+            values = [row.get(column) for row in rows]
+            if dtype is float:
+                values = [np.nan if value is None else value for value in values]
+            table[column] = values
+        return table
     
     def plot_best_fit(
         self,
@@ -316,22 +1574,28 @@ class DistributionFitter:
         best = self.get_best_distribution()
         if best is None:
             raise FittingError("No distributions were successfully fitted")
+        if self.tracer is not None:
+            self.tracer.stage_start(PLOT_STAGE, best['distribution'], len(self.data))
+        started = time.perf_counter()
             
         dist_obj = best['distribution_object']
-        is_discrete = isinstance(dist_obj, BaseDiscreteDistribution)
+        is_discrete = getattr(
+            dist_obj, 'discrete', isinstance(dist_obj, BaseDiscreteDistribution)
+        )
         
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
         
         # Histogram with PDF/PMF overlay
         if is_discrete:
             # For discrete: use bar plot
-            unique_vals, counts = np.unique(self.data, return_counts=True)
-            probs = counts / len(self.data)
+            unique_vals, counts = self._frequencies()
+            probs = counts / self.n_observations
             ax1.bar(unique_vals, probs, alpha=0.7, color='skyblue', 
                    edgecolor='black', label='Data', width=0.8)
             
             # Plot PMF
-            x_range = np.arange(self.data.min(), self.data.max() + 1)
+            data_min, data_max = self._data_range()
+            x_range = np.arange(int(data_min), int(data_max) + 1)
             ax1.plot(x_range, dist_obj.pmf(x_range), 'ro-', lw=2,
                     label=f'{best["distribution"]} PMF', markersize=4)
             ax1.set_ylabel('Probability')
@@ -352,7 +1616,7 @@ class DistributionFitter:
         
         # Q-Q plot
         theoretical_quantiles = np.linspace(0.01, 0.99, 100)
-        empirical_quantiles = np.percentile(self.data, theoretical_quantiles * 100)
+        empirical_quantiles = self._empirical_quantiles(theoretical_quantiles)
         fitted_quantiles = dist_obj.ppf(theoretical_quantiles)
         
         ax2.scatter(fitted_quantiles, empirical_quantiles, alpha=0.5)
@@ -369,6 +1633,10 @@ class DistributionFitter:
         ax2.grid(True, alpha=0.3)
         
         plt.tight_layout()
+        if self.tracer is not None:
+            self.tracer.stage_end(
+                PLOT_STAGE, best['distribution'], len(self.data), time.perf_counter() - started
+            )
         return fig
     
     def compare_distributions(
@@ -391,9 +1659,13 @@ class DistributionFitter:
         if not self._fitted:
             self.fit()
             
-        n_dists = len(self.results)
+        results = self._fitted_results()
+        n_dists = len(results)
         if n_dists == 0:
             raise FittingError("No distributions were successfully fitted")
+        if self.tracer is not None:
+            self.tracer.stage_start(PLOT_STAGE, 'all', len(self.data))
+        started = time.perf_counter()
             
         n_cols = 2
         n_rows = (n_dists + 1) // 2
@@ -402,26 +1674,29 @@ class DistributionFitter:
         if n_rows == 1:
             axes = axes.reshape(1, -1)
             
-        x_range = np.linspace(self.data.min(), self.data.max(), 1000)
+        data_min, data_max = self._data_range()
+        x_range = np.linspace(data_min, data_max, 1000)
         
-        for idx, result in enumerate(self.results):
+        for idx, result in enumerate(results):
             row = idx // n_cols
             col = idx % n_cols
             ax = axes[row, col]
             
             dist_obj = result['distribution_object']
-            is_discrete = isinstance(dist_obj, BaseDiscreteDistribution)
+            is_discrete = getattr(
+                dist_obj, 'discrete', isinstance(dist_obj, BaseDiscreteDistribution)
+            )
             
             # Plot data and fitted distribution
             if is_discrete:
                 # For discrete: use bar plot
-                unique_vals, counts = np.unique(self.data, return_counts=True)
-                probs = counts / len(self.data)
+                unique_vals, counts = self._frequencies()
+                probs = counts / self.n_observations
                 ax.bar(unique_vals, probs, alpha=0.5, color='skyblue', 
                       edgecolor='black', label='Data', width=0.8)
                 
                 # Plot PMF
-                x_discrete = np.arange(self.data.min(), self.data.max() + 1)
+                x_discrete = np.arange(int(data_min), int(data_max) + 1)
                 ax.plot(x_discrete, dist_obj.pmf(x_discrete), 'ro-', lw=2,
                        label=f'{result["distribution"]} PMF', markersize=3)
             else:
@@ -450,5 +1725,7 @@ class DistributionFitter:
             axes[row, col].axis('off')
             
         plt.tight_layout()
+        if self.tracer is not None:
+            self.tracer.stage_end(PLOT_STAGE, 'all', len(self.data), time.perf_counter() - started)
         return fig
 
@@ -0,0 +1,266 @@
+"""Mergeable count histogram for streaming discrete data."""
+
+from typing import Dict, Tuple
+import numpy as np
+
+from ..utils.types import ArrayLike
+
+
+class CountHistogram:
+    """
+    Lossless, mergeable frequency table of non-negative integer data.
+
+    Small values are accumulated in a dense ``np.bincount`` array of at most
+    ``max_bins`` entries; values at or above ``max_bins`` spill into a sparse
+    overflow table, so a handful of very large counts never forces a huge
+    dense allocation. Memory is bounded by ``max_bins`` plus the number of
+    distinct overflow values, independent of the number of observations.
+
+    Attributes:
+        max_bins: Size limit of the dense part of the histogram
+        n: Total number of observations accumulated
+
+    Example:
+        ```python
+        from bestdist.core.histogram import CountHistogram
+
+        hist = CountHistogram()
+        for chunk in chunks:
+            hist.update(chunk)
+
+        # Histograms built by different workers can be combined
+        hist.merge(other_hist)
+        print(hist.n, hist.mean(), hist.var())
+        ```
+    """
+
+    DEFAULT_MAX_BINS = 65536
+
+    def __init__(self, max_bins: int = DEFAULT_MAX_BINS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            max_bins: Number of dense bins (values 0 .. max_bins - 1)
+
+        Raises:
+            ValueError: If max_bins is not positive
+        """
+        if max_bins < 1:
+            raise ValueError(f"max_bins must be positive, got {max_bins}")
+        self.max_bins = int(max_bins)
+        self.n = 0
+        self._dense = np.zeros(0, dtype=np.int64)
+        self._overflow: Dict[int, int] = {}
+
+    @classmethod
+    def from_data(cls, data: ArrayLike, max_bins: int = DEFAULT_MAX_BINS) -> 'CountHistogram':
+        """Build a histogram from a single array of counts."""
+        return cls(max_bins=max_bins).update(data)
+
+    def update(self, chunk: ArrayLike) -> 'CountHistogram':
+        """
+        Add a chunk of observations to the histogram.
+
+        NaN values are ignored; non-integer values are truncated the same
+        way discrete distributions truncate their input.
+
+        Args:
+            chunk: Non-negative integer observations
+
+        Returns:
+            The histogram itself, to allow chaining
+
+        Raises:
+            ValueError: If the chunk contains negative or infinite values
+        """
+        arr = np.asarray(chunk)
+        if arr.dtype.kind == 'f':
+            arr = arr[~np.isnan(arr)]
+            if not np.isfinite(arr).all():
+                raise ValueError("Data contains infinite values")
+        arr = arr.ravel()
+        if arr.size == 0:
+            return self
+        if arr.dtype.kind not in 'iu':
+            arr = arr.astype(np.int64)
+
+        if arr.min() < 0:
+            raise ValueError("Discrete data cannot contain negative values")
+
+        in_range = arr < self.max_bins
+        if in_range.all():
+            self._add_dense(np.bincount(arr))
+        else:
+            if in_range.any():
+                self._add_dense(np.bincount(arr[in_range]))
+            values, counts = np.unique(arr[~in_range], return_counts=True)
+            for value, count in zip(values.tolist(), counts.tolist()):
+                self._overflow[value] = self._overflow.get(value, 0) + count
+
+        self.n += int(arr.size)
+        return self
+
+    def merge(self, other: 'CountHistogram') -> 'CountHistogram':
+        """
+        Merge another histogram into this one (in place).
+
+        Histograms with different ``max_bins`` can be merged; dense bins of
+        ``other`` that fall outside this histogram's range go to overflow.
+
+        Args:
+            other: Histogram to merge
+
+        Returns:
+            The histogram itself, to allow chaining
+        """
+        dense = other._dense
+        if len(dense) > self.max_bins:
+            spill = dense[self.max_bins:]
+            for offset in np.flatnonzero(spill).tolist():
+                value = self.max_bins + offset
+                self._overflow[value] = self._overflow.get(value, 0) + int(spill[offset])
+            dense = dense[:self.max_bins]
+        self._add_dense(dense)
+
+        for value, count in other._overflow.items():
+            if value < self.max_bins:
+                if value >= len(self._dense):
+                    self._add_dense(np.zeros(value + 1, dtype=np.int64))
+                self._dense[value] += count
+            else:
+                self._overflow[value] = self._overflow.get(value, 0) + count
+
+        self.n += other.n
+        return self
+
+    def _add_dense(self, counts: np.ndarray) -> None:
+        """Add a bincount array to the dense bins, growing them if needed."""
+        if len(counts) > len(self._dense):
+            grown = np.zeros(len(counts), dtype=np.int64)
+            grown[:len(self._dense)] = self._dense
+            self._dense = grown
+        self._dense[:len(counts)] += counts
+
+    @property
+    def values(self) -> np.ndarray:
+        """Sorted distinct observed values."""
+        return self.frequencies()[0]
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Observation counts matching ``values``."""
+        return self.frequencies()[1]
+
+    def frequencies(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the distinct observed values and their counts.
+
+        Equivalent to ``np.unique(data, return_counts=True)`` on the raw data.
+
+        Returns:
+            Tuple of (values, counts), both int64 arrays sorted by value
+        """
+        nonzero = np.flatnonzero(self._dense)
+        counts = self._dense[nonzero]
+        if self._overflow:
+            keys = sorted(self._overflow)
+            nonzero = np.concatenate([nonzero, np.array(keys, dtype=np.int64)])
+            counts = np.concatenate([
+                counts, np.array([self._overflow[k] for k in keys], dtype=np.int64)
+            ])
+        return nonzero.astype(np.int64), counts
+
+    def _check_not_empty(self) -> None:
+        if self.n == 0:
+            raise ValueError("Histogram is empty")
+
+    def mean(self) -> float:
+        """Sample mean of the accumulated observations."""
+        self._check_not_empty()
+        values, counts = self.frequencies()
+        return float(np.dot(values.astype(float), counts) / self.n)
+
+    def var(self) -> float:
+        """Population variance (``ddof=0``, as ``np.var``) of the observations."""
+        mean = self.mean()
+        values, counts = self.frequencies()
+        return float(np.dot((values - mean) ** 2, counts) / self.n)
+
+    def min(self) -> int:
+        """Smallest observed value."""
+        self._check_not_empty()
+        return int(self.frequencies()[0][0])
+
+    def max(self) -> int:
+        """Largest observed value."""
+        self._check_not_empty()
+        return int(self.frequencies()[0][-1])
+
+    def quantile(self, q: ArrayLike) -> np.ndarray:
+        """
+        Empirical quantiles (inverse ECDF) of the observations.
+
+        Args:
+            q: Probabilities in [0, 1]
+
+        Returns:
+            Smallest observed values whose ECDF reaches ``q``
+        """
+        self._check_not_empty()
+        values, counts = self.frequencies()
+        cumulative = np.cumsum(counts)
+        positions = np.ceil(np.asarray(q, dtype=float) * self.n).clip(1, self.n)
+        return values[np.searchsorted(cumulative, positions, side='left')]
+
+    def copy(self) -> 'CountHistogram':
+        """Return an independent copy of the histogram."""
+        clone = CountHistogram(max_bins=self.max_bins)
+        clone._dense = self._dense.copy()
+        clone._overflow = dict(self._overflow)
+        clone.n = self.n
+        return clone
+
+    def __len__(self) -> int:
+        """Number of observations accumulated."""
+        return self.n
+
+    def __repr__(self) -> str:
+        """String representation of the histogram."""
+        n_distinct = int(np.count_nonzero(self._dense)) + len(self._overflow)
+        return f"CountHistogram(n={self.n}, distinct={n_distinct})"
+
+
+def ks_statistic_from_frequencies(
+    values: np.ndarray,
+    counts: np.ndarray,
+    cdf_values: np.ndarray,
+) -> float:
+    """
+    Two-sided KS statistic from a frequency table.
+
+    Gives the same statistic as ``scipy.stats.ks_1samp`` on the expanded data
+    without materializing it: within a run of ties the largest positive
+    deviation is at the end of the run and the largest negative one at its
+    start.
+
+    Args:
+        values: Sorted distinct values
+        counts: Number of observations at each value (may be fractional weights)
+        cdf_values: Hypothesized CDF evaluated at ``values``
+
+    Returns:
+        KS statistic D
+    """
+    total = float(np.sum(counts))
+    ecdf = np.cumsum(counts) / total
+    ecdf_left = ecdf - np.asarray(counts) / total
+    d_plus = np.max(ecdf - cdf_values)
+    d_minus = np.max(cdf_values - ecdf_left)
+    return float(max(d_plus, d_minus, 0.0))
+
+
+def ks_pvalue(statistic: float, n: int) -> float:
+    """Exact two-sided KS p-value, as used by ``scipy.stats.ks_1samp``."""
+    from scipy.stats import kstwo
+    return float(np.clip(kstwo.sf(statistic, n), 0.0, 1.0))
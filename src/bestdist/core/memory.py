@@ -0,0 +1,74 @@
+"""Peak memory and allocations of candidate stages, measured with tracemalloc."""
+
+from typing import Dict, Iterator, Tuple
+from contextlib import contextmanager
+import sys
+import tracemalloc
+
+# tracemalloc.reset_peak() is new in Python 3.9
+_HAS_RESET_PEAK = hasattr(tracemalloc, 'reset_peak')
+
+
+@contextmanager
+def tracing_memory(enabled: bool = True) -> Iterator[None]:
+    """
+    Trace memory allocations inside the block.
+
+    Starts ``tracemalloc`` if it isn't already running and stops it on
+    exit; tracing started by the caller is left on. numpy reports its
+    array buffers to tracemalloc (in its own domain,
+    ``numpy.lib.tracemalloc_domain``), so they are included next to
+    Python objects. Tracing slows allocation-heavy code down severalfold.
+
+    Args:
+        enabled: If False, do nothing
+    """
+    if not enabled or tracemalloc.is_tracing():
+        yield
+        return
+    tracemalloc.start()
+    try:
+        yield
+    finally:
+        tracemalloc.stop()
+
+
+def stage_memory_start() -> Tuple[int, int, int]:
+    """
+    Mark the start of a measured stage.
+
+    Resets tracemalloc's peak, so stages must not overlap. Python 3.8 has
+    no way to reset it: a stage's peak then only shows when it rises above
+    the highest level traced before the stage, and is otherwise estimated
+    by the memory it retains.
+
+    Returns:
+        Opaque state for :func:`stage_memory_end`
+    """
+    if _HAS_RESET_PEAK:
+        tracemalloc.reset_peak()
+    current, peak = tracemalloc.get_traced_memory()
+    return current, peak, sys.getallocatedblocks()
+
+
+def stage_memory_end(start: Tuple[int, int, int]) -> Dict[str, int]:
+    """
+    Memory use of a stage started with :func:`stage_memory_start`.
+
+    Returns:
+        Dictionary with 'peak_bytes' (highest traced memory reached during
+        the stage, above its level at the start), 'retained_bytes' (traced
+        memory still held at the end, negative if the stage freed memory)
+        and 'allocated_blocks' (net change in the memory blocks held by
+        Python's object allocator, ``sys.getallocatedblocks``)
+    """
+    started, peak_before, blocks = start
+    current, peak = tracemalloc.get_traced_memory()
+    if not _HAS_RESET_PEAK and peak <= peak_before:
+        # The peak predates the stage
+        peak = current
+    return {
+        'peak_bytes': max(peak - started, 0),
+        'retained_bytes': current - started,
+        'allocated_blocks': sys.getallocatedblocks() - blocks,
+    }
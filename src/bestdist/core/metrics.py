@@ -0,0 +1,402 @@
+"""Process-level fit metrics: counters and fixed-bucket latency histograms."""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from bisect import bisect_left
+import math
+import threading
+
+# Upper bounds (seconds) of the fit latency histogram buckets
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+class _Metric:
+    """
+    Metric family with per-thread value shards.
+
+    Each thread updates its own dict of label values -> value, so updates
+    take no lock; the lock is only taken the first time a thread records.
+    Readers merge the shards.
+    """
+
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._init_shards()
+
+    def _init_shards(self) -> None:
+        self._local = threading.local()
+        self._shards: List[Dict[LabelValues, Any]] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> Dict[LabelValues, Any]:
+        """This thread's values."""
+        try:
+            return self._local.values
+        except AttributeError:
+            values: Dict[LabelValues, Any] = {}
+            with self._lock:
+                self._shards.append(values)
+            self._local.values = values
+            return values
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} takes labels {list(self.labelnames)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _merged(self) -> Dict[LabelValues, Any]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            for shard in self._shards:
+                shard.clear()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks and thread-locals don't pickle: keep the merged values
+        return {
+            'name': self.name,
+            'documentation': self.documentation,
+            'labelnames': self.labelnames,
+            'values': self._merged(),
+            'extra': self._extra_state(),
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.name = state['name']
+        self.documentation = state['documentation']
+        self.labelnames = state['labelnames']
+        self._set_extra_state(state['extra'])
+        self._init_shards()
+        self._shards.append(dict(state['values']))
+
+    def _extra_state(self) -> Any:
+        return None
+
+    def _set_extra_state(self, extra: Any) -> None:
+        pass
+
+
+class Counter(_Metric):
+    """Monotonic counter, e.g. fits per family."""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """
+        Add to the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Value of each label name
+        """
+        key = self._key(labels)
+        shard = self._shard()
+        shard[key] = shard.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Current value for the given labels (0 if never incremented)."""
+        return self._merged().get(self._key(labels), 0)
+
+    def _merged(self) -> Dict[LabelValues, float]:
+        merged: Dict[LabelValues, float] = {}
+        for shard in list(self._shards):
+            for key, value in list(shard.items()):
+                merged[key] = merged.get(key, 0) + value
+        return merged
+
+
+class Histogram(_Metric):
+    """
+    Histogram with fixed bucket bounds, e.g. fit latency per family.
+
+    Quantiles are estimated like Prometheus' ``histogram_quantile``: by
+    linear interpolation inside the bucket holding the quantile.
+    """
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value: Observed value (e.g. seconds)
+            **labels: Value of each label name
+        """
+        key = self._key(labels)
+        shard = self._shard()
+        # Per-bucket counts (last one is +Inf), then sum and count
+        counts = shard.get(key)
+        if counts is None:
+            counts = shard[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-2] += value
+        counts[-1] += 1
+
+    def _merged(self) -> Dict[LabelValues, List[float]]:
+        merged: Dict[LabelValues, List[float]] = {}
+        for shard in list(self._shards):
+            for key, counts in list(shard.items()):
+                total = merged.setdefault(key, [0] * len(counts))
+                for i, count in enumerate(list(counts)):
+                    total[i] += count
+        return merged
+
+    def _extra_state(self) -> Any:
+        return self.buckets
+
+    def _set_extra_state(self, extra: Any) -> None:
+        self.buckets = extra
+
+    def quantile(self, q: float, **labels: Any) -> Optional[float]:
+        """
+        Estimated quantile of the observations for the given labels.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimate, or None without observations. Quantiles in the
+            overflow bucket are reported as the largest bucket bound
+        """
+        counts = self._merged().get(self._key(labels))
+        return None if counts is None else self._quantile(q, counts)
+
+    def _quantile(self, q: float, counts: List[float]) -> Optional[float]:
+        total = counts[-1]
+        if not total:
+            return None
+        rank = q * total
+        cumulative = 0
+        for i, bound in enumerate(self.buckets):
+            if cumulative + counts[i] >= rank and counts[i]:
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (bound - lower) * (rank - cumulative) / counts[i]
+            cumulative += counts[i]
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    """
+    Named counters and histograms, rendered as Prometheus text or a dict.
+
+    DistributionFitter records into the process-wide registry returned by
+    :func:`default_registry` unless given another one:
+
+    - ``bestdist_fits_total{family}``: candidates fitted
+    - ``bestdist_fit_failures_total{family,exception}``: failed fits by
+      exception type (timeouts included)
+    - ``bestdist_fit_seconds{family,n}``: fit latency, with ``n`` the
+      sample size rounded up to a power of ten
+    - ``bestdist_cache_lookups_total{result}``: ResultCache 'hit'/'miss'
+
+    Example:
+        ```python
+        from bestdist.core.metrics import default_registry
+
+        # In the service's /metrics handler
+        body = default_registry().render_prometheus()
+
+        # Or programmatically
+        default_registry().as_dict()['bestdist_fit_seconds']
+        ```
+    """
+
+    def __init__(self):
+        """Create an empty registry."""
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Counter registered under ``name`` (created on first use)."""
+        return self._get(name, Counter, lambda: Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Histogram registered under ``name`` (created on first use)."""
+        return self._get(
+            name, Histogram, lambda: Histogram(name, documentation, labelnames, buckets)
+        )
+
+    def _get(self, name: str, cls: type, create: Callable[[], _Metric]) -> Any:
+        """Registered metric, created on first use; raises ValueError on a type clash."""
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name) or self._metrics.setdefault(name, create())
+        if not isinstance(metric, cls):
+            raise ValueError(f"{name} is already registered as a {metric.kind}")
+        return metric
+
+    def render_prometheus(self) -> str:
+        """
+        All metrics in the Prometheus text exposition format (version 0.0.4).
+
+        Returns:
+            Text ending with a newline
+        """
+        lines: List[str] = []
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for key, value in sorted(metric._merged().items()):
+                labels = list(zip(metric.labelnames, key))
+                if isinstance(metric, Counter):
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(metric.buckets + (math.inf,), value):
+                    cumulative += count
+                    le = _labels(labels + [('le', _number(bound))])
+                    lines.append(f"{name}_bucket{le} {_number(cumulative)}")
+                lines.append(f"{name}_sum{_labels(labels)} {_number(value[-2])}")
+                lines.append(f"{name}_count{_labels(labels)} {_number(value[-1])}")
+        return '\n'.join(lines) + '\n'
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        All metrics as plain data.
+
+        Returns:
+            Mapping of metric name to its 'type', 'help' and 'samples': one
+            per label set, with the 'labels' and either the counter
+            'value' or the histogram 'count', 'sum', cumulative
+            'buckets' (upper bound -> count) and estimated 'p50'/'p99'
+        """
+        output: Dict[str, Dict[str, Any]] = {}
+        for name, metric in sorted(self._metrics.items()):
+            samples = []
+            for key, value in sorted(metric._merged().items()):
+                sample: Dict[str, Any] = {'labels': dict(zip(metric.labelnames, key))}
+                if isinstance(metric, Counter):
+                    sample['value'] = value
+                else:
+                    cumulative, buckets = 0, {}
+                    for bound, count in zip(metric.buckets + (math.inf,), value):
+                        cumulative += count
+                        buckets[bound] = cumulative
+                    sample.update({
+                        'count': value[-1],
+                        'sum': value[-2],
+                        'buckets': buckets,
+                        'p50': metric._quantile(0.5, value),
+                        'p99': metric._quantile(0.99, value),
+                    })
+                samples.append(sample)
+            output[name] = {'type': metric.kind, 'help': metric.documentation, 'samples': samples}
+        return output
+
+    def reset(self) -> None:
+        """Drop all recorded values (metrics stay registered)."""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    def __contains__(self, name: str) -> bool:
+        """True if a metric is registered under ``name``."""
+        return name in self._metrics
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'metrics': dict(self._metrics)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._metrics = state['metrics']
+        self._lock = threading.Lock()
+
+    def __reduce__(self) -> Any:
+        # The process-wide registry unpickles as the receiving process's own
+        if self is _DEFAULT_REGISTRY:
+            return default_registry, ()
+        return super().__reduce__()
+
+    def __repr__(self) -> str:
+        """String representation of the registry."""
+        return f"MetricsRegistry(metrics={sorted(self._metrics)})"
+
+
+_DEFAULT_REGISTRY = MetricsRegistry()
+
+
+def default_registry() -> MetricsRegistry:
+    """The process-wide registry fitters record into by default."""
+    return _DEFAULT_REGISTRY
+
+
+def n_bucket(n: int) -> str:
+    """Sample size label: ``n`` rounded up to a power of ten, e.g. '1e4'."""
+    return f"1e{max(0, math.ceil(math.log10(max(n, 1))))}"
+
+
+def record_fit(registry: MetricsRegistry, family: str, n: int, seconds: Optional[float]) -> None:
+    """Count a fitted candidate and observe its fit latency."""
+    registry.counter(
+        'bestdist_fits_total', 'Candidate distributions fitted.', ('family',)
+    ).inc(family=family)
+    if seconds is not None:
+        registry.histogram(
+            'bestdist_fit_seconds', 'Wall time of candidate fits.', ('family', 'n')
+        ).observe(seconds, family=family, n=n_bucket(n))
+
+
+def record_failure(registry: MetricsRegistry, family: str, error: BaseException) -> None:
+    """Count a failed candidate fit by exception type."""
+    registry.counter(
+        'bestdist_fit_failures_total', 'Candidate fits that failed, by exception type.',
+        ('family', 'exception')
+    ).inc(family=family, exception=type(error).__name__)
+
+
+def record_cache_lookup(registry: MetricsRegistry, hit: bool) -> None:
+    """Count a ResultCache lookup."""
+    registry.counter(
+        'bestdist_cache_lookups_total', 'ResultCache lookups by result.', ('result',)
+    ).inc(result='hit' if hit else 'miss')
+
+
+def _labels(pairs: List[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + '}'
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _escape_help(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    """Prometheus sample value: integers without a decimal point, +Inf spelled out."""
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -0,0 +1,464 @@
+"""Compact fitted models and result tables that don't hold on to the training data."""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
+import importlib
+import json
+import struct
+import numpy as np
+
+from .base_discrete import BaseDiscreteDistribution
+from ..utils.packing import pack, to_builtin, unpack
+from ..utils.types import ArrayLike, FitResult, Parameters
+
+if TYPE_CHECKING:
+    from .base import BaseDistribution
+
+
+def scipy_distribution(family: type) -> Any:
+    """
+    Generic scipy distribution (e.g. ``scipy.stats.gamma``) of a family class.
+
+    The family's ``_get_scipy_dist`` is called on an instance created
+    without ``__init__``, so no data is needed.
+    """
+    return family.__new__(family)._get_scipy_dist()
+
+
+def family_key(family: type) -> str:
+    """
+    Name a distribution class is serialized under.
+
+    Built-in families are stored by name (e.g. ``'Gamma'``), other classes
+    as ``'module:QualifiedName'`` so that they can be imported back.
+    """
+    import bestdist
+
+    path = bestdist._LAZY.get(family.__name__)
+    if path is not None and family.__module__ == 'bestdist' + path:
+        return family.__name__
+    return f"{family.__module__}:{family.__qualname__}"
+
+
+def resolve_family(key: str) -> type:
+    """
+    Distribution class of a :func:`family_key`, imported on demand.
+
+    Raises:
+        ValueError: If the key doesn't name a distribution class
+    """
+    from .base import BaseDistribution
+
+    try:
+        if ':' in key:
+            module_name, qualname = key.split(':', 1)
+            family: Any = importlib.import_module(module_name)
+            for attr in qualname.split('.'):
+                family = getattr(family, attr)
+        else:
+            import bestdist
+            family = getattr(bestdist, key)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Unknown distribution family: {key}") from e
+    if not (
+        isinstance(family, type)
+        and issubclass(family, (BaseDistribution, BaseDiscreteDistribution))
+    ):
+        raise ValueError(f"{key} is not a distribution class")
+    return family
+
+
+class FittedModel:
+    """
+    A fitted distribution reduced to what's needed to evaluate it.
+
+    A distribution object keeps its own copy of the data it was fitted to,
+    so results holding one per candidate keep that many copies alive.
+    A FittedModel holds only the family class, the parameters, summary
+    statistics of the fit and, once it has been evaluated, a cached scipy
+    frozen distribution. It evaluates like the distribution it was made
+    from (``pdf``/``pmf``, ``cdf``, ``ppf``, ``rvs``, ``dist``), and
+    pickles without the frozen distribution.
+
+    Attributes:
+        family: Distribution class, e.g. ``Gamma``
+        name: Name of the distribution
+        params: Fitted parameters
+        stats: Summary statistics of the fit ('n_observations',
+              'test_statistic', 'p_value', 'aic', 'bic' when known)
+        fit_info: Optimizer diagnostics of the fit (None if not fitted here)
+
+    Example:
+        ```python
+        fitter = DistributionFitter(data)
+        model = fitter.fit()[0]['distribution_object']
+        model.pdf([0.5, 1.0]), model.params, model.stats['aic']
+        ```
+    """
+
+    __slots__ = ('family', 'name', 'params', 'stats', 'fit_info', '_frozen')
+
+    FORMAT_VERSION = 1
+    _MAGIC = b'BDFM'
+    _HEADER = struct.Struct('<4sH')
+
+    def __init__(
+        self,
+        family: type,
+        params: Parameters,
+        stats: Optional[Dict[str, Any]] = None,
+        fit_info: Optional[Dict[str, Any]] = None,
+        name: Optional[str] = None
+    ):
+        """
+        Initialize a model from known parameters.
+
+        Args:
+            family: Distribution class the parameters belong to
+            params: Parameters as returned by the family's ``fit()``
+            stats: Summary statistics of the fit
+            fit_info: Optimizer diagnostics of the fit
+            name: Name of the distribution. Defaults to the class name
+        """
+        self.family = family
+        self.name = name or family.__name__
+        self.params = dict(params)
+        self.stats = dict(stats or {})
+        self.fit_info = fit_info
+        self._frozen = None
+
+    @classmethod
+    def from_distribution(
+        cls,
+        dist: Union['BaseDistribution', BaseDiscreteDistribution],
+        **stats: Any
+    ) -> 'FittedModel':
+        """
+        Model of a fitted distribution object, reusing its frozen distribution.
+
+        Args:
+            dist: Fitted distribution
+            **stats: Summary statistics of the fit
+
+        Returns:
+            FittedModel without a reference to the distribution's data
+        """
+        model = cls(type(dist), dist.params, stats, dist.fit_info, dist.name)
+        model._frozen = dist.dist
+        return model
+
+    @property
+    def discrete(self) -> bool:
+        """Whether the family is a discrete distribution."""
+        return issubclass(self.family, BaseDiscreteDistribution)
+
+    @property
+    def dist(self) -> Any:
+        """scipy frozen distribution with the fitted parameters, built on first use."""
+        if self._frozen is None:
+            self._frozen = scipy_distribution(self.family)(**self.params)
+        return self._frozen
+
+    def pdf(self, x: ArrayLike) -> np.ndarray:
+        """
+        Probability density function.
+
+        Raises:
+            AttributeError: If the family is discrete (use :meth:`pmf`)
+        """
+        if self.discrete:
+            raise AttributeError(f"{self.name} is discrete; use pmf()")
+        return self.dist.pdf(x)
+
+    def pmf(self, k: ArrayLike) -> np.ndarray:
+        """
+        Probability mass function.
+
+        Raises:
+            AttributeError: If the family is continuous (use :meth:`pdf`)
+        """
+        if not self.discrete:
+            raise AttributeError(f"{self.name} is continuous; use pdf()")
+        return self.dist.pmf(k)
+
+    def cdf(self, x: ArrayLike) -> np.ndarray:
+        """Cumulative distribution function."""
+        return self.dist.cdf(x)
+
+    def ppf(self, q: ArrayLike) -> np.ndarray:
+        """Percent point function (inverse of CDF)."""
+        return self.dist.ppf(q)
+
+    def rvs(self, size: int = 1, random_state: Optional[int] = None) -> np.ndarray:
+        """Generate random samples from the distribution."""
+        return self.dist.rvs(size=size, random_state=random_state)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the model to a JSON-compatible dictionary."""
+        return {
+            'version': self.FORMAT_VERSION,
+            'family': family_key(self.family),
+            'name': self.name,
+            'params': to_builtin(self.params),
+            'stats': to_builtin(self.stats),
+            'fit_info': to_builtin(self.fit_info),
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'FittedModel':
+        """
+        Rebuild a model from :meth:`to_dict` output, without refitting.
+
+        Raises:
+            ValueError: If the format version or the family is not supported
+        """
+        if state.get('version') != cls.FORMAT_VERSION:
+            raise ValueError(f"Unsupported model version: {state.get('version')}")
+        return cls(
+            resolve_family(state['family']),
+            state['params'],
+            state.get('stats'),
+            state.get('fit_info'),
+            state.get('name')
+        )
+
+    def to_json(self) -> str:
+        """Serialize the model to a JSON string."""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text: str) -> 'FittedModel':
+        """Rebuild a model from a JSON string."""
+        return cls.from_dict(json.loads(text))
+
+    def to_bytes(self) -> bytes:
+        """Serialize the model to a compact little-endian binary payload."""
+        state = self.to_dict()
+        del state['version']
+        return self._HEADER.pack(self._MAGIC, self.FORMAT_VERSION) + pack(state)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> 'FittedModel':
+        """
+        Rebuild a model from :meth:`to_bytes` output.
+
+        Raises:
+            ValueError: If the payload is not a supported model
+        """
+        state = _read_payload(payload, cls._HEADER, cls._MAGIC, cls.FORMAT_VERSION, 'model')
+        return cls.from_dict({'version': cls.FORMAT_VERSION, **state})
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The frozen distribution is rebuilt from the parameters on first use
+        return {name: getattr(self, name) for name in self.__slots__ if name != '_frozen'}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._frozen = None
+
+    def __repr__(self) -> str:
+        """String representation of the model."""
+        param_str = ', '.join(f"{k}={v:.4f}" for k, v in self.params.items())
+        return f"{self.name}({param_str})"
+
+
+class ResultTable:
+    """
+    Ranked fit results reduced to what's needed to publish them.
+
+    Holds, per candidate in the fitter's order, the metrics of its result
+    (status, goodness of fit, AIC/BIC, optimizer diagnostics, ...) and a
+    :class:`FittedModel` for those with parameters, plus the options the
+    fit ran with. It serializes to a versioned JSON or binary form storing
+    only family names, parameters, metrics and options, and loads back
+    without refitting and without importing pandas or matplotlib.
+
+    Attributes:
+        results: Result dictionaries, 'distribution_object' being a
+                FittedModel (or None for candidates without parameters)
+        options: Options of the fit (dist_type, method, fixed parameters,
+                optimizer options, number of observations, ...)
+
+    Example:
+        ```python
+        # Fit job
+        payload = fitter.result_table().to_bytes()
+
+        # Scoring process
+        table = ResultTable.from_bytes(payload)
+        model = table.best('aic')['distribution_object']
+        model.cdf(x)
+        ```
+    """
+
+    FORMAT_VERSION = 1
+    _MAGIC = b'BDRT'
+    _HEADER = struct.Struct('<4sH')
+
+    # Result fields stored, when present
+    FIELDS = (
+        'distribution', 'status', 'parameters', 'n_observations',
+        'test_statistic', 'p_value', 'test_error_bound', 'aic', 'bic',
+        'optimizer', 'converged', 'iterations', 'nfev', 'fit_time',
+        'reason', 'timed_out', 'rung', 'sample_size', 'race_score',
+        'moment_distance', 'cached',
+    )
+    _STATS = ('n_observations', 'test_statistic', 'p_value', 'aic', 'bic')
+    _FIT_INFO = ('optimizer', 'converged', 'iterations', 'nfev', 'fit_time')
+
+    def __init__(self, results: List[FitResult], options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize a table from fit results.
+
+        Args:
+            results: Results as returned by :meth:`DistributionFitter.fit`
+                    (holding FittedModels or distribution objects)
+            options: Options of the fit, JSON-compatible
+        """
+        self.results = [self._reduce(result) for result in results]
+        self.options = to_builtin(dict(options or {}))
+
+    @classmethod
+    def _reduce(cls, result: FitResult) -> FitResult:
+        """A result with only the stored fields and a FittedModel."""
+        model = result.get('distribution_object')
+        if model is not None and not isinstance(model, FittedModel):
+            model = FittedModel.from_distribution(model)
+        row = {name: to_builtin(result[name]) for name in cls.FIELDS if name in result}
+        if model is not None and 'n_observations' in model.stats:
+            row.setdefault('n_observations', model.stats['n_observations'])
+        row['distribution_object'] = model
+        return row
+
+    def best(self, criterion: str = 'p_value') -> Optional[FitResult]:
+        """
+        Best fitted result, as :meth:`DistributionFitter.get_best_distribution`.
+
+        Args:
+            criterion: 'p_value' (higher is better), 'aic' or 'bic' (lower is better)
+
+        Returns:
+            Best result, or None if no candidate was fitted on the full data
+
+        Raises:
+            ValueError: If the criterion is unknown
+        """
+        fitted = [r for r in self.results if r.get('status', 'fitted') == 'fitted']
+        if criterion not in ('p_value', 'aic', 'bic'):
+            raise ValueError(f"Unknown criterion: {criterion}")
+        if not fitted:
+            return None
+        if criterion == 'p_value':
+            return fitted[0]  # Ranked by p-value
+        return min(fitted, key=lambda r: r[criterion])
+
+    @property
+    def models(self) -> Dict[str, FittedModel]:
+        """Models of the fitted candidates by distribution name, best first."""
+        return {
+            r['distribution']: r['distribution_object'] for r in self.results
+            if r.get('status', 'fitted') == 'fitted' and r['distribution_object'] is not None
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the table to a JSON-compatible dictionary."""
+        rows = []
+        for result in self.results:
+            row = {name: result[name] for name in self.FIELDS if name in result}
+            model = result['distribution_object']
+            if model is not None:
+                row['family'] = family_key(model.family)
+                row['parameters'] = to_builtin(model.params)
+            rows.append(row)
+        return {'version': self.FORMAT_VERSION, 'options': self.options, 'results': rows}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'ResultTable':
+        """
+        Rebuild a table from :meth:`to_dict` output, without refitting.
+
+        Raises:
+            ValueError: If the format version or a family is not supported
+        """
+        if state.get('version') != cls.FORMAT_VERSION:
+            raise ValueError(f"Unsupported result table version: {state.get('version')}")
+        table = cls([], state.get('options'))
+        for row in state['results']:
+            row = dict(row)
+            key = row.pop('family', None)
+            model = None
+            if key is not None:
+                model = FittedModel(
+                    resolve_family(key),
+                    row['parameters'],
+                    {name: row[name] for name in cls._STATS if name in row},
+                    {name: row.get(name) for name in cls._FIT_INFO},
+                    row['distribution']
+                )
+            row['distribution_object'] = model
+            table.results.append(row)
+        return table
+
+    def to_json(self) -> str:
+        """Serialize the table to a JSON string."""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text: str) -> 'ResultTable':
+        """Rebuild a table from a JSON string."""
+        return cls.from_dict(json.loads(text))
+
+    def to_bytes(self) -> bytes:
+        """Serialize the table to a compact little-endian binary payload."""
+        state = self.to_dict()
+        del state['version']
+        return self._HEADER.pack(self._MAGIC, self.FORMAT_VERSION) + pack(state)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> 'ResultTable':
+        """
+        Rebuild a table from :meth:`to_bytes` output.
+
+        Raises:
+            ValueError: If the payload is not a supported result table
+        """
+        state = _read_payload(
+            payload, cls._HEADER, cls._MAGIC, cls.FORMAT_VERSION, 'result table'
+        )
+        return cls.from_dict({'version': cls.FORMAT_VERSION, **state})
+
+    def __len__(self) -> int:
+        """Number of candidates."""
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[FitResult]:
+        """Iterate over the results, fitted candidates first."""
+        return iter(self.results)
+
+    def __getitem__(self, index: int) -> FitResult:
+        """Result at a position of the ranking."""
+        return self.results[index]
+
+    def __repr__(self) -> str:
+        """String representation of the table."""
+        return f"ResultTable({len(self.models)} fitted of {len(self.results)} candidates)"
+
+
+def _read_payload(
+    payload: bytes,
+    header: struct.Struct,
+    magic: bytes,
+    version: int,
+    kind: str
+) -> Dict[str, Any]:
+    """Check the header of a binary payload and decode its body."""
+    try:
+        found_magic, found_version = header.unpack_from(payload)
+    except struct.error as e:
+        raise ValueError(f"Not a supported {kind} payload") from e
+    if found_magic != magic or found_version != version:
+        raise ValueError(f"Not a supported {kind} payload")
+    state, end = unpack(payload, header.size)
+    if not isinstance(state, dict) or end != len(payload):
+        raise ValueError(f"Not a supported {kind} payload")
+    return state
@@ -0,0 +1,334 @@
+"""Bounded-memory sampling of data streams."""
+
+from typing import Optional
+import numpy as np
+
+from ..utils.types import ArrayLike
+
+
+class ReservoirSample:
+    """
+    Fixed-size uniform random sample of a stream (Algorithm R).
+
+    Each incoming chunk is processed with vectorized draws: the ``i``-th
+    observation of the stream replaces a random slot with probability
+    ``capacity / i``, so at any point every observation seen so far is in
+    the sample with equal probability.
+
+    Attributes:
+        capacity: Maximum number of retained observations
+        n_seen: Number of observations offered to the reservoir
+
+    Example:
+        ```python
+        from bestdist.core.sampling import ReservoirSample
+
+        reservoir = ReservoirSample(100_000, random_state=0)
+        for chunk in chunks:
+            reservoir.update(chunk)
+        sample = reservoir.sample
+        ```
+    """
+
+    def __init__(self, capacity: int, random_state: Optional[int] = None):
+        """
+        Initialize an empty reservoir.
+
+        Args:
+            capacity: Maximum number of retained observations
+            random_state: Random seed for reproducibility
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = int(capacity)
+        self.n_seen = 0
+        self._buffer: Optional[np.ndarray] = None
+        self._rng = np.random.default_rng(random_state)
+
+    def update(self, chunk: ArrayLike) -> 'ReservoirSample':
+        """
+        Offer a chunk of observations to the reservoir.
+
+        Args:
+            chunk: Observations (already cleaned of missing values)
+
+        Returns:
+            The reservoir itself, to allow chaining
+        """
+        arr = np.asarray(chunk).ravel()
+        if arr.size == 0:
+            return self
+        if self._buffer is None:
+            self._buffer = np.empty(self.capacity, dtype=arr.dtype)
+
+        # Fill the free slots first
+        filled = min(self.n_seen, self.capacity)
+        n_fill = min(self.capacity - filled, arr.size)
+        if n_fill:
+            self._buffer[filled:filled + n_fill] = arr[:n_fill]
+        rest = arr[n_fill:]
+        start = self.n_seen + n_fill
+
+        if rest.size:
+            # Observation number i (1-based) lands in slot j ~ U{0, i-1} if j < capacity
+            positions = np.arange(start + 1, start + rest.size + 1)
+            slots = self._rng.integers(0, positions)
+            accepted = slots < self.capacity
+            # Later observations overwrite earlier ones, as in the sequential algorithm
+            self._buffer[slots[accepted]] = rest[accepted]
+
+        self.n_seen += int(arr.size)
+        return self
+
+    def merge(self, other: 'ReservoirSample') -> 'ReservoirSample':
+        """
+        Merge another reservoir (e.g. from another worker) into this one.
+
+        The merged sample is a uniform sample of the union of both streams:
+        the number of items taken from each side is hypergeometric in the
+        stream sizes.
+
+        Args:
+            other: Reservoir to merge
+
+        Returns:
+            The reservoir itself, to allow chaining
+        """
+        if other.n_seen == 0:
+            return self
+        if self.n_seen == 0:
+            # Subsample the other side down to this reservoir's capacity
+            theirs = other.sample
+            size = min(self.capacity, len(theirs))
+            self._buffer = np.empty(self.capacity, dtype=theirs.dtype)
+            self._buffer[:size] = self._rng.choice(theirs, size, replace=False)
+            self.n_seen = other.n_seen
+            return self
+
+        mine, theirs = self.sample, other.sample
+        size = min(self.capacity, self.n_seen + other.n_seen)
+        n_mine = int(self._rng.hypergeometric(self.n_seen, other.n_seen, size))
+        n_mine = min(n_mine, len(mine))
+        n_theirs = min(size - n_mine, len(theirs))
+
+        merged = np.concatenate([
+            self._rng.choice(mine, n_mine, replace=False),
+            self._rng.choice(theirs, n_theirs, replace=False),
+        ])
+        self._buffer = np.empty(self.capacity, dtype=merged.dtype)
+        self._buffer[:len(merged)] = merged
+        self.n_seen += other.n_seen
+        return self
+
+    @property
+    def sample(self) -> np.ndarray:
+        """Currently retained observations."""
+        if self._buffer is None:
+            return np.empty(0)
+        return self._buffer[:min(self.n_seen, self.capacity)]
+
+    @property
+    def is_complete(self) -> bool:
+        """True if every observation seen so far is retained."""
+        return self.n_seen <= self.capacity
+
+    def __len__(self) -> int:
+        """Number of retained observations."""
+        return min(self.n_seen, self.capacity)
+
+    def __repr__(self) -> str:
+        """String representation of the reservoir."""
+        return f"ReservoirSample(capacity={self.capacity}, n_seen={self.n_seen})"
+
+
+# Extreme values kept on each side of a stratified sample
+DEFAULT_TAIL_SIZE = 1_000
+
+
+class StratifiedSample:
+    """
+    Uniform reservoir plus the exact extremes of a stream.
+
+    A uniform sample rarely contains the most extreme observations, which
+    are exactly where heavy-tailed candidates (Cauchy, Student-t) differ
+    from light-tailed ones. Alongside a ReservoirSample of the whole
+    stream, the ``tail_size`` smallest and ``tail_size`` largest values are
+    kept exactly, so statistics can be estimated by strata: tail points
+    with weight one and the remaining body points with weight
+    ``n_body / m_body``.
+
+    Attributes:
+        reservoir: Uniform sample of the whole stream
+        tail_size: Number of extremes kept on each side
+
+    Example:
+        ```python
+        from bestdist.core.sampling import StratifiedSample
+
+        # At most 64 MB of float64 values
+        sample = StratifiedSample.from_budget(64 * 2**20, random_state=0)
+        for chunk in chunks:
+            sample.update(chunk)
+        body, tail = sample.sample, sample.tail
+        ```
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        tail_size: int = DEFAULT_TAIL_SIZE,
+        random_state: Optional[int] = None
+    ):
+        """
+        Initialize an empty stratified sample.
+
+        Args:
+            capacity: Size of the uniform reservoir
+            tail_size: Number of extremes kept on each side
+            random_state: Random seed for the reservoir
+
+        Raises:
+            ValueError: If tail_size is negative or the reservoir is smaller
+                        than both tails together
+        """
+        if tail_size < 0:
+            raise ValueError(f"tail_size must be non-negative, got {tail_size}")
+        if capacity < 2 * tail_size:
+            raise ValueError(
+                f"capacity ({capacity}) must be at least twice tail_size ({tail_size})"
+            )
+        self.reservoir = ReservoirSample(capacity, random_state=random_state)
+        self.tail_size = int(tail_size)
+        self._lower: Optional[np.ndarray] = None
+        self._upper: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_budget(
+        cls,
+        max_memory: int,
+        dtype: np.dtype = np.float64,
+        tail_size: int = DEFAULT_TAIL_SIZE,
+        random_state: Optional[int] = None
+    ) -> 'StratifiedSample':
+        """
+        Size a stratified sample to fit a memory budget.
+
+        Args:
+            max_memory: Budget in bytes for the reservoir and both tails
+            dtype: Data type of the retained values
+            tail_size: Number of extremes kept on each side
+            random_state: Random seed for the reservoir
+
+        Returns:
+            Empty sample whose retained values take at most ``max_memory`` bytes
+
+        Raises:
+            ValueError: If the budget cannot hold the tails plus a reservoir
+                        at least as large as them
+        """
+        n_items = int(max_memory) // np.dtype(dtype).itemsize
+        capacity = n_items - 2 * tail_size
+        if capacity < 2 * tail_size:
+            raise ValueError(
+                f"max_memory of {max_memory} bytes is too small for "
+                f"tail_size={tail_size}; it must hold at least {4 * tail_size} values"
+            )
+        return cls(capacity, tail_size=tail_size, random_state=random_state)
+
+    def update(self, chunk: ArrayLike) -> 'StratifiedSample':
+        """
+        Offer a chunk of observations to the reservoir and the tails.
+
+        Args:
+            chunk: Observations (already cleaned of missing values)
+
+        Returns:
+            The sample itself, to allow chaining
+        """
+        arr = np.asarray(chunk).ravel()
+        if arr.size == 0:
+            return self
+        self.reservoir.update(arr)
+        self._update_tails(arr, arr)
+        return self
+
+    def merge(self, other: 'StratifiedSample') -> 'StratifiedSample':
+        """
+        Merge another stratified sample (e.g. from another worker) into this one.
+
+        Args:
+            other: Sample to merge; must keep the same tail size
+
+        Returns:
+            The sample itself, to allow chaining
+
+        Raises:
+            ValueError: If the tail sizes differ
+        """
+        if other.tail_size != self.tail_size:
+            raise ValueError(
+                f"Cannot merge samples with tail sizes {self.tail_size} and {other.tail_size}"
+            )
+        if other.n_seen == 0:
+            return self
+        self.reservoir.merge(other.reservoir)
+        self._update_tails(other._lower, other._upper)
+        return self
+
+    def _update_tails(self, lower: np.ndarray, upper: np.ndarray) -> None:
+        """Keep the ``tail_size`` smallest and largest values seen so far."""
+        k = self.tail_size
+        if k == 0:
+            return
+        if self._lower is not None:
+            lower = np.concatenate([self._lower, lower])
+            upper = np.concatenate([self._upper, upper])
+        if len(lower) > k:
+            lower = np.partition(lower, k - 1)[:k]
+        if len(upper) > k:
+            upper = np.partition(upper, len(upper) - k)[-k:]
+        # Own the buffers rather than keeping views of caller chunks alive
+        self._lower = np.array(lower)
+        self._upper = np.array(upper)
+
+    @property
+    def n_seen(self) -> int:
+        """Number of observations offered to the sample."""
+        return self.reservoir.n_seen
+
+    @property
+    def sample(self) -> np.ndarray:
+        """Uniform sample of the whole stream."""
+        return self.reservoir.sample
+
+    @property
+    def tail(self) -> np.ndarray:
+        """
+        Sorted extremes of the stream (both sides).
+
+        Empty while the reservoir still holds every observation, since the
+        extremes are then already part of the sample.
+        """
+        if self._lower is None or self.reservoir.is_complete:
+            return np.empty(0, dtype=self.sample.dtype)
+        return np.sort(np.concatenate([self._lower, self._upper]))
+
+    @property
+    def nbytes(self) -> int:
+        """Maximum memory taken by the retained values."""
+        itemsize = self.sample.dtype.itemsize
+        return (self.reservoir.capacity + 2 * self.tail_size) * itemsize
+
+    def __len__(self) -> int:
+        """Number of retained observations (reservoir and tails)."""
+        return len(self.reservoir) + len(self.tail)
+
+    def __repr__(self) -> str:
+        """String representation of the sample."""
+        return (
+            f"StratifiedSample(capacity={self.reservoir.capacity}, "
+            f"tail_size={self.tail_size}, n_seen={self.n_seen})"
+        )
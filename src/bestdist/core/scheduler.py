@@ -0,0 +1,329 @@
+"""Runtime cost model and longest-processing-time-first scheduling of fits."""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+import heapq
+import json
+import os
+import time
+import warnings
+from pathlib import Path
+import numpy as np
+
+# (seconds of overhead, seconds per observation) of one fit() call,
+# measured on lognormal/Poisson data with scipy 1.x on a single core
+DEFAULT_COEFFICIENTS: Dict[str, Tuple[float, float]] = {
+    'Normal': (1e-3, 2e-8),
+    'Gamma': (2e-2, 8.5e-6),
+    'Beta': (7e-2, 3.3e-5),
+    'Weibull': (2e-2, 8e-6),
+    'Lognormal': (3e-3, 5.5e-7),
+    'Exponential': (1e-3, 1e-8),
+    'Uniform': (1e-3, 1e-8),
+    'Cauchy': (1e-2, 5.2e-6),
+    'StudentT': (8e-2, 5.2e-5),
+    'Poisson': (1e-3, 1e-8),
+    'Binomial': (1e-3, 2e-8),
+    'NegativeBinomial': (1e-3, 2e-8),
+    'Geometric': (1e-3, 1e-8),
+}
+
+# Used for families the model has never seen
+UNKNOWN_COEFFICIENTS = (1e-2, 5e-6)
+
+COST_MODEL_VERSION = 1
+
+Family = Union[str, type]
+
+
+def _family_name(family: Family) -> str:
+    """Name under which a distribution class is modelled."""
+    return family if isinstance(family, str) else family.__name__
+
+
+def default_cost_model_path() -> Path:
+    """
+    Location of the locally saved cost model.
+
+    ``$XDG_CACHE_HOME/bestdist/cost_model.json``, defaulting to
+    ``~/.cache/bestdist/cost_model.json``.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'bestdist' / 'cost_model.json'
+
+
+class CostModel:
+    """
+    Predicted runtime of fitting a distribution family to n observations.
+
+    Each family has a linear model ``seconds = overhead + per_point * n``.
+    Built-in coefficients give a sensible ordering out of the box;
+    :meth:`calibrate` measures them on the current machine and
+    :meth:`save` stores them for later sessions.
+
+    Example:
+        ```python
+        from bestdist.core.scheduler import CostModel
+
+        model = CostModel.calibrate()
+        model.save()
+
+        # Later sessions pick up the calibrated coefficients
+        model = CostModel.load()
+        model.predict('Beta', 1_000_000)
+        ```
+    """
+
+    def __init__(self, coefficients: Optional[Dict[str, Tuple[float, float]]] = None):
+        """
+        Initialize the model.
+
+        Args:
+            coefficients: Mapping of family name to (overhead seconds,
+                          seconds per observation). Families not listed use
+                          the built-in defaults
+        """
+        self.coefficients: Dict[str, Tuple[float, float]] = dict(DEFAULT_COEFFICIENTS)
+        if coefficients:
+            self.coefficients.update(
+                {name: (float(a), float(b)) for name, (a, b) in coefficients.items()}
+            )
+
+    def predict(self, family: Family, n: int) -> float:
+        """
+        Predict the runtime of one fit.
+
+        Args:
+            family: Distribution class or its name
+            n: Number of observations
+
+        Returns:
+            Predicted seconds
+        """
+        overhead, per_point = self.coefficients.get(_family_name(family), UNKNOWN_COEFFICIENTS)
+        return overhead + per_point * n
+
+    @classmethod
+    def calibrate(
+        cls,
+        distributions: Optional[Sequence[type]] = None,
+        sizes: Sequence[int] = (1_000, 4_000, 16_000),
+        random_state: Optional[int] = 0
+    ) -> 'CostModel':
+        """
+        Measure runtime coefficients on this machine.
+
+        Every family is fitted once per size, continuous families to
+        lognormal data and discrete ones to Poisson counts, and a
+        non-negative line is fitted through the timings.
+
+        Args:
+            distributions: Distribution classes to calibrate. Defaults to
+                           all built-in continuous and discrete families
+            sizes: Sample sizes to time
+            random_state: Random seed for the benchmark data
+
+        Returns:
+            Calibrated model (not saved; call :meth:`save`)
+        """
+        from ..core.base_discrete import BaseDiscreteDistribution
+
+        if distributions is None:
+            from ..core.fitter import DistributionFitter
+            distributions = (
+                DistributionFitter.DEFAULT_CONTINUOUS_DISTRIBUTIONS
+                + DistributionFitter.DEFAULT_DISCRETE_DISTRIBUTIONS
+            )
+
+        rng = np.random.default_rng(random_state)
+        continuous = {n: rng.lognormal(0, 0.5, size=n) for n in sizes}
+        discrete = {n: rng.poisson(4, size=n) for n in sizes}
+        sizes_arr = np.asarray(sizes, dtype=float)
+        design = np.column_stack([np.ones_like(sizes_arr), sizes_arr])
+
+        coefficients = {}
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', category=RuntimeWarning)
+            for dist_class in distributions:
+                is_discrete = issubclass(dist_class, BaseDiscreteDistribution)
+                timings = []
+                for n in sizes:
+                    data = discrete[n] if is_discrete else continuous[n]
+                    start = time.perf_counter()
+                    try:
+                        dist_class(data).fit()
+                    except Exception:
+                        pass
+                    timings.append(time.perf_counter() - start)
+                solution, *_ = np.linalg.lstsq(design, np.asarray(timings), rcond=None)
+                overhead = max(float(solution[0]), 0.0)
+                per_point = max(float(solution[1]), 0.0)
+                coefficients[dist_class.__name__] = (overhead, per_point)
+        return cls(coefficients)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the model to a JSON-compatible dictionary."""
+        return {
+            'version': COST_MODEL_VERSION,
+            'coefficients': {name: list(c) for name, c in self.coefficients.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'CostModel':
+        """
+        Restore a model from :meth:`to_dict` output.
+
+        Raises:
+            ValueError: If the format version is not supported
+        """
+        if state.get('version') != COST_MODEL_VERSION:
+            raise ValueError(f"Unsupported cost model version: {state.get('version')}")
+        return cls({name: tuple(c) for name, c in state['coefficients'].items()})
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Save the model as JSON.
+
+        Args:
+            path: Target file. Defaults to :func:`default_cost_model_path`
+
+        Returns:
+            Path written to
+        """
+        path = Path(path) if path is not None else default_cost_model_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+        return path
+
+    @classmethod
+    def load(cls, path: Optional[Union[str, Path]] = None) -> 'CostModel':
+        """
+        Load a saved model, falling back to the built-in coefficients.
+
+        Args:
+            path: Model file. Defaults to :func:`default_cost_model_path`
+
+        Returns:
+            Saved model, or the default model if none is saved or it can't
+            be read
+        """
+        path = Path(path) if path is not None else default_cost_model_path()
+        try:
+            return cls.from_dict(json.loads(path.read_text()))
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls()
+
+    def __repr__(self) -> str:
+        """String representation of the model."""
+        return f"CostModel(families={len(self.coefficients)})"
+
+
+class ScheduledTask:
+    """
+    One fit placed on a worker by :func:`lpt_schedule`.
+
+    Attributes:
+        group: Dataset the task belongs to
+        family: Distribution class (or name)
+        n: Number of observations
+        cost: Predicted seconds
+        worker: Index of the worker it is assigned to
+        start: Predicted start time (seconds from the beginning)
+        finish: Predicted finish time
+    """
+
+    def __init__(self, group: Hashable, family: Family, n: int, cost: float):
+        """Initialize an unassigned task."""
+        self.group = group
+        self.family = family
+        self.n = n
+        self.cost = cost
+        self.worker = -1
+        self.start = 0.0
+        self.finish = 0.0
+
+    def __repr__(self) -> str:
+        """String representation of the task."""
+        return (
+            f"ScheduledTask({self.group!r}, {_family_name(self.family)}, "
+            f"worker={self.worker}, finish={self.finish:.3g}s)"
+        )
+
+
+class Schedule:
+    """
+    Dispatch order and predicted timeline of a set of fits.
+
+    Attributes:
+        tasks: Tasks in dispatch order (longest predicted first)
+        n_workers: Number of parallel workers
+    """
+
+    def __init__(self, tasks: List[ScheduledTask], n_workers: int):
+        """Initialize from tasks already assigned to workers."""
+        self.tasks = tasks
+        self.n_workers = n_workers
+
+    @property
+    def makespan(self) -> float:
+        """Predicted seconds until every fit has finished."""
+        return max((task.finish for task in self.tasks), default=0.0)
+
+    @property
+    def time_to_first_result(self) -> float:
+        """Predicted seconds until the first fit finishes."""
+        return min((task.finish for task in self.tasks), default=0.0)
+
+    def first_result(self, group: Hashable) -> float:
+        """Predicted seconds until the first fit of a dataset finishes."""
+        return min(task.finish for task in self.tasks if task.group == group)
+
+    def completion(self, group: Hashable) -> float:
+        """Predicted seconds until every fit of a dataset has finished."""
+        return max(task.finish for task in self.tasks if task.group == group)
+
+    def __repr__(self) -> str:
+        """String representation of the schedule."""
+        return (
+            f"Schedule(tasks={len(self.tasks)}, n_workers={self.n_workers}, "
+            f"makespan={self.makespan:.3g}s)"
+        )
+
+
+def lpt_schedule(
+    tasks: Iterable[Tuple[Hashable, Family, int]],
+    n_workers: int,
+    cost_model: Optional[CostModel] = None
+) -> Schedule:
+    """
+    Order fits longest-processing-time first and predict their timeline.
+
+    Tasks from all datasets are sorted by predicted runtime, longest first,
+    and each is given to the worker that frees up earliest. This keeps a
+    long Beta or Student-t fit from starting last and leaving the other
+    workers idle; the makespan is within 4/3 of optimal.
+
+    Args:
+        tasks: (dataset key, distribution class or name, n) triples
+        n_workers: Number of parallel workers
+        cost_model: Runtime model. Defaults to :meth:`CostModel.load`
+
+    Returns:
+        Schedule with tasks in dispatch order
+    """
+    if cost_model is None:
+        cost_model = CostModel.load()
+    n_workers = max(int(n_workers), 1)
+
+    scheduled = [
+        ScheduledTask(group, family, n, cost_model.predict(family, n))
+        for group, family, n in tasks
+    ]
+    # Stable sort: equal costs keep their submission order
+    scheduled.sort(key=lambda task: task.cost, reverse=True)
+
+    free_at = [(0.0, worker) for worker in range(n_workers)]
+    for task in scheduled:
+        start, worker = heapq.heappop(free_at)
+        task.worker, task.start, task.finish = worker, start, start + task.cost
+        heapq.heappush(free_at, (task.finish, worker))
+    return Schedule(scheduled, n_workers)
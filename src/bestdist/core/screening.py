@@ -0,0 +1,316 @@
+"""Moment-based pre-screening of candidate distributions."""
+
+from typing import Callable, Dict, List, Optional, Tuple, Type
+import numpy as np
+
+from ..core.histogram import CountHistogram
+from ..utils.io import iter_array_chunks
+
+SCREENING_MODES = ('off', 'conservative', 'aggressive')
+
+# (skewness margin, kurtosis margin, z-score on sampling error) per mode.
+# Margins are in units of asinh(skewness) and log(kurtosis): heavy tails
+# make both moments vary by orders of magnitude, so errors are relative
+CONTINUOUS_TOLERANCES: Dict[str, Tuple[float, float, float]] = {
+    'conservative': (1.0, 0.75, 3.0),
+    'aggressive': (0.5, 0.35, 2.0),
+}
+
+# (dispersion index margin, z-score on sampling error) per mode
+DISCRETE_TOLERANCES: Dict[str, Tuple[float, float]] = {
+    'conservative': (0.5, 3.0),
+    'aggressive': (0.15, 2.0),
+}
+
+
+class DataProfile:
+    """
+    Moments and bounds of a dataset, computed once for screening.
+
+    Kurtosis is the Pearson (non-excess) kurtosis used on Cullen-Frey
+    graphs: 3 for the normal distribution, 1.8 for the uniform.
+
+    Attributes:
+        n: Number of observations
+        mean: Sample mean
+        variance: Sample variance (population form)
+        skewness: Sample skewness
+        kurtosis: Sample kurtosis (non-excess)
+        minimum: Smallest observation
+        maximum: Largest observation
+    """
+
+    def __init__(
+        self,
+        n: int,
+        mean: float,
+        variance: float,
+        skewness: float,
+        kurtosis: float,
+        minimum: float,
+        maximum: float
+    ):
+        """Initialize a profile from precomputed statistics."""
+        self.n = n
+        self.mean = mean
+        self.variance = variance
+        self.skewness = skewness
+        self.kurtosis = kurtosis
+        self.minimum = minimum
+        self.maximum = maximum
+
+    @classmethod
+    def from_data(cls, data: np.ndarray, chunk_size: int = 1 << 20) -> 'DataProfile':
+        """
+        Profile an array, accumulating central moments in float64 chunks.
+
+        Args:
+            data: Flat array of observations
+            chunk_size: Number of values per chunk
+
+        Returns:
+            Profile of the data
+        """
+        n = len(data)
+        mean = float(np.mean(data, dtype=np.float64))
+        m2 = m3 = m4 = 0.0
+        for chunk in iter_array_chunks(data, chunk_size):
+            centered = np.asarray(chunk, dtype=np.float64) - mean
+            squared = centered * centered
+            m2 += float(squared.sum())
+            m3 += float((squared * centered).sum())
+            m4 += float((squared * squared).sum())
+        return cls._from_moments(n, mean, m2 / n, m3 / n, m4 / n, data.min(), data.max())
+
+    @classmethod
+    def from_histogram(cls, histogram: CountHistogram) -> 'DataProfile':
+        """
+        Profile count data from its frequency table.
+
+        Args:
+            histogram: Histogram of the data
+
+        Returns:
+            Profile of the data
+        """
+        values, counts = histogram.frequencies()
+        values = values.astype(np.float64)
+        weights = counts / counts.sum()
+        mean = float(np.dot(weights, values))
+        centered = values - mean
+        return cls._from_moments(
+            int(counts.sum()),
+            mean,
+            float(np.dot(weights, centered ** 2)),
+            float(np.dot(weights, centered ** 3)),
+            float(np.dot(weights, centered ** 4)),
+            values.min(),
+            values.max()
+        )
+
+    @classmethod
+    def _from_moments(
+        cls,
+        n: int,
+        mean: float,
+        m2: float,
+        m3: float,
+        m4: float,
+        minimum: float,
+        maximum: float
+    ) -> 'DataProfile':
+        """Build a profile from raw central moments."""
+        if m2 > 0:
+            skewness = m3 / m2 ** 1.5
+            kurtosis = m4 / m2 ** 2
+        else:
+            skewness, kurtosis = 0.0, np.nan
+        return cls(n, mean, m2, skewness, kurtosis, float(minimum), float(maximum))
+
+    def __repr__(self) -> str:
+        """String representation of the profile."""
+        return (
+            f"DataProfile(n={self.n}, mean={self.mean:.4g}, "
+            f"skewness={self.skewness:.4g}, kurtosis={self.kurtosis:.4g})"
+        )
+
+
+def _gamma_curve() -> np.ndarray:
+    """(skewness, kurtosis) of the gamma family over its shape parameter."""
+    a = np.logspace(-3, 4, 400)
+    return np.column_stack([2 / np.sqrt(a), 3 + 6 / a])
+
+
+def _lognormal_curve() -> np.ndarray:
+    """(skewness, kurtosis) of the lognormal family over its shape parameter."""
+    w = np.exp(np.linspace(1e-3, 4, 800) ** 2)
+    return np.column_stack([
+        (w + 2) * np.sqrt(w - 1),
+        w ** 4 + 2 * w ** 3 + 3 * w ** 2 - 3
+    ])
+
+
+def _weibull_curve() -> np.ndarray:
+    """(skewness, kurtosis) of the Weibull family over its shape parameter."""
+    from scipy.special import gamma
+
+    c = np.logspace(-1, 2, 400)
+    g1, g2, g3, g4 = (gamma(1 + k / c) for k in range(1, 5))
+    variance = g2 - g1 ** 2
+    skewness = (g3 - 3 * g1 * g2 + 2 * g1 ** 3) / variance ** 1.5
+    kurtosis = (g4 - 4 * g1 * g3 + 6 * g1 ** 2 * g2 - 3 * g1 ** 4) / variance ** 2
+    return np.column_stack([skewness, kurtosis])
+
+
+# Feasible (skewness, kurtosis) sets of families with a fixed moment shape:
+# single points or curves traced by the shape parameter
+_MOMENT_POINTS: Dict[str, Callable[[], np.ndarray]] = {
+    'Normal': lambda: np.array([[0.0, 3.0]]),
+    'Uniform': lambda: np.array([[0.0, 1.8]]),
+    'Exponential': lambda: np.array([[2.0, 9.0]]),
+    'Gamma': _gamma_curve,
+    'Lognormal': _lognormal_curve,
+    'Weibull': _weibull_curve,
+}
+_curve_cache: Dict[str, np.ndarray] = {}
+
+
+def _continuous_distance(name: str, profile: DataProfile, mode: str) -> Optional[float]:
+    """
+    Distance from the data to a family's moment region, in tolerance units.
+
+    Skewness is compared on an asinh scale and kurtosis on a log scale.
+    Sample moments of heavy-tailed data fall far short of the population
+    ones (a sample of n values has skewness below sqrt(n) and kurtosis
+    below n), so each family's moments are capped at those bounds first.
+
+    Returns None for families without a known region (never skipped).
+    """
+    margin_s, margin_k, z = CONTINUOUS_TOLERANCES[mode]
+    tol_s = margin_s + z * np.sqrt(6 / profile.n)
+    # Relative standard error of the kurtosis of normal data
+    tol_k = margin_k + z * np.sqrt(24 / profile.n) / 3
+    skewness, log_kurtosis = profile.skewness, np.log(profile.kurtosis)
+
+    if name in _MOMENT_POINTS:
+        if name not in _curve_cache:
+            _curve_cache[name] = _MOMENT_POINTS[name]()
+        points = _curve_cache[name]
+        distances = np.hypot(
+            (np.arcsinh(np.minimum(points[:, 0], np.sqrt(profile.n))) - np.arcsinh(skewness))
+            / tol_s,
+            (np.log(np.minimum(points[:, 1], profile.n)) - log_kurtosis) / tol_k
+        )
+        return float(distances.min())
+    if name == 'Beta':
+        # Between the lower bound of all distributions and the gamma line
+        upper = np.log(3 + 1.5 * skewness ** 2)
+        lower = np.log(1 + skewness ** 2)
+        return float(max(log_kurtosis - upper, lower - log_kurtosis, 0.0) / tol_k)
+    if name in ('StudentT', 'Cauchy'):
+        # Sample moments of heavy tails are unstable; only flat data is far
+        return float(max(np.log(3) - log_kurtosis, 0.0) / tol_k)
+    return None
+
+
+def _discrete_distance(name: str, profile: DataProfile, mode: str) -> Optional[float]:
+    """
+    Distance from the data's dispersion index to a family's, in tolerance units.
+
+    Returns None for families without a known dispersion (never skipped).
+    """
+    margin, z = DISCRETE_TOLERANCES[mode]
+    tol = margin + z * np.sqrt(2 / profile.n)
+    dispersion = profile.variance / profile.mean
+
+    if name == 'Poisson':
+        return abs(dispersion - 1) / tol
+    if name == 'Binomial':
+        return max(dispersion - 1, 0.0) / tol
+    if name == 'NegativeBinomial':
+        return max(1 - dispersion, 0.0) / tol
+    if name == 'Geometric':
+        # Support {1, 2, ...} with p = 1/mean: variance/mean = mean - 1
+        expected = profile.mean - 1
+        return abs(dispersion - expected) / (tol * max(1.0, expected))
+    return None
+
+
+def _support_violation(name: str, profile: DataProfile, discrete: bool) -> Optional[str]:
+    """Reason a family cannot produce the observed values, if any."""
+    if not discrete:
+        return None
+    if profile.minimum < 0:
+        return f"negative values (min={profile.minimum:g}) outside the support of {name}"
+    if name == 'Geometric' and profile.minimum < 1:
+        return f"values below 1 (min={profile.minimum:g}) outside the support of Geometric"
+    return None
+
+
+def screen_candidates(
+    candidates: List[Type],
+    profile: DataProfile,
+    mode: str,
+    discrete: bool = False
+) -> Tuple[List[Type], List[Tuple[Type, str, Optional[float]]]]:
+    """
+    Split candidates into those worth fitting and those that can be skipped.
+
+    Continuous candidates are placed on a Cullen-Frey style map of
+    (skewness, kurtosis): a family is skipped when the data's moments are
+    more than one tolerance unit away from every moment combination the
+    family can produce. Discrete candidates are compared by dispersion
+    index (variance / mean). Candidates whose support excludes observed
+    values are always skipped. Tolerances combine a fixed margin, for
+    misspecification, with the sampling error of the moments; 'aggressive'
+    uses tighter ones than 'conservative'. Families without a known
+    moment region are never skipped.
+
+    Args:
+        candidates: Distribution classes
+        profile: Profile of the data
+        mode: 'off', 'conservative' or 'aggressive'
+        discrete: If True, candidates are discrete distributions
+
+    Returns:
+        Tuple of (kept candidate classes, list of (skipped class, reason,
+        distance in tolerance units or None for support violations))
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode not in SCREENING_MODES:
+        raise ValueError(f"Unknown screening mode: {mode}. Use one of {SCREENING_MODES}")
+    if mode == 'off':
+        return list(candidates), []
+
+    kept: List[Type] = []
+    skipped: List[Tuple[Type, str, Optional[float]]] = []
+    for dist_class in candidates:
+        name = dist_class.__name__
+        violation = _support_violation(name, profile, discrete)
+        if violation is not None:
+            skipped.append((dist_class, violation, None))
+            continue
+
+        distance = None
+        if profile.variance > 0 and profile.n > 3:
+            if discrete:
+                if profile.mean > 0:
+                    distance = _discrete_distance(name, profile, mode)
+            else:
+                distance = _continuous_distance(name, profile, mode)
+
+        if distance is not None and distance > 1:
+            if discrete:
+                moments = f"dispersion index {profile.variance / profile.mean:.3g}"
+            else:
+                moments = f"skewness {profile.skewness:.3g}, kurtosis {profile.kurtosis:.3g}"
+            skipped.append((
+                dist_class,
+                f"{moments} is {distance:.1f} tolerance units from the {name} family",
+                distance
+            ))
+        else:
+            kept.append(dist_class)
+    return kept, skipped
@@ -0,0 +1,142 @@
+"""Streaming fitters that accumulate data summaries chunk by chunk."""
+
+from typing import Iterable, List, Optional, Type, Union
+
+from .base_discrete import BaseDiscreteDistribution
+from .fitter import DistributionFitter
+from .histogram import CountHistogram
+from ..utils.types import ArrayLike, FitResult
+
+
+class StreamingDiscreteFitter(DistributionFitter):
+    """
+    Exact discrete fitter over an incrementally built count histogram.
+
+    Count data is summarized losslessly by its frequency table, so every
+    discrete candidate and the chi-square / KS tests can run from the
+    histogram alone. Data is fed chunk by chunk with ``update`` (or combined
+    from several workers with ``merge``) and fitting happens on demand, using
+    memory proportional to the number of distinct values rather than the
+    number of observations.
+
+    Example:
+        ```python
+        from bestdist import StreamingDiscreteFitter
+
+        fitter = StreamingDiscreteFitter()
+        for chunk in read_event_counts():
+            fitter.update(chunk)
+
+        best = fitter.get_best_distribution()
+        print(best['distribution'], best['parameters'])
+        ```
+    """
+
+    def __init__(
+        self,
+        distributions: Optional[List[Type[BaseDiscreteDistribution]]] = None,
+        method: Optional[str] = None,
+        max_bins: int = CountHistogram.DEFAULT_MAX_BINS
+    ):
+        """
+        Initialize an empty streaming fitter.
+
+        Args:
+            distributions: Discrete distribution classes to try.
+                          If None, uses the default discrete candidates
+            method: Goodness-of-fit test method ('chi2' or 'ks').
+                   If None, uses 'chi2'
+            max_bins: Number of dense histogram bins; larger values are
+                     kept in a sparse overflow table
+        """
+        super().__init__(
+            CountHistogram(max_bins=max_bins),
+            distributions=distributions,
+            dist_type='discrete',
+            method=method
+        )
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[ArrayLike], **kwargs) -> 'StreamingDiscreteFitter':
+        """
+        Build a fitter by consuming an iterable of data chunks.
+
+        Args:
+            chunks: Iterable yielding arrays of counts
+            **kwargs: Passed to the constructor
+
+        Returns:
+            Fitter holding the histogram of all chunks
+        """
+        fitter = cls(**kwargs)
+        for chunk in chunks:
+            fitter.update(chunk)
+        return fitter
+
+    @property
+    def histogram(self) -> CountHistogram:
+        """Histogram of all data seen so far."""
+        return self.data
+
+    def update(self, chunk: ArrayLike) -> 'StreamingDiscreteFitter':
+        """
+        Add a chunk of observations.
+
+        Args:
+            chunk: Non-negative integer observations
+
+        Returns:
+            The fitter itself, to allow chaining
+        """
+        self.data.update(chunk)
+        self._invalidate()
+        return self
+
+    def merge(
+        self,
+        other: Union['StreamingDiscreteFitter', CountHistogram]
+    ) -> 'StreamingDiscreteFitter':
+        """
+        Merge the histogram of another fitter (e.g. from another worker).
+
+        Args:
+            other: Streaming fitter or CountHistogram to merge
+
+        Returns:
+            The fitter itself, to allow chaining
+        """
+        histogram = other.histogram if isinstance(other, StreamingDiscreteFitter) else other
+        self.data.merge(histogram)
+        self._invalidate()
+        return self
+
+    def _invalidate(self) -> None:
+        """Discard results computed from an older histogram."""
+        self.results = []
+        self._fitted = False
+        self._profile = None
+        self._fingerprint = None
+
+    def fit(
+        self,
+        verbose: bool = True,
+        suppress_warnings: bool = True,
+        **kwargs
+    ) -> List[FitResult]:
+        """
+        Fit all candidate distributions to the accumulated histogram.
+
+        Args:
+            verbose: If True, print progress and fitting errors
+            suppress_warnings: If True, suppress scipy/numpy warnings during fitting
+            **kwargs: Passed to :meth:`DistributionFitter.fit` (n_jobs, screening, ...)
+
+        Returns:
+            List of fit results, sorted by p-value (descending)
+
+        Raises:
+            ValueError: If no data has been added yet
+        """
+        if self.data.n == 0:
+            raise ValueError("No data has been added to the fitter")
+        return super().fit(verbose=verbose, suppress_warnings=suppress_warnings, **kwargs)
@@ -0,0 +1,184 @@
+"""Per-candidate stage events of DistributionFitter, for timing and profiling."""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import time
+
+from ..core.memory import stage_memory_end, stage_memory_start
+
+# Stages of a candidate, in order, with their summary() column labels.
+# 'validate' builds the candidate on the data, 'aic_bic' evaluates the
+# log-likelihood for the information criteria
+STAGES = {
+    'validate': 'Validation',
+    'fit': 'Fitting',
+    'gof': 'GOF Test',
+    'aic_bic': 'AIC/BIC',
+}
+
+# Stage of plot_best_fit and compare_distributions (not per candidate)
+PLOT_STAGE = 'plot'
+
+
+class StageTracer:
+    """
+    Receiver of the stage events of a DistributionFitter.
+
+    Subclass and override :meth:`stage_start` and :meth:`stage_end`; both
+    do nothing by default. Events fire in the process that calls
+    ``fit()``. Fits run in worker processes (``n_jobs > 1``, ``timeout``,
+    ``isolate``) report their 'validate' and 'fit' stages when their
+    result arrives, with the durations measured in the worker. Racing
+    fits report with the size of their subsample.
+
+    Example:
+        ```python
+        from bestdist import DistributionFitter
+        from bestdist.core.tracing import StageTracer
+
+        class SlowStages(StageTracer):
+            def stage_end(self, stage, family, n, seconds):
+                if seconds > 1.0:
+                    log.warning("%s %s took %.1fs (n=%d)", family, stage, seconds, n)
+
+        DistributionFitter(data, tracer=SlowStages()).fit()
+        ```
+    """
+
+    def stage_start(self, stage: str, family: str, n: int) -> None:
+        """
+        Called when a stage starts.
+
+        Args:
+            stage: Stage name, see ``STAGES`` (or 'plot')
+            family: Distribution name ('all' when plotting every candidate)
+            n: Number of observations the stage works on
+        """
+
+    def stage_end(self, stage: str, family: str, n: int, seconds: float) -> None:
+        """
+        Called when a stage ends (for candidate stages, also when it raised).
+
+        Args:
+            stage: Stage name, see ``STAGES`` (or 'plot')
+            family: Distribution name
+            n: Number of observations the stage worked on
+            seconds: Duration, from ``time.perf_counter`` (monotonic)
+        """
+
+
+class CallbackTracer(StageTracer):
+    """Tracer calling plain functions, see ``DistributionFitter(on_stage_start=...)``."""
+
+    def __init__(
+        self,
+        on_stage_start: Optional[Callable[[str, str, int], None]] = None,
+        on_stage_end: Optional[Callable[[str, str, int, float], None]] = None
+    ):
+        """
+        Args:
+            on_stage_start: Called with (stage, family, n)
+            on_stage_end: Called with (stage, family, n, seconds)
+        """
+        self.on_stage_start = on_stage_start
+        self.on_stage_end = on_stage_end
+
+    def stage_start(self, stage: str, family: str, n: int) -> None:
+        """Forward to ``on_stage_start``."""
+        if self.on_stage_start is not None:
+            self.on_stage_start(stage, family, n)
+
+    def stage_end(self, stage: str, family: str, n: int, seconds: float) -> None:
+        """Forward to ``on_stage_end``."""
+        if self.on_stage_end is not None:
+            self.on_stage_end(stage, family, n, seconds)
+
+
+class StageTimer(StageTracer):
+    """
+    Tracer that accumulates time per (family, stage) across fits.
+
+    Example:
+        ```python
+        timer = StageTimer()
+        for batch in batches:
+            DistributionFitter(batch, tracer=timer).fit()
+        timer.totals()[('Gamma', 'fit')]  # {'count': ..., 'seconds': ..., ...}
+        ```
+    """
+
+    def __init__(self):
+        """Create an empty timer."""
+        # (family, stage) -> [count, total seconds, max seconds, observations]
+        self._totals: Dict[Tuple[str, str], List[float]] = {}
+
+    def stage_end(self, stage: str, family: str, n: int, seconds: float) -> None:
+        """Accumulate the stage's duration."""
+        entry = self._totals.get((family, stage))
+        if entry is None:
+            self._totals[(family, stage)] = [1, seconds, seconds, n]
+            return
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+        entry[3] += n
+
+    def totals(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """
+        Accumulated timings.
+
+        Returns:
+            Mapping of (family, stage) to 'count', total 'seconds',
+            'max_seconds' and 'observations' (summed over calls)
+        """
+        return {
+            key: {'count': count, 'seconds': total, 'max_seconds': longest, 'observations': n}
+            for key, (count, total, longest, n) in self._totals.items()
+        }
+
+    def reset(self) -> None:
+        """Forget all timings."""
+        self._totals.clear()
+
+    def __repr__(self) -> str:
+        """String representation of the timer."""
+        return f"StageTimer(entries={len(self._totals)})"
+
+
+def run_stage(
+    tracer: Optional[StageTracer],
+    timings: Dict[str, float],
+    stage: str,
+    family: str,
+    n: int,
+    func: Callable,
+    *args: Any,
+    memory: Optional[Dict[str, Dict[str, int]]] = None
+) -> Any:
+    """
+    Run ``func(*args)`` as a stage of a candidate.
+
+    Its duration is stored in ``timings[stage]`` and reported to the
+    tracer, also when it raises. Without a tracer, the only overhead over
+    the call itself is reading the clock twice.
+
+    Given a ``memory`` dictionary, the stage's peak memory and allocations
+    are stored in ``memory[stage]`` too (see
+    :func:`~bestdist.core.memory.stage_memory_end`); tracemalloc must be
+    tracing, see :func:`~bestdist.core.memory.tracing_memory`.
+
+    Returns:
+        What ``func`` returns
+    """
+    if tracer is not None:
+        tracer.stage_start(stage, family, n)
+    if memory is not None:
+        memory_start = stage_memory_start()
+    started = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        timings[stage] = time.perf_counter() - started
+        if memory is not None:
+            memory[stage] = stage_memory_end(memory_start)
+        if tracer is not None:
+            tracer.stage_end(stage, family, n, timings[stage])
@@ -0,0 +1,112 @@
+"""Local store of fitted parameters used to warm-start later fits."""
+
+from typing import Any, Dict, List, Optional, Union
+import json
+import os
+from pathlib import Path
+
+from ..utils.types import FitResult, Parameters
+
+PARAMETER_STORE_VERSION = 1
+
+
+def default_parameter_store_path() -> Path:
+    """
+    Location of the local parameter store.
+
+    ``$XDG_CACHE_HOME/bestdist/warm_start.json``, defaulting to
+    ``~/.cache/bestdist/warm_start.json``.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'bestdist' / 'warm_start.json'
+
+
+class ParameterStore:
+    """
+    Fitted parameters of each family, keyed by dataset.
+
+    A dataset that is refitted as data arrives (a metric, a table column)
+    gets a key; each fit stores its parameters under it and the next fit
+    starts its optimizers from them, see ``DistributionFitter.fit(warm_start=...)``.
+
+    Example:
+        ```python
+        from bestdist import DistributionFitter
+
+        # Every few minutes, on the data so far
+        DistributionFitter(latency).fit(warm_start='latency')
+        ```
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open a store, reading its file if it exists.
+
+        Args:
+            path: JSON file of the store. Defaults to
+                  :func:`default_parameter_store_path`
+        """
+        self.path = Path(path) if path is not None else default_parameter_store_path()
+        self.entries: Dict[str, Dict[str, Parameters]] = {}
+        try:
+            state = json.loads(self.path.read_text())
+            if state.get('version') == PARAMETER_STORE_VERSION:
+                self.entries = state['entries']
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing or unreadable: start empty
+            pass
+
+    def get(self, key: str) -> Dict[str, Parameters]:
+        """
+        Parameters stored for a dataset.
+
+        Args:
+            key: Dataset key
+
+        Returns:
+            Mapping of distribution name to parameters (empty if unknown)
+        """
+        return dict(self.entries.get(key, {}))
+
+    def update(self, key: str, results: List[FitResult]) -> None:
+        """
+        Store the parameters of fitted results (in memory; see :meth:`save`).
+
+        Args:
+            key: Dataset key
+            results: Fit results; only those with ``status='fitted'`` are kept
+        """
+        entry = self.entries.setdefault(key, {})
+        for result in results:
+            if result.get('status', 'fitted') == 'fitted':
+                entry[result['distribution']] = {
+                    name: _to_builtin(value) for name, value in result['parameters'].items()
+                }
+
+    def save(self) -> Path:
+        """
+        Write the store to its file, atomically.
+
+        Returns:
+            Path written to
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(self.path.name + '.tmp')
+        partial.write_text(json.dumps(
+            {'version': PARAMETER_STORE_VERSION, 'entries': self.entries}, indent=2
+        ))
+        os.replace(partial, self.path)
+        return self.path
+
+    def __contains__(self, key: str) -> bool:
+        """True if parameters are stored for the dataset."""
+        return key in self.entries
+
+    def __repr__(self) -> str:
+        """String representation of the store."""
+        return f"ParameterStore(path='{self.path}', keys={len(self.entries)})"
+
+
+def _to_builtin(value: Any) -> Any:
+    """Convert numpy scalars to JSON-serializable Python numbers."""
+    return value.item() if hasattr(value, 'item') else value
@@ -1,6 +1,18 @@
 """Probability distributions module."""
 
-from .continuous import Normal, Gamma, Beta, Weibull
+from typing import TYPE_CHECKING
+import importlib
+
+# Imported on first access (PEP 562), see bestdist/__init__.py
+_LAZY = {
+    "Normal": ".continuous.normal",
+    "Gamma": ".continuous.gamma",
+    "Beta": ".continuous.beta",
+    "Weibull": ".continuous.weibull",
+}
+
+if TYPE_CHECKING:
+    from .continuous import Normal, Gamma, Beta, Weibull
 
 __all__ = [
     "Normal",
@@ -9,3 +21,15 @@ __all__ = [
     "Weibull",
 ]
 
+
+def __getattr__(name):
+    """Import a lazily exported class on first access and cache it."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
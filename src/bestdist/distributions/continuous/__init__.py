@@ -1,14 +1,31 @@
 """Continuous probability distributions."""
 
-from .normal import Normal
-from .gamma import Gamma
-from .beta import Beta
-from .weibull import Weibull
-from .lognormal import Lognormal
-from .exponential import Exponential
-from .uniform import Uniform
-from .cauchy import Cauchy
-from .student_t import StudentT
+from typing import TYPE_CHECKING
+import importlib
+
+# Imported on first access (PEP 562), see bestdist/__init__.py
+_LAZY = {
+    "Normal": ".normal",
+    "Gamma": ".gamma",
+    "Beta": ".beta",
+    "Weibull": ".weibull",
+    "Lognormal": ".lognormal",
+    "Exponential": ".exponential",
+    "Uniform": ".uniform",
+    "Cauchy": ".cauchy",
+    "StudentT": ".student_t",
+}
+
+if TYPE_CHECKING:
+    from .normal import Normal
+    from .gamma import Gamma
+    from .beta import Beta
+    from .weibull import Weibull
+    from .lognormal import Lognormal
+    from .exponential import Exponential
+    from .uniform import Uniform
+    from .cauchy import Cauchy
+    from .student_t import StudentT
 
 __all__ = [
     "Normal",
@@ -22,3 +39,15 @@ __all__ = [
     "StudentT",
 ]
 
+
+def __getattr__(name):
+    """Import a lazily exported class on first access and cache it."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
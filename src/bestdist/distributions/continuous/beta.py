@@ -1,11 +1,13 @@
 """Beta distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import beta, rv_continuous
+from typing import TYPE_CHECKING, Tuple
 
 from ...core.base import BaseDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_continuous
+
 
 class Beta(BaseDistribution):
     """
@@ -46,8 +48,12 @@ class Beta(BaseDistribution):
         - For data outside [0, 1], loc and scale parameters will be fitted
     """
     
-    def _get_scipy_dist(self) -> rv_continuous:
+    SUPPORTS_WARM_START = True
+    STANDARDIZE = True
+    
+    def _get_scipy_dist(self) -> 'rv_continuous':
         """Return scipy beta distribution."""
+        from scipy.stats import beta
         return beta
     
     def _extract_params(self, fit_result: Tuple) -> Parameters:
@@ -1,12 +1,14 @@
 """Cauchy distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import cauchy, rv_continuous
+from typing import TYPE_CHECKING, Tuple
 import numpy as np
 
 from ...core.base import BaseDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_continuous
+
 
 class Cauchy(BaseDistribution):
     """
@@ -44,8 +46,12 @@ class Cauchy(BaseDistribution):
         ```
     """
     
-    def _get_scipy_dist(self) -> rv_continuous:
+    SUPPORTS_WARM_START = True
+    STANDARDIZE = True
+    
+    def _get_scipy_dist(self) -> 'rv_continuous':
         """Return scipy Cauchy distribution."""
+        from scipy.stats import cauchy
         return cauchy
     
     def _extract_params(self, fit_result: Tuple) -> Parameters:
@@ -1,12 +1,14 @@
 """Exponential distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import expon, rv_continuous
+from typing import TYPE_CHECKING, Tuple
 import numpy as np
 
 from ...core.base import BaseDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_continuous
+
 
 class Exponential(BaseDistribution):
     """
@@ -46,8 +48,9 @@ class Exponential(BaseDistribution):
         ```
     """
     
-    def _get_scipy_dist(self) -> rv_continuous:
+    def _get_scipy_dist(self) -> 'rv_continuous':
         """Return scipy exponential distribution."""
+        from scipy.stats import expon
         return expon
     
     def _extract_params(self, fit_result: Tuple) -> Parameters:
@@ -1,11 +1,13 @@
 """Gamma distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import gamma, rv_continuous
+from typing import TYPE_CHECKING, Tuple
 
 from ...core.base import BaseDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_continuous
+
 
 class Gamma(BaseDistribution):
     """
@@ -41,8 +43,12 @@ class Gamma(BaseDistribution):
         ```
     """
     
-    def _get_scipy_dist(self) -> rv_continuous:
+    SUPPORTS_WARM_START = True
+    STANDARDIZE = True
+    
+    def _get_scipy_dist(self) -> 'rv_continuous':
         """Return scipy gamma distribution."""
+        from scipy.stats import gamma
         return gamma
     
     def _extract_params(self, fit_result: Tuple) -> Parameters:
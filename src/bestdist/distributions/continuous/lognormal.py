@@ -1,12 +1,14 @@
 """Lognormal distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import lognorm, rv_continuous
+from typing import TYPE_CHECKING, Tuple
 import numpy as np
 
 from ...core.base import BaseDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_continuous
+
 
 class Lognormal(BaseDistribution):
     """
@@ -42,8 +44,9 @@ class Lognormal(BaseDistribution):
         ```
     """
     
-    def _get_scipy_dist(self) -> rv_continuous:
+    def _get_scipy_dist(self) -> 'rv_continuous':
         """Return scipy lognormal distribution."""
+        from scipy.stats import lognorm
         return lognorm
     
     def _extract_params(self, fit_result: Tuple) -> Parameters:
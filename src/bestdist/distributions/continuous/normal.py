@@ -1,11 +1,13 @@
 """Normal (Gaussian) distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import norm, rv_continuous
+from typing import TYPE_CHECKING, Tuple
 
 from ...core.base import BaseDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_continuous
+
 
 class Normal(BaseDistribution):
     """
@@ -39,8 +41,9 @@ class Normal(BaseDistribution):
         ```
     """
     
-    def _get_scipy_dist(self) -> rv_continuous:
+    def _get_scipy_dist(self) -> 'rv_continuous':
         """Return scipy normal distribution."""
+        from scipy.stats import norm
         return norm
     
     def _extract_params(self, fit_result: Tuple) -> Parameters:
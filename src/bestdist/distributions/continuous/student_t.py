@@ -1,12 +1,14 @@
 """Student-t distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import t as student_t, rv_continuous
+from typing import TYPE_CHECKING, Tuple
 import numpy as np
 
 from ...core.base import BaseDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_continuous
+
 
 class StudentT(BaseDistribution):
     """
@@ -46,8 +48,12 @@ class StudentT(BaseDistribution):
         ```
     """
     
-    def _get_scipy_dist(self) -> rv_continuous:
+    SUPPORTS_WARM_START = True
+    STANDARDIZE = True
+    
+    def _get_scipy_dist(self) -> 'rv_continuous':
         """Return scipy Student-t distribution."""
+        from scipy.stats import t as student_t
         return student_t
     
     def _extract_params(self, fit_result: Tuple) -> Parameters:
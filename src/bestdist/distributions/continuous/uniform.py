@@ -1,11 +1,13 @@
 """Uniform distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import uniform, rv_continuous
+from typing import TYPE_CHECKING, Tuple
 
 from ...core.base import BaseDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_continuous
+
 
 class Uniform(BaseDistribution):
     """
@@ -38,8 +40,9 @@ class Uniform(BaseDistribution):
         ```
     """
     
-    def _get_scipy_dist(self) -> rv_continuous:
+    def _get_scipy_dist(self) -> 'rv_continuous':
         """Return scipy uniform distribution."""
+        from scipy.stats import uniform
         return uniform
     
     def _extract_params(self, fit_result: Tuple) -> Parameters:
@@ -52,9 +55,15 @@ class Uniform(BaseDistribution):
         Returns:
             Dictionary with 'loc' (lower bound) and 'scale' (range) parameters
         """
+        # The MLE is the sample range. Take the width in float64: with
+        # float32 data, ``max - min`` rounded in float32 may leave the
+        # maximum just outside the fitted support.
+        loc = float(fit_result[0])
+        if 'scale' in self.fixed:
+            return {'loc': loc, 'scale': float(fit_result[1])}
         return {
-            'loc': float(fit_result[0]),
-            'scale': float(fit_result[1])
+            'loc': loc,
+            'scale': max(float(fit_result[1]), float(self.data.max()) - loc)
         }
     
     @property
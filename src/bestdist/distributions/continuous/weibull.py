@@ -1,11 +1,13 @@
 """Weibull distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import weibull_min, rv_continuous
+from typing import TYPE_CHECKING, Tuple
 
 from ...core.base import BaseDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_continuous
+
 
 class Weibull(BaseDistribution):
     """
@@ -49,8 +51,12 @@ class Weibull(BaseDistribution):
         which is the most common form used in reliability engineering.
     """
     
-    def _get_scipy_dist(self) -> rv_continuous:
+    SUPPORTS_WARM_START = True
+    STANDARDIZE = True
+    
+    def _get_scipy_dist(self) -> 'rv_continuous':
         """Return scipy Weibull minimum distribution."""
+        from scipy.stats import weibull_min
         return weibull_min
     
     def _extract_params(self, fit_result: Tuple) -> Parameters:
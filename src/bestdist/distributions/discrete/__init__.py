@@ -1,9 +1,21 @@
 """Discrete probability distributions."""
 
-from .poisson import Poisson
-from .binomial import Binomial
-from .negative_binomial import NegativeBinomial
-from .geometric import Geometric
+from typing import TYPE_CHECKING
+import importlib
+
+# Imported on first access (PEP 562), see bestdist/__init__.py
+_LAZY = {
+    "Poisson": ".poisson",
+    "Binomial": ".binomial",
+    "NegativeBinomial": ".negative_binomial",
+    "Geometric": ".geometric",
+}
+
+if TYPE_CHECKING:
+    from .poisson import Poisson
+    from .binomial import Binomial
+    from .negative_binomial import NegativeBinomial
+    from .geometric import Geometric
 
 __all__ = [
     "Poisson",
@@ -12,3 +24,15 @@ __all__ = [
     "Geometric",
 ]
 
+
+def __getattr__(name):
+    """Import a lazily exported class on first access and cache it."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,12 +1,14 @@
 """Binomial distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import binom, rv_discrete
+from typing import TYPE_CHECKING, Tuple
 import numpy as np
 
 from ...core.base_discrete import BaseDiscreteDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_discrete
+
 
 class Binomial(BaseDiscreteDistribution):
     """
@@ -47,8 +49,11 @@ class Binomial(BaseDiscreteDistribution):
         ```
     """
     
-    def _get_scipy_dist(self) -> rv_discrete:
+    FIXABLE_PARAMS = ('n',)
+    
+    def _get_scipy_dist(self) -> 'rv_discrete':
         """Return scipy Binomial distribution."""
+        from scipy.stats import binom
         return binom
     
     def _fit_custom(self) -> Parameters:
@@ -58,20 +63,34 @@ class Binomial(BaseDiscreteDistribution):
         Estimates:
         - n: maximum value observed (approximation)
         - p: mean / n
+        
+        With a known ``n`` (``fixed={'n': ...}``), p = mean / n is the
+        maximum likelihood estimate.
+        
+        Raises:
+            ValueError: If an observation exceeds the known n
         """
+        if 'n' in self.fixed:
+            n = int(self.fixed['n'])
+            if self._sample_max() > n:
+                raise ValueError(
+                    f"Observed {self._sample_max()} successes with n={n} trials"
+                )
+            return {'n': n, 'p': float(self._sample_mean() / n)}
+        
         # Estimate n as the maximum observed value
-        n = int(np.max(self.data))
+        n = self._sample_max()
         
         # If all values are the same, increase n slightly
         if n == 0:
             n = 1
         
         # Estimate p as mean / n
-        mean = np.mean(self.data)
+        mean = self._sample_mean()
         p = min(mean / n, 1.0)  # Ensure p <= 1
         
         # Adjust if variance suggests different n
-        var = np.var(self.data)
+        var = self._sample_var()
         if p > 0 and p < 1:
             # var = n * p * (1-p)
             # Solve for n: n = var / (p * (1-p))
@@ -1,12 +1,14 @@
 """Geometric distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import geom, rv_discrete
+from typing import TYPE_CHECKING, Tuple
 import numpy as np
 
 from ...core.base_discrete import BaseDiscreteDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_discrete
+
 
 class Geometric(BaseDiscreteDistribution):
     """
@@ -46,8 +48,9 @@ class Geometric(BaseDiscreteDistribution):
         ```
     """
     
-    def _get_scipy_dist(self) -> rv_discrete:
+    def _get_scipy_dist(self) -> 'rv_discrete':
         """Return scipy Geometric distribution."""
+        from scipy.stats import geom
         return geom
     
     def _fit_custom(self) -> Parameters:
@@ -56,7 +59,7 @@ class Geometric(BaseDiscreteDistribution):
         
         For geometric distribution, p = 1 / mean
         """
-        mean = np.mean(self.data)
+        mean = self._sample_mean()
         
         # Avoid division by zero
         if mean == 0:
@@ -1,12 +1,14 @@
 """Negative Binomial distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import nbinom, rv_discrete
+from typing import TYPE_CHECKING, Tuple
 import numpy as np
 
 from ...core.base_discrete import BaseDiscreteDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_discrete
+
 
 class NegativeBinomial(BaseDiscreteDistribution):
     """
@@ -44,8 +46,9 @@ class NegativeBinomial(BaseDiscreteDistribution):
         ```
     """
     
-    def _get_scipy_dist(self) -> rv_discrete:
+    def _get_scipy_dist(self) -> 'rv_discrete':
         """Return scipy Negative Binomial distribution."""
+        from scipy.stats import nbinom
         return nbinom
     
     def _fit_custom(self) -> Parameters:
@@ -56,8 +59,8 @@ class NegativeBinomial(BaseDiscreteDistribution):
         - p: mean / (mean + variance)
         - r: mean * p / (1 - p)
         """
-        mean = np.mean(self.data)
-        var = np.var(self.data)
+        mean = self._sample_mean()
+        var = self._sample_var()
         
         # Avoid division by zero
         if var <= mean or mean == 0:
@@ -1,12 +1,14 @@
 """Poisson distribution implementation."""
 
-from typing import Tuple
-from scipy.stats import poisson, rv_discrete
+from typing import TYPE_CHECKING, Tuple
 import numpy as np
 
 from ...core.base_discrete import BaseDiscreteDistribution
 from ...utils.types import Parameters
 
+if TYPE_CHECKING:
+    from scipy.stats import rv_discrete
+
 
 class Poisson(BaseDiscreteDistribution):
     """
@@ -46,8 +48,9 @@ class Poisson(BaseDiscreteDistribution):
         ```
     """
     
-    def _get_scipy_dist(self) -> rv_discrete:
+    def _get_scipy_dist(self) -> 'rv_discrete':
         """Return scipy Poisson distribution."""
+        from scipy.stats import poisson
         return poisson
     
     def _fit_custom(self) -> Parameters:
@@ -55,7 +58,7 @@ class Poisson(BaseDiscreteDistribution):
         Fit Poisson distribution using method of moments.
         For Poisson, the MLE of λ is simply the sample mean.
         """
-        mu = float(np.mean(self.data))
+        mu = self._sample_mean()
         return {'mu': mu}
     
     def _extract_params(self, fit_result: Tuple) -> Parameters:
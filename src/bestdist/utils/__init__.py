@@ -7,6 +7,8 @@ from .exceptions import (
     InsufficientDataError,
     InvalidDistributionError,
     ConvergenceError,
+    FitTimeoutError,
+    WorkerCrashError,
 )
 
 __all__ = [
@@ -16,5 +18,7 @@ __all__ = [
     "InsufficientDataError",
     "InvalidDistributionError",
     "ConvergenceError",
+    "FitTimeoutError",
+    "WorkerCrashError",
 ]
 
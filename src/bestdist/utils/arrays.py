@@ -0,0 +1,156 @@
+"""Conversion of supported array-like inputs to clean numpy arrays."""
+
+from typing import Any, Tuple
+import numpy as np
+
+# Data whose robust spread lies in this range, with a median within the
+# upper bound times the spread of zero, counts as already well scaled
+UNIT_SCALE_RANGE = (0.1, 10.0)
+
+
+def to_clean_array(data: Any) -> np.ndarray:
+    """
+    Convert input data to a flat numpy array with missing values removed.
+
+    Numeric buffers are reused whenever possible:
+
+    - numpy arrays (including memory maps) are returned as is when they
+      contain no NaN values
+    - pandas nullable (``Int64``, ``Float64``, ...) arrays expose their
+      value buffer directly; when values are missing, the mask is applied
+      with a single ``np.compress``
+    - Arrow arrays (pyarrow, Arrow-backed pandas columns, Polars Series)
+      expose their data buffer zero-copy; when values are missing, the
+      validity bitmap is unpacked and applied with a single ``np.compress``
+
+    The native dtype is preserved (integer data stays integer); callers
+    cast as needed.
+
+    Args:
+        data: numpy array, list/tuple, pandas Series/Index/ExtensionArray,
+              pyarrow Array/ChunkedArray or Polars Series
+
+    Returns:
+        One-dimensional numpy array without missing values
+    """
+    module = type(data).__module__.split('.')[0]
+
+    if isinstance(data, np.ndarray):
+        arr = data
+    elif isinstance(data, (list, tuple)):
+        arr = np.array(data)
+        if arr.dtype == object:
+            arr = np.array(data, dtype=float)
+    elif module == 'pyarrow':
+        arr = _from_arrow(data)
+    elif module == 'polars':
+        arr = _from_polars(data)
+    elif module == 'pandas':
+        arr = _from_pandas(data)
+    elif hasattr(data, 'values'):
+        arr = np.asarray(data.values)
+    else:
+        arr = np.asarray(data)
+
+    if arr.ndim != 1:
+        arr = arr.reshape(-1)
+    if arr.dtype.kind == 'f':
+        nan_mask = np.isnan(arr)
+        if nan_mask.any():
+            arr = np.compress(~nan_mask, arr)
+    elif arr.dtype.kind not in 'iub':
+        arr = np.asarray(arr, dtype=float)
+        arr = np.compress(~np.isnan(arr), arr)
+    return arr
+
+
+def robust_standardization(
+    arr: np.ndarray,
+    scale_range: Tuple[float, float] = UNIT_SCALE_RANGE
+) -> Tuple[float, float]:
+    """
+    Robust location and scale that bring data to a unit scale.
+
+    Uses the median and the normal-consistent interquartile range
+    (IQR / 1.349), falling back to the standard deviation when the IQR is
+    zero.
+
+    Args:
+        arr: Numeric data
+        scale_range: Spreads considered well scaled already
+
+    Returns:
+        Tuple of (shift, spread), or (0.0, 1.0) when the data is already
+        well scaled or has no spread
+    """
+    q25, median, q75 = np.percentile(arr, [25, 50, 75])
+    spread = (q75 - q25) / 1.349
+    if not spread > 0:
+        spread = float(np.std(arr))
+    if not spread > 0:
+        return 0.0, 1.0
+    low, high = scale_range
+    if low <= spread <= high and abs(median) <= high * spread:
+        return 0.0, 1.0
+    return float(median), float(spread)
+
+
+def _from_pandas(data: Any) -> np.ndarray:
+    """Extract values from a pandas Series, Index or ExtensionArray."""
+    from pandas.api.extensions import ExtensionArray
+
+    # numpy-backed Series/Index: the underlying array, without a copy
+    if isinstance(getattr(data, 'dtype', None), np.dtype):
+        return np.asarray(data)
+
+    values = data if isinstance(data, ExtensionArray) else data.array
+
+    # Nullable integer/float/boolean arrays: value buffer plus boolean mask
+    mask = getattr(values, '_mask', None)
+    buffer = getattr(values, '_data', None)
+    if isinstance(mask, np.ndarray) and isinstance(buffer, np.ndarray):
+        if not mask.any():
+            return buffer
+        return np.compress(~mask, buffer)
+
+    # Arrow-backed columns
+    if hasattr(values, '__arrow_array__'):
+        return _from_arrow(values.__arrow_array__())
+
+    return values.to_numpy(dtype=float, na_value=np.nan)
+
+
+def _from_polars(data: Any) -> np.ndarray:
+    """Extract values from a Polars Series."""
+    if data.null_count() == 0:
+        return data.to_numpy()
+    return _from_arrow(data.to_arrow())
+
+
+def _from_arrow(data: Any) -> np.ndarray:
+    """Extract values from a pyarrow Array or ChunkedArray."""
+    chunks = data.chunks if hasattr(data, 'chunks') else [data]
+    parts = [_arrow_chunk_to_numpy(chunk) for chunk in chunks]
+    if len(parts) == 1:
+        return parts[0]
+    if not parts:
+        return np.empty(0)
+    return np.concatenate(parts)
+
+
+def _arrow_chunk_to_numpy(chunk: Any) -> np.ndarray:
+    """Convert one Arrow array, zero-copy for primitive numeric types."""
+    import pyarrow as pa
+
+    if not (pa.types.is_integer(chunk.type) or pa.types.is_floating(chunk.type)):
+        return np.asarray(chunk.to_numpy(zero_copy_only=False), dtype=float)
+    if chunk.null_count == 0:
+        return chunk.to_numpy(zero_copy_only=True)
+
+    validity, data = chunk.buffers()[:2]
+    dtype = np.dtype(chunk.type.to_pandas_dtype())
+    values = np.frombuffer(data, dtype=dtype, count=chunk.offset + len(chunk))
+    valid = np.unpackbits(
+        np.frombuffer(validity, dtype=np.uint8), bitorder='little'
+    )[chunk.offset:chunk.offset + len(chunk)].view(bool)
+    return np.compress(valid, values[chunk.offset:])
@@ -30,3 +30,13 @@ class ConvergenceError(FittingError):
     """Raised when fitting algorithm fails to converge."""
     pass
 
+
+
+class FitTimeoutError(FittingError):
+    """Raised when a fit exceeds its timeout or the fitting deadline."""
+    pass
+
+
+class WorkerCrashError(FittingError):
+    """Raised when the process running an isolated fit dies without a result."""
+    pass
@@ -0,0 +1,124 @@
+"""Chunked readers for data that does not fit in memory."""
+
+from typing import Iterator, Union
+import os
+import numpy as np
+
+PathLike = Union[str, 'os.PathLike[str]']
+
+# Number of values read per chunk (8 MB of float64)
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def open_npy(path: PathLike) -> np.ndarray:
+    """
+    Open a ``.npy`` file as a read-only memory map.
+
+    Args:
+        path: Path to the ``.npy`` file
+
+    Returns:
+        Flat memory-mapped array; no data is read until it is accessed
+
+    Raises:
+        ValueError: If the file does not hold numeric data
+    """
+    array = np.load(path, mmap_mode='r')
+    if array.dtype.kind not in 'iuf':
+        raise ValueError(f"Expected numeric data in {path}, got dtype {array.dtype}")
+    return array.reshape(-1)
+
+
+def iter_array_chunks(
+    array: np.ndarray,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[np.ndarray]:
+    """
+    Yield consecutive slices of an array (views, no copies).
+
+    Args:
+        array: Flat array, typically a memory map
+        chunk_size: Number of values per chunk
+
+    Yields:
+        Array slices of at most ``chunk_size`` values
+    """
+    for start in range(0, len(array), chunk_size):
+        yield array[start:start + chunk_size]
+
+
+def iter_npy_chunks(
+    path: PathLike,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[np.ndarray]:
+    """
+    Yield chunks of a memory-mapped ``.npy`` file.
+
+    Args:
+        path: Path to the ``.npy`` file
+        chunk_size: Number of values per chunk
+
+    Yields:
+        Array chunks of at most ``chunk_size`` values
+    """
+    yield from iter_array_chunks(open_npy(path), chunk_size)
+
+
+def iter_csv_chunks(
+    path: PathLike,
+    column: Union[str, int],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **read_csv_kwargs
+) -> Iterator[np.ndarray]:
+    """
+    Yield chunks of one column of a CSV file.
+
+    Only the requested column is parsed, ``chunk_size`` rows at a time.
+
+    Args:
+        path: Path to the CSV file
+        column: Column name (or position)
+        chunk_size: Number of rows per chunk
+        **read_csv_kwargs: Extra arguments for ``pandas.read_csv``
+
+    Yields:
+        Float arrays of at most ``chunk_size`` values (missing values as NaN)
+    """
+    import pandas as pd
+
+    reader = pd.read_csv(path, usecols=[column], chunksize=chunk_size, **read_csv_kwargs)
+    with reader:
+        for frame in reader:
+            yield frame.iloc[:, 0].to_numpy(dtype=float, na_value=np.nan)
+
+
+def iter_parquet_chunks(
+    path: PathLike,
+    column: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[np.ndarray]:
+    """
+    Yield chunks of one column of a Parquet file.
+
+    Record batches are streamed with ``pyarrow``, reading only the
+    requested column.
+
+    Args:
+        path: Path to the Parquet file
+        column: Column name
+        chunk_size: Maximum number of rows per batch
+
+    Yields:
+        Arrays of at most ``chunk_size`` values (missing values as NaN)
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading Parquet files requires pyarrow") from e
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=[column]):
+        yield batch.column(0).to_numpy(zero_copy_only=False)
@@ -0,0 +1,129 @@
+"""Compact binary encoding of JSON-like values."""
+
+from typing import Any, List, Tuple
+import struct
+import numpy as np
+
+# One tag byte per value, then its little-endian payload. Dictionary keys
+# have no tag, only a one-byte length
+_NONE, _TRUE, _FALSE, _INT, _FLOAT, _STR, _LIST, _MAP = b'NTFidslm'
+_INT64 = struct.Struct('<q')
+_FLOAT64 = struct.Struct('<d')
+_LENGTH = struct.Struct('<I')
+_MAX_KEY_LENGTH = 255
+
+
+def pack(value: Any) -> bytes:
+    """
+    Encode None, bools, ints, floats, strings, lists/tuples and
+    string-keyed dicts (nested) into bytes.
+
+    Floats are stored as 8-byte doubles, so they round-trip exactly
+    (NaN and infinities included), as do numpy scalars.
+
+    Raises:
+        TypeError: If a value (or dict key) has an unsupported type
+        ValueError: If a dict key is longer than 255 bytes in UTF-8
+    """
+    parts: List[bytes] = []
+    _pack_into(value, parts)
+    return b''.join(parts)
+
+
+def unpack(payload: bytes, offset: int = 0) -> Tuple[Any, int]:
+    """
+    Decode a value written by :func:`pack`.
+
+    Args:
+        payload: Encoded bytes
+        offset: Position of the value in ``payload``
+
+    Returns:
+        Tuple of (value, offset just past it)
+
+    Raises:
+        ValueError: If the payload is truncated or malformed
+    """
+    try:
+        return _unpack_from(bytes(payload), offset)
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Malformed payload: {e}") from e
+
+
+def to_builtin(value: Any) -> Any:
+    """Convert numpy scalars in a (nested) value to Python numbers, e.g. for JSON."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {key: to_builtin(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_builtin(item) for item in value]
+    return value
+
+
+def _pack_into(value: Any, parts: List[bytes]) -> None:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None:
+        parts.append(bytes([_NONE]))
+    elif value is True or value is False:
+        parts.append(bytes([_TRUE if value else _FALSE]))
+    elif isinstance(value, int):
+        parts.append(bytes([_INT]) + _INT64.pack(value))
+    elif isinstance(value, float):
+        parts.append(bytes([_FLOAT]) + _FLOAT64.pack(value))
+    elif isinstance(value, str):
+        encoded = value.encode('utf-8')
+        parts.append(bytes([_STR]) + _LENGTH.pack(len(encoded)) + encoded)
+    elif isinstance(value, (list, tuple)):
+        parts.append(bytes([_LIST]) + _LENGTH.pack(len(value)))
+        for item in value:
+            _pack_into(item, parts)
+    elif isinstance(value, dict):
+        parts.append(bytes([_MAP]) + _LENGTH.pack(len(value)))
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f"Dictionary keys must be strings, got {type(key).__name__}")
+            encoded = key.encode('utf-8')
+            if len(encoded) > _MAX_KEY_LENGTH:
+                raise ValueError(f"Dictionary key too long: {key[:20]}...")
+            parts.append(bytes([len(encoded)]) + encoded)
+            _pack_into(item, parts)
+    else:
+        raise TypeError(f"Cannot pack values of type {type(value).__name__}")
+
+
+def _unpack_from(payload: bytes, offset: int) -> Tuple[Any, int]:
+    tag = payload[offset]
+    offset += 1
+    if tag == _NONE:
+        return None, offset
+    if tag == _TRUE or tag == _FALSE:
+        return tag == _TRUE, offset
+    if tag == _INT:
+        return _INT64.unpack_from(payload, offset)[0], offset + _INT64.size
+    if tag == _FLOAT:
+        return _FLOAT64.unpack_from(payload, offset)[0], offset + _FLOAT64.size
+    length, = _LENGTH.unpack_from(payload, offset)
+    offset += _LENGTH.size
+    if tag == _STR:
+        if offset + length > len(payload):
+            raise IndexError("string runs past the end")
+        return payload[offset:offset + length].decode('utf-8'), offset + length
+    if tag == _LIST:
+        items = []
+        for _ in range(length):
+            item, offset = _unpack_from(payload, offset)
+            items.append(item)
+        return items, offset
+    if tag == _MAP:
+        mapping = {}
+        for _ in range(length):
+            end = offset + 1 + payload[offset]
+            if end > len(payload):
+                raise IndexError("key runs past the end")
+            key = payload[offset + 1:end].decode('utf-8')
+            mapping[key], offset = _unpack_from(payload, end)
+        return mapping, offset
+    raise ValueError(f"Unknown tag {tag!r} at offset {offset - 1}")
+
@@ -1,12 +1,14 @@
 """Type definitions for the pdist package."""
 
-from typing import Dict, List, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    # pandas is only needed for summary(); keep it out of the import path
+    import pandas as pd
 
 # Type aliases
-ArrayLike = Union[np.ndarray, pd.Series, List[float]]
+ArrayLike = Union[np.ndarray, 'pd.Series', List[float]]
 FitResult = Dict[str, Union[float, str, Dict[str, float]]]
 TestResult = Tuple[float, float]  # (statistic, p_value)
 Parameters = Dict[str, float]
-
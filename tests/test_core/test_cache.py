@@ -0,0 +1,145 @@
+"""Tests for the fit-result cache."""
+
+import numpy as np
+import pytest
+from bestdist import CountHistogram, DistributionFitter, ResultCache
+from bestdist.core.cache import fingerprint, make_key
+from bestdist.distributions.continuous import Normal, Gamma, Exponential
+
+
+class CountingGamma(Gamma):
+    """Gamma that counts its fits."""
+
+    calls = 0
+
+    def fit(self):
+        CountingGamma.calls += 1
+        return super().fit()
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    """Reset the fit counter between tests."""
+    CountingGamma.calls = 0
+
+
+class TestFingerprint:
+    """Test suite for fingerprint and make_key."""
+
+    def test_content_hash(self, normal_data):
+        """Test that equal data hashes equal and any change is detected."""
+        changed = normal_data.copy()
+        changed[-1] += 1e-9
+
+        assert fingerprint(normal_data) == fingerprint(normal_data.copy())
+        assert fingerprint(normal_data) != fingerprint(changed)
+        assert fingerprint(normal_data) != fingerprint(normal_data.astype(np.float32))
+
+    def test_histogram(self):
+        """Test hashing count histograms by their frequencies."""
+        poisson_data = np.random.default_rng(0).poisson(4, size=1000)
+        first = CountHistogram.from_data(poisson_data)
+        second = CountHistogram.from_data(poisson_data[::-1])
+
+        assert fingerprint(first) == fingerprint(second)
+
+    def test_key_components(self):
+        """Test that keys separate families and methods."""
+        assert make_key('x', Normal, 'ks') != make_key('x', Gamma, 'ks')
+        assert make_key('x', Normal, 'ks') != make_key('x', Normal, 'ad')
+        assert 'bestdist.distributions.continuous.normal.Normal' in make_key('x', Normal, 'ks')
+
+
+class TestResultCache:
+    """Test suite for ResultCache."""
+
+    def test_lru_byte_limit(self):
+        """Test eviction of the least recently used entries."""
+        cache = ResultCache(max_bytes=100)
+        cache.put('a', {'v': 'x' * 30})
+        cache.put('b', {'v': 'x' * 30})
+        cache.get('a')
+        cache.put('c', {'v': 'x' * 30})
+
+        assert 'a' in cache and 'c' in cache
+        assert 'b' not in cache
+        assert cache.nbytes <= 100
+        assert cache.stats()['hits'] == 1
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Test that entries are read back by a new cache on the same directory."""
+        ResultCache(directory=tmp_path).put('key', {'params': {'loc': 1.5}})
+        reopened = ResultCache(directory=tmp_path)
+
+        assert len(reopened) == 0
+        assert reopened.get('key') == {'params': {'loc': 1.5}}
+        assert 'key' in reopened
+        assert reopened.get('missing') is None
+
+    def test_clear(self, tmp_path):
+        """Test clearing both tiers."""
+        cache = ResultCache(directory=tmp_path)
+        cache.put('key', {'params': {}})
+        cache.clear()
+
+        assert cache.get('key') is None
+        assert ResultCache(directory=tmp_path).get('key') is None
+
+
+class TestFitterCache:
+    """Test suite for the cache in DistributionFitter."""
+
+    def test_hit_skips_fitting(self, gamma_data):
+        """Test that a second fit of the same data is served from the cache."""
+        cache = ResultCache()
+        candidates = [Normal, CountingGamma]
+        first = DistributionFitter(gamma_data, distributions=candidates, cache=cache).fit()
+        second = DistributionFitter(gamma_data.copy(), distributions=candidates, cache=cache).fit()
+
+        assert CountingGamma.calls == 1
+        assert not any(r['cached'] for r in first)
+        assert all(r['cached'] for r in second)
+        for cold, warm in zip(first, second):
+            assert warm['distribution'] == cold['distribution']
+            assert warm['parameters'] == pytest.approx(cold['parameters'])
+            assert warm['p_value'] == pytest.approx(cold['p_value'])
+            assert warm['aic'] == pytest.approx(cold['aic'])
+
+    def test_miss_on_other_data_or_method(self, gamma_data):
+        """Test that changed data or another test method refits."""
+        cache = ResultCache()
+        DistributionFitter(gamma_data, distributions=[CountingGamma], cache=cache).fit()
+        DistributionFitter(gamma_data[:-1], distributions=[CountingGamma], cache=cache).fit()
+        DistributionFitter(
+            gamma_data, distributions=[CountingGamma], method='chi2', cache=cache
+        ).fit()
+
+        assert CountingGamma.calls == 3
+
+    def test_caller_key(self, gamma_data):
+        """Test that a caller-supplied key replaces hashing."""
+        cache = ResultCache()
+        fitter = DistributionFitter(
+            gamma_data, distributions=[CountingGamma], cache=cache, cache_key='batch-1'
+        )
+        fitter.fit()
+        fitter.fit()
+
+        assert fitter.fingerprint == 'batch-1'
+        assert CountingGamma.calls == 1
+
+    def test_fit_many_and_disk(self, gamma_data, tmp_path):
+        """Test cache hits in fit_many across cache instances."""
+        candidates = [Exponential, CountingGamma]
+        DistributionFitter(
+            gamma_data, distributions=candidates, cache=ResultCache(directory=tmp_path)
+        ).fit()
+        cache = ResultCache(directory=tmp_path)
+        results = DistributionFitter.fit_many(
+            {'gamma': DistributionFitter(gamma_data, distributions=candidates, cache=cache)},
+            n_jobs=1
+        )
+
+        assert CountingGamma.calls == 1
+        assert results['gamma'][0]['distribution'] == 'CountingGamma'
+        assert all(r['cached'] for r in results['gamma'])
@@ -0,0 +1,98 @@
+"""Tests for the compact dtype mode of DistributionFitter."""
+
+import pytest
+import numpy as np
+from bestdist import DistributionFitter
+from bestdist.distributions.continuous import Normal
+
+# Accuracy budget of compact mode relative to the default float64 mode
+PARAM_RTOL = 1e-2
+AIC_RTOL = 1e-2
+STATISTIC_ATOL = 1e-3
+
+
+def _by_name(results):
+    return {result['distribution']: result for result in results}
+
+
+class TestCompactMode:
+    """Test suite for compact=True."""
+
+    def test_continuous_storage(self, gamma_data):
+        """Test that continuous data is stored as float32."""
+        fitter = DistributionFitter(gamma_data, compact=True)
+
+        assert fitter.data.dtype == np.float32
+        assert fitter.data.nbytes == gamma_data.nbytes // 2
+
+    def test_distributions_keep_float32(self, gamma_data):
+        """Test that candidates don't upcast compact data."""
+        data = gamma_data.astype(np.float32)
+        dist = Normal(data)
+
+        assert dist.data.dtype == np.float32
+        assert np.shares_memory(dist.data, data)
+
+    @pytest.mark.parametrize('maximum, dtype', [
+        (200, np.uint8), (60_000, np.uint16), (70_000, np.uint32)
+    ])
+    def test_discrete_storage(self, maximum, dtype):
+        """Test that counts are downcast to the smallest unsigned type."""
+        data = np.array([0, 1, 2, maximum])
+        fitter = DistributionFitter(data, dist_type='discrete', compact=True)
+
+        assert fitter.data.dtype == dtype
+        np.testing.assert_array_equal(fitter.data, data)
+
+    @pytest.mark.parametrize('fixture', ['normal_data', 'gamma_data', 'weibull_data'])
+    def test_continuous_accuracy(self, fixture, request):
+        """Test that compact results stay within the accuracy budget."""
+        data = request.getfixturevalue(fixture)
+        default = DistributionFitter(data).fit(verbose=False)
+        compact = DistributionFitter(data, compact=True).fit(verbose=False)
+
+        # Parameters of the best fit; runners-up may be ill-conditioned
+        # (e.g. Lognormal on normal data), where only the likelihood is stable
+        assert default[0]['distribution'] == compact[0]['distribution']
+        for name, value in default[0]['parameters'].items():
+            assert compact[0]['parameters'][name] == pytest.approx(value, rel=PARAM_RTOL)
+
+        compact_by_name = _by_name(compact)
+        for result in default:
+            other = compact_by_name[result['distribution']]
+            assert other['aic'] == pytest.approx(result['aic'], rel=AIC_RTOL)
+            assert other['test_statistic'] == pytest.approx(
+                result['test_statistic'], abs=STATISTIC_ATOL
+            )
+
+    def test_discrete_results_identical(self):
+        """Test that narrow integer storage doesn't change discrete fits."""
+        np.random.seed(42)
+        data = np.random.poisson(lam=3.5, size=2000)
+        default = DistributionFitter(data, dist_type='discrete').fit(verbose=False)
+        compact = DistributionFitter(data, dist_type='discrete', compact=True).fit(verbose=False)
+
+        compact_by_name = _by_name(compact)
+        for result in default:
+            other = compact_by_name[result['distribution']]
+            assert other['parameters'] == pytest.approx(result['parameters'])
+            assert other['aic'] == pytest.approx(result['aic'])
+
+    def test_chunked_log_likelihood(self, gamma_data, monkeypatch):
+        """Test that chunked float64 accumulation matches a single pass."""
+        monkeypatch.setattr(DistributionFitter, 'LOG_LIKELIHOOD_CHUNK_SIZE', 64)
+        compact = DistributionFitter(gamma_data, distributions=[Normal], compact=True)
+        result = compact.fit(verbose=False)[0]
+
+        dist = result['distribution_object']
+        expected = np.sum(np.log(dist.pdf(compact.data.astype(float)) + 1e-10))
+        assert result['aic'] == pytest.approx(2 * 2 - 2 * expected)
+
+    def test_plot_narrow_counts(self):
+        """Test that plotting uint8 data doesn't overflow the PMF range."""
+        data = np.array([250, 255, 255, 253, 254] * 20)
+        fitter = DistributionFitter(data, dist_type='discrete', compact=True)
+        fitter.fit(verbose=False)
+
+        assert fitter.data.dtype == np.uint8
+        assert len(fitter.plot_best_fit().axes) == 2
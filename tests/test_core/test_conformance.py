@@ -0,0 +1,59 @@
+"""Tests for the accuracy conformance harness (benchmarks/conformance.py)."""
+
+import pytest
+from benchmarks import conformance
+from benchmarks.conformance import (
+    PARAMETER_RANGES, check_family, check_fitter, draw_cases, run_conformance, summarize
+)
+
+
+def test_cases_reproducible_and_in_range():
+    """Test that a seed replays the same cases, with parameters within their ranges."""
+    first = list(draw_cases(sizes=(100,), n_cases=4, seed=7))
+    second = list(draw_cases(sizes=(100,), n_cases=4, seed=7))
+
+    assert first == second
+    assert len(first) == 4 * len(PARAMETER_RANGES)
+    for case in first:
+        for name, (_, low, high) in PARAMETER_RANGES[case.family].items():
+            assert low <= case.params[name] <= high
+        assert len(case.data()) == 100
+
+
+@pytest.mark.parametrize('family', ['StudentT', 'Lognormal', 'Poisson', 'Geometric'])
+def test_family_fits_conform(family):
+    """Test that family fits reach scipy's likelihood in every mode."""
+    rows = [row for case in draw_cases([family], (2_000,), 2) for row in check_family(case)]
+
+    assert rows
+    assert all(row['conforms'] for row in rows)
+    assert all(row['speedup'] > 0 for row in rows)
+
+
+def test_fitter_choice_conforms():
+    """Test that fast fitter modes pick the reference's best distribution."""
+    case = next(draw_cases(['Lognormal'], (2_000,), 1))
+    rows = check_fitter(case, modes=['newton', 'compact', 'screening'])
+
+    assert [row['mode'] for row in rows] == ['newton', 'compact', 'screening']
+    assert all(row['conforms'] for row in rows)
+
+
+def test_flags_inaccurate_mode(monkeypatch):
+    """Test that a mode stopping the optimizer early is reported as non-conforming."""
+    monkeypatch.setitem(conformance.FAMILY_MODES, 'truncated', {'maxiter': 2})
+    case = next(draw_cases(['Weibull'], (2_000,), 1))
+    row, = check_family(case, modes=['truncated'])
+
+    assert row['loglik_deficit'] > conformance.LOGLIK_TOL
+    assert not row['conforms']
+
+
+def test_summary_side_by_side():
+    """Test that the summary pairs speedup with accuracy per family and mode."""
+    rows = run_conformance(['Poisson'], (500,), 2, levels=('family',))
+    entry, = summarize(rows)
+
+    assert entry['cases'] == 2
+    assert entry['conforming'] == 1.0
+    assert {'median_speedup', 'max_param_difference', 'max_loglik_deficit'} <= set(entry)
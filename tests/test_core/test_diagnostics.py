@@ -0,0 +1,122 @@
+"""Tests for optimizer configuration and fit diagnostics."""
+
+import numpy as np
+import pytest
+from bestdist import DistributionFitter, ResultCache
+from bestdist.distributions.continuous import Normal, Gamma, StudentT
+from bestdist.distributions.discrete import Poisson
+
+DIAGNOSTICS = ('optimizer', 'converged', 'iterations', 'nfev', 'fit_time')
+
+
+@pytest.fixture
+def poisson_data():
+    """Count data."""
+    return np.random.default_rng(0).poisson(4, size=1000)
+
+
+class TestFitInfo:
+    """Test suite for fit_info on distributions."""
+
+    def test_nelder_mead(self, gamma_data):
+        """Test that scipy's optimizer hook reports its work."""
+        dist = Gamma(gamma_data)
+        dist.fit()
+
+        assert dist.fit_info['method'] == 'nelder-mead'
+        assert dist.fit_info['converged']
+        assert dist.fit_info['nfev'] > dist.fit_info['iterations'] > 0
+        assert dist.fit_info['fit_time'] > 0
+
+    def test_limits(self, gamma_data):
+        """Test that maxiter and tol reach the optimizer."""
+        limited = Gamma(gamma_data)
+        limited.fit(maxiter=5)
+        loose = Gamma(gamma_data)
+        loose.fit(tol=1e-1)
+        default = Gamma(gamma_data)
+        default.fit()
+
+        assert limited.fit_info['iterations'] == 5
+        assert not limited.fit_info['converged']
+        assert loose.fit_info['nfev'] < default.fit_info['nfev']
+
+    def test_gradient_limits(self, gamma_data):
+        """Test that maxiter reaches the gradient backends."""
+        dist = Gamma(gamma_data)
+        dist.fit(optimizer='lbfgsb', maxiter=2)
+
+        assert dist.fit_info['optimizer'] == 'lbfgsb'
+        assert dist.fit_info['iterations'] <= 2
+        assert not dist.fit_info['converged']
+
+    def test_closed_form(self, normal_data, poisson_data):
+        """Test families fitted without an iterative optimizer."""
+        normal = Normal(normal_data)
+        normal.fit()
+        poisson = Poisson(poisson_data)
+        poisson.fit()
+
+        assert normal.fit_info['method'] == 'closed-form'
+        assert normal.fit_info['nfev'] == 0
+        assert poisson.fit_info['optimizer'] == 'moments'
+        assert poisson.fit_info['fit_time'] >= 0
+
+    def test_set_params_clears(self, gamma_data):
+        """Test that parameters set from elsewhere carry no diagnostics."""
+        dist = Gamma(gamma_data)
+        dist.set_params(Gamma(gamma_data).fit())
+
+        assert dist.fit_info is None
+
+
+class TestFitterDiagnostics:
+    """Test suite for diagnostics in DistributionFitter results."""
+
+    @pytest.mark.parametrize('options', [{}, {'n_jobs': 2}, {'isolate': True}])
+    def test_results_and_summary(self, gamma_data, options):
+        """Test that every fitted result and summary row has diagnostics."""
+        fitter = DistributionFitter(gamma_data, distributions=[Normal, Gamma])
+        results = fitter.fit(verbose=False, **options)
+        summary = fitter.summary()
+
+        for result in results:
+            assert all(result[name] is not None for name in DIAGNOSTICS)
+        gamma = next(r for r in results if r['distribution'] == 'Gamma')
+        assert gamma['optimizer'] == 'scipy' and gamma['nfev'] > 0
+        for column in ('Optimizer', 'Converged', 'Iterations', 'Evaluations', 'Fit Time (s)'):
+            assert column in summary.columns
+
+    def test_options_reach_candidates(self, gamma_data, poisson_data):
+        """Test passing the optimizer configuration through the fitter."""
+        results = DistributionFitter(
+            gamma_data, distributions=[Normal, Gamma, StudentT]
+        ).fit(optimizer='newton', maxiter=50, verbose=False)
+        by_name = {r['distribution']: r for r in results}
+        discrete = DistributionFitter(poisson_data, dist_type='discrete').fit(
+            optimizer='newton', verbose=False
+        )
+
+        assert by_name['Gamma']['optimizer'] == 'newton'
+        assert by_name['StudentT']['optimizer'] == 'newton'
+        assert by_name['Normal']['optimizer'] == 'scipy'
+        assert all(r['status'] == 'fitted' for r in discrete)
+
+    def test_options_in_cache_key(self, gamma_data):
+        """Test that fits with other optimizer options are not served from the cache."""
+        cache = ResultCache()
+        DistributionFitter(gamma_data, distributions=[Gamma], cache=cache).fit()
+        fitter = DistributionFitter(gamma_data, distributions=[Gamma], cache=cache)
+
+        assert not fitter.fit(optimizer='newton')[0]['cached']
+        assert fitter.fit()[0]['cached']
+        assert fitter.fit()[0]['nfev'] is None
+
+    def test_invalid_options(self, gamma_data):
+        """Test that bad options are rejected before fitting."""
+        fitter = DistributionFitter(gamma_data, distributions=[Gamma])
+
+        with pytest.raises(ValueError, match="Unknown optimizer"):
+            fitter.fit(optimizer='bfgs')
+        with pytest.raises(ValueError, match="n_starts"):
+            DistributionFitter.fit_many({'x': fitter}, n_starts=0)
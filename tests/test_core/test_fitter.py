@@ -167,3 +167,15 @@ class TestDistributionFitter:
         with pytest.raises(ValueError):
             fitter.get_best_distribution(criterion='invalid')
 
+    
+    def test_clean_data_not_copied(self, normal_data):
+        """Test that clean float data is used without copying."""
+        fitter = DistributionFitter(normal_data)
+        
+        assert np.shares_memory(fitter.data, normal_data)
+    
+    def test_nan_data_removed(self, data_with_nans):
+        """Test that NaN values are dropped from the fitted data."""
+        fitter = DistributionFitter(data_with_nans)
+        
+        assert len(fitter.data) == np.sum(~np.isnan(data_with_nans))
@@ -0,0 +1,91 @@
+"""Tests for fixed (known) distribution parameters."""
+
+import numpy as np
+import pytest
+from bestdist import DistributionFitter
+from bestdist.distributions.continuous import Normal, Gamma, Beta, Weibull, Lognormal, Uniform
+from bestdist.distributions.discrete import Binomial, Poisson
+
+
+class TestFixedContinuous:
+    """Test suite for fixed parameters of continuous distributions."""
+
+    @pytest.mark.parametrize('dist_class', [Gamma, Weibull, Lognormal])
+    def test_floc(self, dist_class, gamma_data):
+        """Test holding loc at zero for positive data."""
+        dist = dist_class(gamma_data, fixed={'loc': 0})
+        params = dist.fit()
+
+        assert params['loc'] == 0
+        assert dist.n_free_params == 2
+        assert dist_class(gamma_data).n_free_params == 3
+
+    def test_gamma_floc_matches_truth(self):
+        """Test that the reduced fit recovers known parameters."""
+        data = np.random.default_rng(0).gamma(3.0, 2.0, size=20000)
+        params = Gamma(data, fixed={'loc': 0}).fit()
+
+        assert params['a'] == pytest.approx(3.0, rel=0.05)
+        assert params['scale'] == pytest.approx(2.0, rel=0.05)
+
+    def test_beta_bounds(self, beta_data):
+        """Test fitting Beta with its support fixed to [0, 1]."""
+        params = Beta(beta_data, fixed={'loc': 0, 'scale': 1}).fit()
+
+        assert (params['loc'], params['scale']) == (0, 1)
+        assert params['a'] == pytest.approx(2, rel=0.2)
+
+    def test_fixed_shape_and_scale(self, normal_data):
+        """Test fixing a scale and a shape parameter."""
+        assert Normal(normal_data, fixed={'scale': 1.0}).fit()['scale'] == 1.0
+        assert Uniform(normal_data, fixed={'scale': 100.0}).fit()['scale'] == 100.0
+
+    def test_unknown_parameter(self, normal_data):
+        """Test that fixing a parameter the family lacks is rejected."""
+        with pytest.raises(ValueError, match="no parameter"):
+            Normal(normal_data, fixed={'a': 1.0})
+
+    def test_warm_start_keeps_fixed(self, gamma_data):
+        """Test that priors don't override fixed parameters."""
+        prior = {'a': 1.0, 'loc': -1.0, 'scale': 1.0}
+        params = Gamma(gamma_data, fixed={'loc': 0}).fit(initial=prior)
+
+        assert params['loc'] == 0
+
+
+class TestFitterFixed:
+    """Test suite for fixed parameters in DistributionFitter."""
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_fixed_per_family(self, gamma_data, n_jobs):
+        """Test that fixed parameters reach the right candidates."""
+        fitter = DistributionFitter(
+            gamma_data, distributions=[Normal, Gamma], fixed={'Gamma': {'loc': 0}}
+        )
+        results = {r['distribution']: r for r in fitter.fit(n_jobs=n_jobs)}
+
+        assert results['Gamma']['parameters']['loc'] == 0
+        gamma = results['Gamma']['distribution_object']
+        log_likelihood = np.sum(gamma.dist.logpdf(gamma_data))
+        assert results['Gamma']['aic'] == pytest.approx(2 * 2 - 2 * log_likelihood, rel=1e-6)
+        assert results['Normal']['parameters']['loc'] != 0
+
+    def test_known_n(self):
+        """Test a Binomial with a known number of trials."""
+        data = np.random.default_rng(0).binomial(8, 0.4, size=2000)
+        fitter = DistributionFitter(
+            data, dist_type='discrete', distributions=[Binomial, Poisson],
+            fixed={'Binomial': {'n': 8}}
+        )
+        results = {r['distribution']: r for r in fitter.fit()}
+
+        assert results['Binomial']['parameters']['n'] == 8
+        n = len(data)
+        bic = results['Binomial']['bic']
+        aic = results['Binomial']['aic']
+        assert bic - aic == pytest.approx(np.log(n) - 2)
+
+    def test_unknown_candidate(self, gamma_data):
+        """Test that fixed parameters for a family not tried are rejected."""
+        with pytest.raises(ValueError, match="unknown candidates"):
+            DistributionFitter(gamma_data, distributions=[Normal], fixed={'Gamma': {'loc': 0}})
@@ -0,0 +1,121 @@
+"""Tests for per-candidate timeouts, deadlines and isolated fits."""
+
+import os
+import time
+import pytest
+from bestdist import DistributionFitter
+from bestdist.distributions.continuous import Normal, Gamma, Exponential
+
+
+class SlowNormal(Normal):
+    """Normal whose fit never finishes in time."""
+
+    def fit(self):
+        time.sleep(60)
+        return super().fit()
+
+
+class CrashingNormal(Normal):
+    """Normal whose fit kills its process."""
+
+    def fit(self):
+        os._exit(3)
+
+
+class BrokenNormal(Normal):
+    """Normal whose fit raises."""
+
+    def fit(self):
+        raise ValueError("optimizer diverged")
+
+
+def _by_name(results):
+    return {result['distribution']: result for result in results}
+
+
+class TestTimeouts:
+    """Test suite for timeout and deadline."""
+
+    def test_timeout_marks_failed(self, normal_data):
+        """Test that a slow candidate is killed and reported as failed."""
+        fitter = DistributionFitter(normal_data, distributions=[Normal, SlowNormal])
+        start = time.monotonic()
+        results = _by_name(fitter.fit(timeout=1))
+
+        assert time.monotonic() - start < 10
+        assert results['Normal']['status'] == 'fitted'
+        slow = results['SlowNormal']
+        assert slow['status'] == 'failed'
+        assert slow['timed_out']
+        assert 'timed out' in slow['reason']
+        assert fitter.get_best_distribution()['distribution'] == 'Normal'
+
+    def test_deadline_returns_finished(self, normal_data):
+        """Test anytime results when the global deadline hits."""
+        fitter = DistributionFitter(
+            normal_data, distributions=[Normal, Exponential, SlowNormal]
+        )
+        start = time.monotonic()
+        results = fitter.fit(deadline=2, isolate=True)
+
+        assert time.monotonic() - start < 10
+        by_name = _by_name(results)
+        assert by_name['Normal']['status'] == 'fitted'
+        assert by_name['Exponential']['status'] == 'fitted'
+        assert by_name['SlowNormal']['timed_out']
+        assert 'deadline' in by_name['SlowNormal']['reason']
+        assert results[-1]['distribution'] == 'SlowNormal'
+
+    def test_parallel_deadline(self, normal_data):
+        """Test that a parallel fit stops at the deadline."""
+        fitter = DistributionFitter(normal_data, distributions=[SlowNormal, Normal, Gamma])
+        start = time.monotonic()
+        results = _by_name(fitter.fit(n_jobs=2, deadline=3))
+
+        assert time.monotonic() - start < 10
+        assert results['Normal']['status'] == 'fitted'
+        assert results['SlowNormal']['status'] == 'failed'
+
+    def test_serial_deadline_checked_between_candidates(self, normal_data):
+        """Test that an expired in-process deadline stops further fits."""
+        fitter = DistributionFitter(normal_data, distributions=[Normal, Gamma])
+        results = fitter.fit(deadline=0)
+
+        assert all(r['status'] == 'failed' and r['timed_out'] for r in results)
+        assert fitter.get_best_distribution() is None
+
+
+class TestIsolation:
+    """Test suite for isolated fits."""
+
+    def test_isolated_matches_in_process(self, gamma_data):
+        """Test that isolated fits produce the same results."""
+        candidates = [Normal, Gamma]
+        isolated = _by_name(DistributionFitter(gamma_data, distributions=candidates).fit(isolate=True))
+        direct = _by_name(DistributionFitter(gamma_data, distributions=candidates).fit())
+
+        for name, result in direct.items():
+            assert isolated[name]['parameters'] == pytest.approx(result['parameters'])
+
+    def test_crash_is_contained(self, normal_data):
+        """Test that a fit killing its process doesn't take fit() down."""
+        fitter = DistributionFitter(normal_data, distributions=[CrashingNormal, Normal])
+        results = _by_name(fitter.fit(isolate=True))
+
+        assert results['Normal']['status'] == 'fitted'
+        crashed = results['CrashingNormal']
+        assert crashed['status'] == 'failed'
+        assert not crashed['timed_out']
+        assert 'exit code 3' in crashed['reason']
+
+    @pytest.mark.parametrize('isolate', [False, True])
+    def test_errors_are_reported(self, normal_data, isolate):
+        """Test that candidates raising errors are listed as failed."""
+        fitter = DistributionFitter(normal_data, distributions=[BrokenNormal, Normal])
+        results = fitter.fit(isolate=isolate)
+
+        broken = _by_name(results)['BrokenNormal']
+        assert broken['status'] == 'failed'
+        assert 'optimizer diverged' in broken['reason']
+        summary = fitter.summary()
+        assert summary.loc[summary['Distribution'] == 'BrokenNormal', 'Status'].item() == 'failed'
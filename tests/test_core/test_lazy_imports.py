@@ -0,0 +1,74 @@
+"""Tests for lazy imports and the pandas-free fitting path."""
+
+import json
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import bestdist
+from bestdist import DistributionFitter
+from bestdist.distributions.continuous import Gamma, Normal
+
+
+def loaded_after(code):
+    """Heavy modules present in a fresh interpreter after running ``code``."""
+    script = (
+        f"{code}\nimport json, sys\n"
+        "print(json.dumps([m for m in ('pandas', 'matplotlib', 'scipy.stats') "
+        "if m in sys.modules]))"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_loads_no_heavy_modules():
+    """Test that importing the package loads neither pandas, matplotlib nor scipy.stats."""
+    assert loaded_after('import bestdist') == []
+
+
+def test_fit_without_pandas():
+    """Test that fitting and an array summary never import pandas."""
+    loaded = loaded_after(
+        "import numpy as np\n"
+        "from bestdist import DistributionFitter\n"
+        "fitter = DistributionFitter(np.random.default_rng(0).normal(size=300))\n"
+        "fitter.fit(verbose=False)\n"
+        "fitter.summary(as_array=True)"
+    )
+
+    assert 'pandas' not in loaded
+    assert 'matplotlib' not in loaded
+
+
+def test_lazy_attributes():
+    """Test that lazily exported names resolve, are listed and unknown names raise."""
+    from bestdist import distributions
+    from bestdist.distributions import continuous, discrete
+
+    assert bestdist.Gamma is Gamma
+    assert continuous.Gamma is Gamma
+    assert distributions.Normal is Normal
+    assert discrete.Poisson.__name__ == 'Poisson'
+    assert {'DistributionFitter', 'Gamma', 'Poisson'} <= set(dir(bestdist))
+    assert set(bestdist.__all__) - {'__version__'} <= set(dir(bestdist))
+    with pytest.raises(AttributeError):
+        bestdist.NotADistribution
+
+
+def test_summary_as_array(normal_data):
+    """Test that summary(as_array=True) matches the DataFrame column for column."""
+    fitter = DistributionFitter(normal_data, distributions=[Normal, Gamma])
+    fitter.fit(verbose=False)
+    table = fitter.summary(as_array=True)
+    frame = fitter.summary()
+
+    assert isinstance(table, np.ndarray)
+    assert list(table.dtype.names) == list(frame.columns)
+    assert list(table['Distribution']) == list(frame['Distribution'])
+    np.testing.assert_allclose(table['AIC'], frame['AIC'])
+    # Parameters missing from one family are NaN, as in the DataFrame
+    np.testing.assert_array_equal(np.isnan(table['param_a']), frame['param_a'].isna())
@@ -0,0 +1,193 @@
+"""Tests for analytic likelihood derivatives and gradient-based fits."""
+
+import numpy as np
+import pytest
+from scipy import optimize, stats
+from bestdist.core.likelihood import (
+    batch_log_likelihood_derivatives, log_likelihood_derivatives, maximize_likelihood,
+    screen_starts
+)
+from bestdist.distributions.continuous import (
+    Normal, Gamma, Weibull, Beta, Lognormal, StudentT, Cauchy
+)
+
+rng = np.random.default_rng(0)
+
+CASES = [
+    (stats.gamma, [2.0, -0.5, 1.5], rng.gamma(2.0, 1.5, 500)),
+    (stats.weibull_min, [1.7, -0.2, 1.2], rng.weibull(1.5, 500)),
+    (stats.lognorm, [0.6, -0.3, 1.1], rng.lognormal(0.0, 0.5, 500)),
+    (stats.beta, [2.0, 3.0, -0.1, 1.3], rng.beta(2.0, 3.0, 500)),
+    (stats.t, [4.0, 0.1, 1.2], rng.standard_t(5, 500)),
+    (stats.cauchy, [0.1, 1.2], rng.standard_cauchy(500)),
+]
+
+
+@pytest.mark.parametrize('scipy_dist, theta, data', CASES, ids=lambda c: getattr(c, 'name', ''))
+def test_derivatives_match_finite_differences(scipy_dist, theta, data):
+    """Test the log-likelihood, score and Hessian against scipy and finite differences."""
+    theta = np.array(theta)
+    log_likelihood, score, hessian = log_likelihood_derivatives(scipy_dist, theta, data)
+
+    assert log_likelihood == pytest.approx(-scipy_dist.nnlf(theta, data))
+    eps = 1e-6
+    for i in range(len(theta)):
+        step = np.zeros_like(theta)
+        step[i] = eps
+        upper = log_likelihood_derivatives(scipy_dist, theta + step, data)
+        lower = log_likelihood_derivatives(scipy_dist, theta - step, data)
+        assert score[i] == pytest.approx((upper[0] - lower[0]) / (2 * eps), rel=1e-5, abs=1e-5)
+        np.testing.assert_allclose(
+            hessian[i], (upper[1] - lower[1]) / (2 * eps), rtol=1e-5, atol=1e-4
+        )
+
+
+def test_outside_support():
+    """Test that data outside the support has zero likelihood."""
+    data = np.array([0.5, 2.0])
+    log_likelihood, _, _ = log_likelihood_derivatives(stats.gamma, [2.0, 1.0, 1.0], data)
+
+    assert log_likelihood == -np.inf
+
+
+@pytest.mark.parametrize('method', ['newton', 'lbfgsb'])
+@pytest.mark.parametrize('scipy_dist, theta, data', CASES, ids=lambda c: getattr(c, 'name', ''))
+def test_maximize_matches_scipy(scipy_dist, theta, data, method):
+    """Test that gradient fits reach at least scipy's optimum with fewer data passes."""
+    evaluations = []
+
+    def counting_fmin(func, x0, args=(), disp=0):
+        return optimize.fmin(lambda x: evaluations.append(1) or func(x, *args), x0, disp=disp)
+
+    reference = scipy_dist.fit(data, optimizer=counting_fmin)
+    fitted, info = maximize_likelihood(scipy_dist, data, scipy_dist._fitstart(data), method=method)
+
+    assert info['converged']
+    assert scipy_dist.nnlf(fitted, data) <= scipy_dist.nnlf(reference, data) + 1e-6
+    assert info['log_likelihood'] == pytest.approx(-scipy_dist.nnlf(fitted, data))
+    if method == 'newton' and evaluations:
+        # scipy's lognorm fit is closed form and makes no evaluations
+        assert info['data_passes'] * 3 < len(evaluations)
+
+
+class TestOptimizerBackend:
+    """Test suite for BaseDistribution.fit(optimizer=...)."""
+
+    @pytest.mark.parametrize('dist_class', [Gamma, Weibull, Lognormal, StudentT, Cauchy])
+    def test_same_fit(self, dist_class, gamma_data):
+        """Test that the backends agree on the fitted distribution."""
+        reference = dist_class(gamma_data)
+        reference.fit()
+        newton = dist_class(gamma_data)
+        newton.fit(optimizer='newton')
+
+        nll = reference._get_scipy_dist().nnlf
+        assert nll(tuple(newton.params.values()), gamma_data) <= nll(
+            tuple(reference.params.values()), gamma_data
+        ) + 1e-3
+        assert newton.fit_info['optimizer'] == 'newton'
+        assert newton.fit_info['converged']
+        assert reference.fit_info['optimizer'] == 'scipy'
+
+    def test_fixed_and_standardized(self):
+        """Test fixed parameters and badly scaled data with the Newton backend."""
+        data = np.random.default_rng(3).beta(2.0, 5.0, size=2000)
+        params = Beta(data, fixed={'loc': 0, 'scale': 1}).fit(optimizer='lbfgsb')
+        assert (params['loc'], params['scale']) == (0, 1)
+        assert params['a'] == pytest.approx(stats.beta.fit(data, floc=0, fscale=1)[0], rel=1e-4)
+
+        scaled = np.random.default_rng(4).gamma(3.0, 1e9, size=2000) + 1e12
+        dist = Gamma(scaled)
+        dist.fit(optimizer='newton')
+        assert dist.fit_info['log_likelihood'] == pytest.approx(
+            np.sum(dist.dist.logpdf(scaled)), rel=1e-9
+        )
+
+    def test_warm_start(self, gamma_data):
+        """Test that a warm start from the optimum needs few passes."""
+        cold = Gamma(gamma_data)
+        params = cold.fit(optimizer='newton')
+        warm = Gamma(gamma_data)
+        warm.fit(initial=params, optimizer='newton')
+
+        assert warm.fit_info['data_passes'] < cold.fit_info['data_passes']
+
+    def test_closed_form_family_uses_scipy(self, normal_data):
+        """Test that families without derivatives fall back to scipy."""
+        dist = Normal(normal_data)
+        dist.fit(optimizer='newton')
+
+        assert dist.fit_info['optimizer'] == 'scipy'
+        assert dist.fit_info['method'] == 'closed-form'
+
+    def test_unknown_optimizer(self, normal_data):
+        """Test that an unknown optimizer is rejected."""
+        with pytest.raises(ValueError, match="Unknown optimizer"):
+            Normal(normal_data).fit(optimizer='bfgs')
+
+
+class TestMultiStart:
+    """Test suite for batched multi-start fits."""
+
+    @pytest.fixture
+    def bimodal_data(self):
+        """Two tight clusters, a multimodal likelihood for heavy-tailed families."""
+        rng = np.random.default_rng(1)
+        return np.concatenate([rng.normal(0, 0.05, 300), rng.normal(10, 0.05, 400)])
+
+    @pytest.mark.parametrize('scipy_dist, theta, data', CASES, ids=lambda c: getattr(c, 'name', ''))
+    def test_batch_matches_single(self, scipy_dist, theta, data):
+        """Test that each row of a batch equals the single-vector derivatives."""
+        thetas = np.array([theta, theta, theta], dtype=float)
+        thetas[1, -1] *= 1.5
+        thetas[2, -1] = -1.0
+        log_likelihood, score, hessian = batch_log_likelihood_derivatives(scipy_dist, thetas, data)
+
+        for row in range(2):
+            single = log_likelihood_derivatives(scipy_dist, thetas[row], data)
+            assert log_likelihood[row] == pytest.approx(single[0])
+            np.testing.assert_allclose(score[row], single[1])
+            np.testing.assert_allclose(hessian[row], single[2])
+        assert log_likelihood[2] == -np.inf
+        assert not score[2].any()
+
+    def test_escapes_local_optimum(self, bimodal_data):
+        """Test that screening several starts finds a better optimum than one start."""
+        single = StudentT(bimodal_data)
+        single.fit(optimizer='newton')
+        multi = StudentT(bimodal_data)
+        multi.fit(optimizer='newton', n_starts=8)
+
+        nll = stats.t.nnlf
+        assert nll(tuple(multi.params.values()), bimodal_data) < nll(
+            tuple(single.params.values()), bimodal_data
+        ) - 10
+        assert multi.fit_info['starts'] == 8
+        assert multi.fit_info['converged']
+
+    def test_scipy_refinement(self, bimodal_data):
+        """Test refining the screened starts with scipy's fit, reproducibly."""
+        first = StudentT(bimodal_data).fit(n_starts=8)
+        second = StudentT(bimodal_data)
+        second.fit(n_starts=8)
+
+        assert second.params == first
+        assert second.fit_info['optimizer'] == 'scipy'
+        assert stats.t.nnlf(tuple(first.values()), bimodal_data) <= stats.t.nnlf(
+            stats.t.fit(bimodal_data), bimodal_data
+        )
+
+    def test_screen_keeps_distinct_points(self, bimodal_data):
+        """Test that screening returns at most n_keep feasible points, best first."""
+        data = (bimodal_data - np.median(bimodal_data)) / 5
+        points, info = screen_starts(stats.t, data, stats.t._fitstart(data), n_starts=6, n_keep=2)
+        values = [stats.t.nnlf(point, data) for point in points]
+
+        assert 1 <= len(points) <= 2
+        assert values == sorted(values)
+        assert info == {'starts': 6, 'screening_passes': 9}
+
+    def test_invalid_n_starts(self, normal_data):
+        """Test that n_starts must be positive."""
+        with pytest.raises(ValueError, match="n_starts"):
+            Normal(normal_data).fit(n_starts=0)
@@ -0,0 +1,125 @@
+"""Tests for per-stage memory instrumentation."""
+
+import tracemalloc
+import numpy as np
+import pytest
+from bestdist import DistributionFitter
+from bestdist.core.memory import stage_memory_end, stage_memory_start, tracing_memory
+from bestdist.core.tracing import run_stage
+from bestdist.distributions.continuous import Normal, Gamma
+
+CANDIDATE_STAGES = ['validate', 'fit', 'gof', 'aic_bic']
+FIELDS = {'peak_bytes', 'retained_bytes', 'allocated_blocks'}
+
+
+class TestStageMemory:
+    """Test suite for the tracemalloc helpers."""
+
+    def test_numpy_peak(self):
+        """Test that a temporary numpy buffer shows in the peak but is not retained."""
+        with tracing_memory():
+            start = stage_memory_start()
+            np.ones(1_000_000).sum()
+            usage = stage_memory_end(start)
+
+        assert usage['peak_bytes'] >= 8_000_000
+        assert usage['retained_bytes'] < 100_000
+        assert set(usage) == FIELDS
+
+    def test_peak_without_reset(self, monkeypatch):
+        """Test the Python 3.8 fallback, which can't reset tracemalloc's peak."""
+        monkeypatch.setattr('bestdist.core.memory._HAS_RESET_PEAK', False)
+        with tracing_memory():
+            np.ones(2_000_000).sum()
+            start = stage_memory_start()
+            np.ones(3_000_000).sum()
+            usage = stage_memory_end(start)
+
+        # The stage rose above the earlier peak, so its own peak is exact
+        assert usage['peak_bytes'] >= 24_000_000
+        assert usage['retained_bytes'] < 100_000
+
+    def test_run_stage(self):
+        """Test that run_stage stores memory use next to the timing, also when it raises."""
+        timings, memory = {}, {}
+        with tracing_memory():
+            run_stage(None, timings, 'fit', 'Gamma', 10, np.zeros, 500_000, memory=memory)
+            with pytest.raises(ZeroDivisionError):
+                run_stage(None, timings, 'gof', 'Gamma', 10, lambda: 1 / 0, memory=memory)
+
+        assert set(memory) == {'fit', 'gof'}
+        assert memory['fit']['retained_bytes'] >= 4_000_000
+
+    def test_leaves_caller_tracing_on(self):
+        """Test that tracing started by the caller survives."""
+        tracemalloc.start()
+        try:
+            with tracing_memory():
+                pass
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+        with tracing_memory():
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+
+
+class TestFitterMemory:
+    """Test suite for DistributionFitter.fit(trace_memory=True)."""
+
+    @pytest.mark.parametrize('options', [{}, {'n_jobs': 2}, {'isolate': True}])
+    def test_every_stage_measured(self, gamma_data, options):
+        """Test that each candidate reports the memory of each stage, wherever it ran."""
+        fitter = DistributionFitter(gamma_data, distributions=[Normal, Gamma])
+        results = fitter.fit(trace_memory=True, **options)
+
+        for result in results:
+            assert list(result['memory']) == CANDIDATE_STAGES
+            for usage in result['memory'].values():
+                assert set(usage) == FIELDS
+                assert usage['peak_bytes'] >= 0
+        assert not tracemalloc.is_tracing()
+
+    def test_peak_grows_with_data(self):
+        """Test that the goodness-of-fit peak scales with the sample size."""
+        rng = np.random.default_rng(0)
+        peaks = []
+        for n in (10_000, 200_000):
+            result = DistributionFitter(rng.gamma(2.0, 1.0, n), distributions=[Gamma]).fit(
+                trace_memory=True
+            )[0]
+            peaks.append(result['memory']['gof']['peak_bytes'])
+
+        assert peaks[1] > 10 * peaks[0]
+        assert peaks[1] >= 200_000 * 8
+
+    def test_off_by_default(self, gamma_data):
+        """Test that results carry no memory entry unless asked."""
+        fitter = DistributionFitter(gamma_data, distributions=[Gamma])
+        result = fitter.fit()[0]
+
+        assert 'memory' not in result
+        assert fitter.summary(memory=True)['Fitting Peak (MiB)'].isna().all()
+
+    def test_racing_and_summary(self, gamma_data):
+        """Test memory of pruned candidates and the summary columns."""
+        fitter = DistributionFitter(gamma_data, distributions=[Normal, Gamma])
+        fitter.RACE_MIN_SAMPLE = 100
+        fitter.RACE_FINALISTS = 1
+        results = fitter.fit(trace_memory=True, racing=True)
+        pruned = [r for r in results if r['status'] == 'pruned']
+
+        assert pruned
+        assert all(set(r['memory']) == {'validate', 'fit'} for r in pruned)
+        summary = fitter.summary(memory=True)
+        assert (summary.loc[summary['Status'] == 'fitted', 'GOF Test Peak (MiB)'] > 0).all()
+
+    def test_fit_many(self, gamma_data, normal_data):
+        """Test memory instrumentation across datasets."""
+        results = DistributionFitter.fit_many({
+            'a': DistributionFitter(gamma_data, distributions=[Gamma]),
+            'b': DistributionFitter(normal_data, distributions=[Normal]),
+        }, n_jobs=2, trace_memory=True)
+
+        assert all(list(r[0]['memory']) == CANDIDATE_STAGES for r in results.values())
@@ -0,0 +1,135 @@
+"""Tests for the metrics registry."""
+
+import pickle
+import threading
+import pytest
+from bestdist import DistributionFitter, MetricsRegistry, ResultCache
+from bestdist.core.metrics import default_registry, n_bucket
+from bestdist.distributions.continuous import Normal, Gamma
+
+
+class BrokenGamma(Gamma):
+    """Gamma whose fit always fails."""
+
+    def fit(self, **kwargs):
+        raise ValueError("boom")
+
+
+class TestRegistry:
+    """Test suite for counters, histograms and rendering."""
+
+    def test_counter_threads(self):
+        """Test that concurrent increments from many threads are all counted."""
+        counter = MetricsRegistry().counter('hits_total', 'Hits.', ('kind',))
+
+        def work():
+            for _ in range(10000):
+                counter.inc(kind='a')
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value(kind='a') == 80000
+        assert counter.value(kind='b') == 0
+
+    def test_histogram_quantiles(self):
+        """Test bucket counts and interpolated quantiles."""
+        histogram = MetricsRegistry().histogram('latency', 'Latency.', buckets=(1, 2, 4))
+        for value in [0.5] * 50 + [3.0] * 49 + [100.0]:
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == pytest.approx(1.0)
+        assert 2 < histogram.quantile(0.9) < 4
+        assert histogram.quantile(1.0) == 4
+
+    def test_prometheus_text(self):
+        """Test the text exposition format."""
+        registry = MetricsRegistry()
+        registry.counter('fits_total', 'Fits.', ('family',)).inc(3, family='Ga"mma')
+        registry.histogram('seconds', 'Seconds.', buckets=(0.5, 1)).observe(0.7)
+        text = registry.render_prometheus()
+
+        assert '# TYPE fits_total counter\n' in text
+        assert 'fits_total{family="Ga\\"mma"} 3\n' in text
+        assert 'seconds_bucket{le="0.5"} 0\n' in text
+        assert 'seconds_bucket{le="1"} 1\n' in text
+        assert 'seconds_bucket{le="+Inf"} 1\n' in text
+        assert 'seconds_count 1\n' in text
+        assert text.endswith('\n')
+
+    def test_registration(self):
+        """Test that metrics are registered once and types can't clash."""
+        registry = MetricsRegistry()
+        counter = registry.counter('x', 'X.')
+
+        assert registry.counter('x', 'X.') is counter
+        assert 'x' in registry
+        with pytest.raises(ValueError, match="counter"):
+            registry.histogram('x', 'X.')
+        with pytest.raises(ValueError, match="labels"):
+            counter.inc(family='Gamma')
+
+    def test_pickle(self):
+        """Test that registries pickle with their values; the default stays the default."""
+        registry = MetricsRegistry()
+        registry.counter('x', 'X.').inc(2)
+        copy = pickle.loads(pickle.dumps(registry))
+        copy.counter('x', 'X.').inc()
+
+        assert copy.counter('x', 'X.').value() == 3
+        assert pickle.loads(pickle.dumps(default_registry())) is default_registry()
+
+    def test_n_bucket(self):
+        """Test sample size labels."""
+        assert [n_bucket(n) for n in (1, 10, 11, 5000)] == ['1e0', '1e1', '1e2', '1e4']
+
+
+class TestFitterMetrics:
+    """Test suite for metrics recorded by DistributionFitter."""
+
+    def test_fits_failures_and_latency(self, gamma_data):
+        """Test counting fits and failures and observing latencies."""
+        registry = MetricsRegistry()
+        fitter = DistributionFitter(
+            gamma_data, distributions=[Normal, Gamma, BrokenGamma], metrics=registry
+        )
+        fitter.fit(verbose=False)
+        fitter.fit(verbose=False)
+        metrics = registry.as_dict()
+
+        fits = {
+            s['labels']['family']: s['value'] for s in metrics['bestdist_fits_total']['samples']
+        }
+        assert fits == {'Normal': 2, 'Gamma': 2}
+        failures = metrics['bestdist_fit_failures_total']['samples']
+        assert failures == [
+            {'labels': {'family': 'BrokenGamma', 'exception': 'ValueError'}, 'value': 2}
+        ]
+        latency = metrics['bestdist_fit_seconds']['samples']
+        assert {s['labels']['n'] for s in latency} == {n_bucket(len(gamma_data))}
+        assert all(s['count'] == 2 and s['p99'] >= s['p50'] > 0 for s in latency)
+
+    def test_cache_lookups(self, gamma_data):
+        """Test counting cache hits and misses."""
+        registry = MetricsRegistry()
+        cache = ResultCache()
+        for _ in range(3):
+            DistributionFitter(
+                gamma_data, distributions=[Gamma], cache=cache, metrics=registry
+            ).fit()
+        lookups = registry.counter('bestdist_cache_lookups_total', '', ('result',))
+
+        assert lookups.value(result='miss') == 1
+        assert lookups.value(result='hit') == 2
+        assert registry.counter('bestdist_fits_total', '', ('family',)).value(family='Gamma') == 1
+
+    def test_default_registry(self, gamma_data):
+        """Test that fitters record into the process-wide registry by default."""
+        counter = default_registry().counter('bestdist_fits_total', '', ('family',))
+        before = counter.value(family='Gamma')
+        DistributionFitter(gamma_data, distributions=[Gamma]).fit()
+
+        assert counter.value(family='Gamma') == before + 1
@@ -0,0 +1,65 @@
+"""Tests for FittedModel, the data-free fit results."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from bestdist import DistributionFitter, FittedModel
+from bestdist.core.base import BaseDistribution
+from bestdist.distributions.continuous import Gamma, Normal
+from bestdist.distributions.discrete import Poisson
+
+
+def test_results_hold_models(gamma_data):
+    """Test that results hold FittedModels matching the fitted distributions."""
+    results = DistributionFitter(gamma_data, distributions=[Gamma, Normal]).fit(verbose=False)
+    x = np.linspace(0.5, 10, 20)
+
+    for result in results:
+        model = result['distribution_object']
+        assert isinstance(model, FittedModel)
+        assert not hasattr(model, '__dict__')
+        assert model.params == result['parameters']
+        assert model.stats['aic'] == result['aic']
+        assert model.stats['n_observations'] == len(gamma_data)
+        reference = {'Gamma': Gamma, 'Normal': Normal}[result['distribution']](gamma_data)
+        reference.set_params(model.params)
+        np.testing.assert_allclose(model.pdf(x), reference.pdf(x))
+        np.testing.assert_allclose(model.ppf([0.1, 0.9]), reference.ppf([0.1, 0.9]))
+
+
+def test_results_drop_the_data():
+    """Test that pickled results no longer carry a copy of the data per candidate."""
+    data = np.random.default_rng(0).gamma(2.0, 2.0, size=100_000)
+    fitter = DistributionFitter(data, distributions=[Gamma, Normal])
+    compact = pickle.dumps(fitter.fit(verbose=False))
+    retained = pickle.dumps(fitter.fit(verbose=False, retain_data=True))
+
+    assert len(compact) < data.nbytes / 10
+    assert len(retained) > data.nbytes
+    assert isinstance(fitter.results[0]['distribution_object'], BaseDistribution)
+
+
+def test_pickle_rebuilds_frozen_distribution(gamma_data):
+    """Test that a model pickles without its frozen distribution and still evaluates."""
+    model = DistributionFitter(gamma_data, distributions=[Gamma]).fit()[0]['distribution_object']
+    restored = pickle.loads(pickle.dumps(model))
+
+    assert restored._frozen is None
+    assert restored.family is Gamma
+    np.testing.assert_allclose(restored.cdf([1.0, 3.0]), model.cdf([1.0, 3.0]))
+    assert repr(restored) == repr(model)
+
+
+def test_discrete_model():
+    """Test a model of a discrete family built from parameters alone."""
+    model = FittedModel(Poisson, {'mu': 3.5})
+
+    assert model.discrete
+    assert model.pmf(3) == pytest.approx(np.exp(-3.5) * 3.5 ** 3 / 6)
+    assert len(model.rvs(size=5, random_state=0)) == 5
+    with pytest.raises(AttributeError):
+        model.pdf(3)
+    with pytest.raises(AttributeError):
+        FittedModel(Normal, {'loc': 0.0, 'scale': 1.0}).pmf(0)
@@ -0,0 +1,304 @@
+"""Tests for chunked, out-of-core fitter construction."""
+
+import pytest
+import numpy as np
+import pandas as pd
+from bestdist import DistributionFitter
+from bestdist.core.histogram import CountHistogram
+from bestdist.core.sampling import ReservoirSample, StratifiedSample
+from bestdist.distributions.continuous import Normal, Gamma, Exponential, Cauchy, StudentT
+from bestdist.distributions.discrete import Poisson
+
+
+@pytest.fixture
+def gamma_file(tmp_path):
+    """Write gamma data to a .npy file."""
+    rng = np.random.default_rng(3)
+    data = rng.gamma(shape=2, scale=2, size=50_000)
+    path = tmp_path / 'gamma.npy'
+    np.save(path, data)
+    return path, data
+
+
+class TestReservoirSample:
+    """Test suite for ReservoirSample."""
+
+    def test_keeps_everything_under_capacity(self):
+        """Test that small streams are retained completely."""
+        reservoir = ReservoirSample(100, random_state=0)
+        reservoir.update(np.arange(30)).update(np.arange(30, 60))
+
+        assert reservoir.is_complete
+        np.testing.assert_array_equal(reservoir.sample, np.arange(60))
+
+    def test_uniform_inclusion(self):
+        """Test that every stream position is sampled about equally often."""
+        hits = np.zeros(1000)
+        for seed in range(300):
+            reservoir = ReservoirSample(100, random_state=seed)
+            for chunk in np.array_split(np.arange(1000), 7):
+                reservoir.update(chunk)
+            hits[reservoir.sample] += 1
+
+        # Each position has inclusion probability 0.1
+        first_half, second_half = hits[:500].mean(), hits[500:].mean()
+        assert np.isclose(first_half / 300, 0.1, atol=0.01)
+        assert np.isclose(second_half / 300, 0.1, atol=0.01)
+
+    def test_merge(self):
+        """Test merging reservoirs from separate workers."""
+        left = ReservoirSample(50, random_state=0).update(np.zeros(1000))
+        right = ReservoirSample(50, random_state=1).update(np.ones(3000))
+        left.merge(right)
+
+        assert left.n_seen == 4000
+        assert len(left) == 50
+        assert 0.5 < left.sample.mean() <= 1.0
+
+    def test_merge_into_empty_is_uniform(self):
+        """Test that merging into a smaller empty reservoir subsamples uniformly."""
+        hits = np.zeros(400)
+        for seed in range(300):
+            full = ReservoirSample(400, random_state=seed).update(np.arange(400))
+            hits[ReservoirSample(100, random_state=seed).merge(full).sample] += 1
+
+        # Each position has inclusion probability 0.25, not just the first 100
+        assert np.isclose(hits[:100].mean() / 300, 0.25, atol=0.02)
+        assert np.isclose(hits[300:].mean() / 300, 0.25, atol=0.02)
+        assert hits.max() < 300
+
+
+class TestStratifiedSample:
+    """Test suite for StratifiedSample."""
+
+    def test_tails_are_exact(self):
+        """Test that the extremes of the stream are retained exactly."""
+        data = np.random.default_rng(0).standard_cauchy(20_000)
+        sample = StratifiedSample(1000, tail_size=50, random_state=0)
+        for chunk in np.array_split(data, 9):
+            sample.update(chunk)
+
+        ordered = np.sort(data)
+        expected = np.concatenate([ordered[:50], ordered[-50:]])
+        np.testing.assert_array_equal(sample.tail, expected)
+        assert len(sample.sample) == 1000
+        assert len(sample) == 1100
+
+    def test_no_tail_while_complete(self):
+        """Test that small streams are kept whole without separate tails."""
+        sample = StratifiedSample(100, tail_size=10).update(np.arange(80.0))
+
+        assert len(sample.tail) == 0
+        assert len(sample.sample) == 80
+
+    def test_from_budget(self):
+        """Test sizing the reservoir to a byte budget."""
+        sample = StratifiedSample.from_budget(80_000, tail_size=500)
+
+        assert sample.reservoir.capacity == 9000
+        assert sample.nbytes == 80_000
+        float32 = StratifiedSample.from_budget(80_000, np.float32, tail_size=500)
+        assert float32.reservoir.capacity == 19_000
+
+    def test_budget_too_small(self):
+        """Test that a budget that can't hold the tails is rejected."""
+        with pytest.raises(ValueError, match="too small"):
+            StratifiedSample.from_budget(1000, tail_size=100)
+
+    def test_merge(self):
+        """Test merging samples keeps the global extremes."""
+        left = StratifiedSample(100, tail_size=5, random_state=0).update(np.arange(1000.0))
+        right = StratifiedSample(100, tail_size=5, random_state=1).update(np.arange(1000.0, 3000.0))
+        left.merge(right)
+
+        assert left.n_seen == 3000
+        np.testing.assert_array_equal(left.tail[:5], np.arange(5.0))
+        np.testing.assert_array_equal(left.tail[5:], np.arange(2995.0, 3000.0))
+
+
+class TestMemoryBudget:
+    """Test suite for the max_memory option."""
+
+    @pytest.fixture
+    def heavy_tailed_data(self):
+        """Generate Student-t data with two degrees of freedom."""
+        return np.random.default_rng(0).standard_t(2, size=200_000)
+
+    def test_small_data_untouched(self, normal_data):
+        """Test that data within the budget is used as is."""
+        fitter = DistributionFitter(normal_data, max_memory=1 << 20)
+
+        assert fitter.n_total is None
+        assert fitter.tail is None
+        assert 'Effective N' not in fitter.summary().columns
+
+    def test_in_memory_data_reduced(self, heavy_tailed_data):
+        """Test that large in-memory data is reduced to the budget."""
+        fitter = DistributionFitter(
+            heavy_tailed_data, distributions=[Normal, StudentT, Cauchy],
+            max_memory=80_000, tail_size=200, random_state=0
+        )
+
+        assert fitter.data.nbytes + fitter.tail.nbytes <= 80_000
+        assert fitter.n_observations == len(heavy_tailed_data)
+        assert fitter.tail.max() == heavy_tailed_data.max()
+        assert fitter.tail.min() == heavy_tailed_data.min()
+        assert fitter.get_best_distribution(criterion='aic')['distribution'] == 'StudentT'
+
+    def test_aic_estimates_full_data(self, heavy_tailed_data):
+        """Test that the stratified AIC is on the scale of the full data."""
+        sampled = DistributionFitter(
+            heavy_tailed_data, distributions=[StudentT],
+            max_memory=160_000, tail_size=200, random_state=0
+        )
+        result = sampled.fit(verbose=False)[0]
+
+        # AIC of the same fitted distribution over every observation
+        dist = result['distribution_object']
+        full_log_likelihood = np.sum(np.log(dist.pdf(heavy_tailed_data) + 1e-10))
+        full_aic = 2 * len(dist.params) - 2 * full_log_likelihood
+        assert np.isclose(result['aic'], full_aic, rtol=0.01)
+
+    @pytest.mark.parametrize('dist_class', [Normal, StudentT])
+    def test_stratified_log_likelihood_unbiased(self, dist_class):
+        """Test the stratified log-likelihood against the exact one on heavy tails."""
+        data = np.random.default_rng(1).standard_t(3, size=1_000_000)
+        fitter = DistributionFitter(
+            data, distributions=[dist_class], max_memory=800_000, tail_size=1000, random_state=0
+        )
+        dist = fitter.fit(verbose=False)[0]['distribution_object']
+
+        exact = np.sum(np.log(dist.pdf(data) + 1e-10))
+        # Counting reservoir points inside the tail strata twice was off by 2%
+        assert fitter._log_likelihood(dist) == pytest.approx(exact, rel=2e-3)
+
+    def test_summary_reports_sampling(self, heavy_tailed_data):
+        """Test that summary() reports effective sample size and tails."""
+        fitter = DistributionFitter(
+            heavy_tailed_data, distributions=[Normal, StudentT],
+            max_memory=80_000, tail_size=200, random_state=0
+        )
+        summary = fitter.summary()
+
+        assert (summary['Tail Points'] == 400).all()
+        assert np.allclose(summary['Effective N'], fitter.effective_sample_size)
+        assert len(fitter.data) <= fitter.effective_sample_size < len(fitter.data) + 400
+
+    def test_from_chunks_with_budget(self, heavy_tailed_data):
+        """Test streaming an unbounded feed into a fixed budget."""
+        fitter = DistributionFitter.from_chunks(
+            np.array_split(heavy_tailed_data, 50),
+            distributions=[Normal, StudentT],
+            max_memory=40_000, tail_size=100, compact=True, random_state=0
+        )
+
+        assert fitter.data.dtype == np.float32
+        assert len(fitter.data) == 9800
+        assert len(fitter.tail) == 200
+        assert fitter.n_observations == len(heavy_tailed_data)
+        assert fitter.get_best_distribution(criterion='aic')['distribution'] == 'StudentT'
+
+    def test_discrete_data_becomes_histogram(self):
+        """Test that large count data is summarized by a histogram."""
+        data = np.random.default_rng(1).poisson(4, size=50_000)
+        fitter = DistributionFitter(
+            data, dist_type='discrete', distributions=[Poisson], max_memory=10_000
+        )
+
+        assert isinstance(fitter.data, CountHistogram)
+        assert fitter.n_observations == len(data)
+        assert np.isclose(fitter.get_best_distribution()['parameters']['mu'], data.mean())
+
+
+class TestOutOfCoreFitter:
+    """Test suite for DistributionFitter file and chunk constructors."""
+
+    def test_from_npy_small_file_is_exact(self, gamma_file):
+        """Test that files within the sample size are fitted exactly."""
+        path, data = gamma_file
+        fitter = DistributionFitter.from_npy(path, distributions=[Gamma])
+
+        assert fitter.n_total is None
+        assert fitter.method == 'ks'
+        np.testing.assert_array_equal(fitter.data, data)
+
+    def test_from_npy_subsampled(self, gamma_file):
+        """Test fitting a file larger than the sample size."""
+        path, data = gamma_file
+        fitter = DistributionFitter.from_npy(
+            path,
+            distributions=[Normal, Gamma, Exponential],
+            chunk_size=4096,
+            sample_size=5000,
+            random_state=0
+        )
+
+        assert len(fitter.data) == 5000
+        assert fitter.n_observations == len(data)
+        assert fitter.sample_fraction == pytest.approx(0.1)
+        assert fitter.method == 'ks_sketch'
+        assert fitter.sketch.n == len(data)
+
+        best = fitter.get_best_distribution(criterion='aic')
+        assert best['distribution'] == 'Gamma'
+        assert np.isclose(best['parameters']['a'], 2, rtol=0.2)
+
+    def test_aic_scaled_to_full_data(self, gamma_file):
+        """Test that subsampled AIC is on the scale of the full data."""
+        path, data = gamma_file
+        sampled = DistributionFitter.from_npy(
+            path, distributions=[Gamma], sample_size=10_000, random_state=0
+        )
+        full = DistributionFitter(data, distributions=[Gamma])
+
+        sampled_aic = sampled.fit(verbose=False)[0]['aic']
+        full_aic = full.fit(verbose=False)[0]['aic']
+        assert np.isclose(sampled_aic, full_aic, rtol=0.01)
+
+    def test_from_npy_discrete(self, tmp_path):
+        """Test discrete .npy files are summarized by a histogram."""
+        rng = np.random.default_rng(5)
+        data = rng.poisson(lam=4, size=20_000)
+        path = tmp_path / 'counts.npy'
+        np.save(path, data)
+
+        fitter = DistributionFitter.from_npy(
+            path, dist_type='discrete', chunk_size=1000, distributions=[Poisson]
+        )
+        best = fitter.get_best_distribution()
+
+        assert fitter.n_observations == len(data)
+        assert np.isclose(best['parameters']['mu'], np.mean(data))
+
+    def test_from_csv(self, tmp_path):
+        """Test reading one column of a CSV file in chunks."""
+        rng = np.random.default_rng(9)
+        frame = pd.DataFrame({
+            'id': np.arange(3000),
+            'latency': rng.gamma(shape=3, scale=1, size=3000),
+        })
+        frame.loc[::100, 'latency'] = np.nan
+        path = tmp_path / 'data.csv'
+        frame.to_csv(path, index=False)
+
+        fitter = DistributionFitter.from_csv(
+            path, 'latency', chunk_size=500, sample_size=1000,
+            distributions=[Normal, Gamma], random_state=0
+        )
+
+        assert fitter.n_observations == 2970
+        assert fitter.get_best_distribution(criterion='aic')['distribution'] == 'Gamma'
+
+    def test_from_parquet(self, tmp_path):
+        """Test reading one column of a Parquet file in batches."""
+        pytest.importorskip('pyarrow')
+        rng = np.random.default_rng(11)
+        frame = pd.DataFrame({'value': rng.normal(5, 2, size=4000)})
+        path = tmp_path / 'data.parquet'
+        frame.to_parquet(path)
+
+        fitter = DistributionFitter.from_parquet(
+            path, 'value', chunk_size=512, distributions=[Normal, Gamma]
+        )
+        assert fitter.n_observations == 4000
+        assert fitter.get_best_distribution()['distribution'] == 'Normal'
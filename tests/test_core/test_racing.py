@@ -0,0 +1,95 @@
+"""Tests for successive-halving candidate racing."""
+
+import pytest
+import numpy as np
+from bestdist import CountHistogram, DistributionFitter
+
+
+@pytest.fixture
+def lognormal_data():
+    """Generate a larger skewed sample to race on."""
+    return np.random.default_rng(0).lognormal(0, 0.6, size=10_000)
+
+
+@pytest.fixture(autouse=True)
+def small_rungs(monkeypatch):
+    """Start racing on small samples to keep the tests fast."""
+    monkeypatch.setattr(DistributionFitter, 'RACE_MIN_SAMPLE', 500)
+
+
+class TestRacing:
+    """Test suite for fit(racing=True)."""
+
+    def test_prunes_to_finalists(self, lognormal_data):
+        """Test that only the finalists are fitted on the full data."""
+        fitter = DistributionFitter(lognormal_data, random_state=0)
+        results = fitter.fit(racing=True)
+
+        fitted = [r for r in results if r['status'] == 'fitted']
+        pruned = [r for r in results if r['status'] == 'pruned']
+        assert len(fitted) == DistributionFitter.RACE_FINALISTS
+        assert len(fitted) + len(pruned) == len(fitter.distributions)
+        assert results[:len(fitted)] == fitted
+        assert fitter.get_best_distribution(criterion='aic')['distribution'] == 'Lognormal'
+
+    def test_pruned_results(self, lognormal_data):
+        """Test that pruned candidates record their rung."""
+        fitter = DistributionFitter(lognormal_data, random_state=0)
+        pruned = [r for r in fitter.fit(racing=True) if r['status'] == 'pruned']
+
+        rungs = [r['rung'] for r in pruned]
+        assert rungs == sorted(rungs, reverse=True)
+        for result in pruned:
+            assert result['sample_size'] == 500 * 2 ** result['rung']
+            assert result['aic'] is None
+            assert 'rung' in result['reason']
+        # Uniform is far off on skewed data
+        assert 'Uniform' in {r['distribution'] for r in pruned if r['rung'] == 0}
+
+    def test_ks_metric(self, lognormal_data):
+        """Test racing by KS statistic."""
+        fitter = DistributionFitter(lognormal_data, random_state=0)
+        results = fitter.fit(racing=True, race_metric='ks')
+
+        pruned = [r for r in results if r['status'] == 'pruned']
+        assert pruned
+        assert all(0 <= r['race_score'] <= 1 for r in pruned)
+        assert fitter.get_best_distribution(criterion='aic')['distribution'] == 'Lognormal'
+
+    def test_reproducible(self, lognormal_data):
+        """Test that a seeded race prunes the same candidates."""
+        first = DistributionFitter(lognormal_data, random_state=3).fit(racing=True)
+        second = DistributionFitter(lognormal_data, random_state=3).fit(racing=True)
+
+        assert [r['distribution'] for r in first] == [r['distribution'] for r in second]
+
+    def test_small_data_not_raced(self, normal_data):
+        """Test that data smaller than the first rung is fitted in full."""
+        fitter = DistributionFitter(normal_data[:400])
+        results = fitter.fit(racing=True)
+
+        assert all(r['status'] == 'fitted' for r in results)
+        assert 'Status' not in fitter.summary().columns
+
+    def test_histogram_not_raced(self):
+        """Test that racing is ignored for histogram data."""
+        counts = np.random.default_rng(1).poisson(3, size=5000)
+        fitter = DistributionFitter(CountHistogram.from_data(counts), dist_type='discrete')
+
+        assert all(r['status'] == 'fitted' for r in fitter.fit(racing=True))
+
+    def test_summary_and_plots(self, lognormal_data):
+        """Test that summary lists pruned candidates and plots skip them."""
+        fitter = DistributionFitter(lognormal_data, random_state=0)
+        fitter.fit(racing=True)
+        summary = fitter.summary()
+
+        assert len(summary) == len(fitter.distributions)
+        assert set(summary['Status']) == {'fitted', 'pruned'}
+        fig = fitter.compare_distributions()
+        assert sum(ax.has_data() for ax in fig.axes) == DistributionFitter.RACE_FINALISTS
+
+    def test_unknown_metric(self, normal_data):
+        """Test that an unknown racing metric is rejected."""
+        with pytest.raises(ValueError, match="race_metric"):
+            DistributionFitter(normal_data).fit(racing=True, race_metric='aic')
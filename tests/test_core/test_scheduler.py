@@ -0,0 +1,156 @@
+"""Tests for the runtime cost model and parallel fit scheduling."""
+
+import json
+import pytest
+import numpy as np
+from bestdist import DistributionFitter
+from bestdist.core.scheduler import CostModel, default_cost_model_path, lpt_schedule
+from bestdist.distributions.continuous import Normal, Gamma, Exponential, Weibull
+from bestdist.distributions.discrete import Poisson
+
+
+@pytest.fixture
+def unit_costs():
+    """Cost model where a family's cost per point is its listed value."""
+    return CostModel({
+        'A': (0.0, 7.0), 'B': (0.0, 5.0), 'C': (0.0, 4.0), 'D': (0.0, 3.0), 'E': (0.0, 1.0),
+    })
+
+
+class TestCostModel:
+    """Test suite for CostModel."""
+
+    def test_default_ordering(self):
+        """Test that the built-in model ranks slow families first."""
+        model = CostModel()
+        n = 100_000
+
+        assert model.predict('StudentT', n) > model.predict('Gamma', n) > model.predict('Normal', n)
+        assert model.predict(Normal, n) == model.predict('Normal', n)
+        assert model.predict('Custom', n) > 0
+
+    def test_save_and_load(self, tmp_path):
+        """Test saving calibrated coefficients locally."""
+        path = CostModel({'Normal': (0.5, 1e-3)}).save(tmp_path / 'model.json')
+        loaded = CostModel.load(path)
+
+        assert loaded.coefficients['Normal'] == (0.5, 1e-3)
+        assert json.loads(path.read_text())['version'] == 1
+
+    def test_default_path(self, tmp_path, monkeypatch):
+        """Test that the default location follows XDG_CACHE_HOME."""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        path = CostModel({'Gamma': (1.0, 0.0)}).save()
+
+        assert path == tmp_path / 'bestdist' / 'cost_model.json'
+        assert path == default_cost_model_path()
+        assert CostModel.load().predict('Gamma', 10) == 1.0
+
+    def test_load_missing_or_corrupt(self, tmp_path):
+        """Test falling back to the defaults."""
+        corrupt = tmp_path / 'corrupt.json'
+        corrupt.write_text('{not json')
+
+        default = CostModel().coefficients
+        assert CostModel.load(tmp_path / 'missing.json').coefficients == default
+        assert CostModel.load(corrupt).coefficients == default
+
+    def test_calibrate(self):
+        """Test measuring coefficients with a small benchmark."""
+        model = CostModel.calibrate([Normal, Gamma, Poisson], sizes=(200, 400, 800))
+
+        for name in ('Normal', 'Gamma', 'Poisson'):
+            overhead, per_point = model.coefficients[name]
+            assert overhead >= 0 and per_point >= 0
+        assert model.predict('Gamma', 800) > model.predict('Normal', 800)
+
+
+class TestLptSchedule:
+    """Test suite for lpt_schedule."""
+
+    def test_longest_first(self, unit_costs):
+        """Test dispatch order and worker assignment."""
+        tasks = [(None, name, 1) for name in 'EDCBA']
+        schedule = lpt_schedule(tasks, 2, unit_costs)
+
+        assert [t.family for t in schedule.tasks] == list('ABCDE')
+        # A | B, then C goes to B's worker (free at 5), D to A's (free at 7), E to C's
+        assert schedule.makespan == 10
+        assert schedule.time_to_first_result == 5
+
+    def test_groups(self, unit_costs):
+        """Test per-dataset estimates across datasets."""
+        tasks = [('x', 'A', 1), ('x', 'E', 1), ('y', 'B', 1), ('y', 'C', 1)]
+        schedule = lpt_schedule(tasks, 2, unit_costs)
+
+        assert schedule.first_result('y') == 5
+        assert schedule.completion('y') == 9
+        assert schedule.first_result('x') == 7
+        assert schedule.completion('x') == 8
+
+    def test_scales_with_n(self):
+        """Test that a large dataset's fits are dispatched first."""
+        model = CostModel()
+        schedule = lpt_schedule([('small', 'Gamma', 100), ('large', 'Gamma', 10**6)], 1, model)
+
+        assert schedule.tasks[0].group == 'large'
+
+
+class TestParallelFit:
+    """Test suite for fit(n_jobs=...) and fit_many."""
+
+    def test_parallel_matches_serial(self, gamma_data):
+        """Test that worker processes produce the same fits."""
+        candidates = [Normal, Gamma, Exponential, Weibull]
+        serial = DistributionFitter(gamma_data, distributions=candidates).fit()
+        parallel = DistributionFitter(gamma_data, distributions=candidates).fit(n_jobs=2)
+
+        by_name = {r['distribution']: r for r in serial}
+        assert len(parallel) == len(serial)
+        for result in parallel:
+            expected = by_name[result['distribution']]
+            assert result['parameters'] == pytest.approx(expected['parameters'])
+            assert result['aic'] == pytest.approx(expected['aic'])
+
+    def test_plan(self, gamma_data):
+        """Test predicting the schedule of a fit."""
+        fitter = DistributionFitter(gamma_data)
+        schedule = fitter.plan(n_jobs=2)
+
+        assert len(schedule.tasks) == len(fitter.distributions)
+        assert 0 < schedule.time_to_first_result <= schedule.makespan
+        costs = [task.cost for task in schedule.tasks]
+        assert costs == sorted(costs, reverse=True)
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_fit_many(self, gamma_data, n_jobs):
+        """Test fitting several datasets through one schedule."""
+        counts = np.random.default_rng(0).poisson(3, size=2000)
+        fitters = {
+            'gamma': DistributionFitter(gamma_data, distributions=[Normal, Gamma]),
+            'counts': DistributionFitter(counts, dist_type='discrete', distributions=[Poisson]),
+        }
+        results = DistributionFitter.fit_many(fitters, n_jobs=n_jobs)
+
+        assert results['gamma'][0]['distribution'] == 'Gamma'
+        assert results['counts'][0]['parameters']['mu'] == pytest.approx(counts.mean())
+        assert fitters['gamma'].get_best_distribution() is results['gamma'][0]
+
+        schedule = DistributionFitter.plan_many(fitters, n_jobs=n_jobs)
+        assert schedule.completion('counts') <= schedule.makespan
+
+    def test_invalid_n_jobs(self, normal_data):
+        """Test that zero workers is rejected."""
+        with pytest.raises(ValueError, match="n_jobs"):
+            DistributionFitter(normal_data).fit(n_jobs=0)
+
+
+def test_set_params(normal_data):
+    """Test rebuilding a fitted distribution from known parameters."""
+    fitted = Normal(normal_data)
+    params = fitted.fit()
+    rebuilt = Normal(normal_data)
+    rebuilt.set_params(params)
+
+    assert rebuilt.params == params
+    assert rebuilt.pdf(np.array([10.0])) == pytest.approx(fitted.pdf(np.array([10.0])))
@@ -0,0 +1,162 @@
+"""Tests for moment-based candidate screening."""
+
+import pytest
+import numpy as np
+from scipy import stats
+from benchmarks.common import FAMILIES
+from benchmarks.conformance import PARAMETER_RANGES, Case, draw_cases
+from bestdist import CountHistogram, DistributionFitter
+from bestdist.core.screening import DataProfile, screen_candidates
+from bestdist.distributions.continuous import (
+    Normal, Gamma, Exponential, Uniform, Cauchy, Lognormal, Weibull
+)
+from bestdist.distributions.discrete import Poisson, Binomial, NegativeBinomial, Geometric
+
+
+def _skipped(results):
+    return {r['distribution']: r for r in results if r['status'] == 'skipped'}
+
+
+class TestDataProfile:
+    """Test suite for DataProfile."""
+
+    def test_moments_match_scipy(self, gamma_data):
+        """Test skewness and (non-excess) kurtosis against scipy."""
+        profile = DataProfile.from_data(gamma_data, chunk_size=97)
+
+        assert profile.n == len(gamma_data)
+        assert profile.mean == pytest.approx(np.mean(gamma_data))
+        assert profile.variance == pytest.approx(np.var(gamma_data))
+        assert profile.skewness == pytest.approx(stats.skew(gamma_data))
+        assert profile.kurtosis == pytest.approx(stats.kurtosis(gamma_data) + 3)
+        assert profile.minimum == gamma_data.min()
+
+    def test_histogram_matches_array(self):
+        """Test that a histogram profiles the same as its raw counts."""
+        counts = np.random.default_rng(0).poisson(4, size=3000)
+        from_array = DataProfile.from_data(counts)
+        from_histogram = DataProfile.from_histogram(CountHistogram.from_data(counts))
+
+        assert from_histogram.n == from_array.n
+        assert from_histogram.skewness == pytest.approx(from_array.skewness)
+        assert from_histogram.kurtosis == pytest.approx(from_array.kurtosis)
+
+
+class TestScreenCandidates:
+    """Test suite for screen_candidates."""
+
+    def test_exponential_skipped_on_left_skew(self):
+        """Test that Exponential is skipped for strongly left-skewed data."""
+        data = -np.random.default_rng(1).gamma(20, 2, size=2000)
+        kept, skipped = screen_candidates(
+            [Normal, Exponential], DataProfile.from_data(data), 'conservative'
+        )
+
+        assert kept == [Normal]
+        assert [s[0] for s in skipped] == [Exponential]
+        assert skipped[0][2] > 1
+
+    def test_aggressive_is_stricter(self):
+        """Test that aggressive screening skips a superset of conservative."""
+        data = np.random.default_rng(2).uniform(size=2000)
+        profile = DataProfile.from_data(data)
+        candidates = DistributionFitter.DEFAULT_CONTINUOUS_DISTRIBUTIONS
+        _, conservative = screen_candidates(candidates, profile, 'conservative')
+        kept, aggressive = screen_candidates(candidates, profile, 'aggressive')
+
+        assert {s[0] for s in conservative} <= {s[0] for s in aggressive}
+        assert Uniform in kept
+        assert Cauchy in {s[0] for s in aggressive}
+
+    def test_discrete_dispersion(self):
+        """Test that dispersion rules out Poisson and Binomial for overdispersed counts."""
+        data = np.random.default_rng(3).negative_binomial(3, 0.4, size=2000)
+        kept, skipped = screen_candidates(
+            [Poisson, Binomial, NegativeBinomial, Geometric],
+            DataProfile.from_data(data), 'conservative', discrete=True
+        )
+
+        assert kept == [NegativeBinomial]
+        reasons = {s[0]: s[1] for s in skipped}
+        assert 'dispersion index' in reasons[Poisson]
+        assert 'support' in reasons[Geometric]
+
+    @pytest.mark.parametrize('family', list(PARAMETER_RANGES))
+    def test_conservative_keeps_generating_family(self, family):
+        """Test that conservative screening never skips the family that generated the data."""
+        dist_class, _ = FAMILIES[family]
+        discrete = dist_class in DistributionFitter.DEFAULT_DISCRETE_DISTRIBUTIONS
+        for case in draw_cases([family], sizes=(1_000, 100_000), n_cases=8, seed=3):
+            profile = DataProfile.from_data(case.data().astype(np.float64))
+            kept, _ = screen_candidates([dist_class], profile, 'conservative', discrete)
+            assert kept == [dist_class], case
+
+    @pytest.mark.parametrize('s', [1.5, 2.0, 2.5])
+    @pytest.mark.parametrize('n', [1_000, 100_000])
+    def test_conservative_keeps_heavy_lognormal(self, s, n):
+        """Test that lognormal data keeps Lognormal despite its biased sample moments."""
+        data = Case('Lognormal', {'s': s, 'loc': 0, 'scale': 1}, n, 0).data()
+        kept, _ = screen_candidates(
+            [Gamma, Weibull, Lognormal], DataProfile.from_data(data), 'conservative'
+        )
+        assert Lognormal in kept
+
+    def test_unknown_families_kept(self, normal_data):
+        """Test that families without a moment region are never skipped."""
+        class Custom(Normal):
+            pass
+
+        skewed = np.random.default_rng(6).exponential(size=1000)
+        kept, skipped = screen_candidates([Custom], DataProfile.from_data(skewed), 'aggressive')
+        assert kept == [Custom] and not skipped
+
+    def test_unknown_mode(self, normal_data):
+        """Test that an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="screening mode"):
+            screen_candidates([Normal], DataProfile.from_data(normal_data), 'strict')
+
+
+class TestFitterScreening:
+    """Test suite for fit(screening=...)."""
+
+    def test_off_by_default(self, gamma_data):
+        """Test that no candidate is skipped unless screening is enabled."""
+        results = DistributionFitter(gamma_data).fit()
+
+        assert all(r['status'] == 'fitted' for r in results)
+
+    def test_skipped_results(self, gamma_data):
+        """Test that skipped candidates are reported with a reason."""
+        fitter = DistributionFitter(gamma_data)
+        results = fitter.fit(screening='conservative')
+        skipped = _skipped(results)
+
+        assert {'Normal', 'Uniform', 'Exponential'} >= set(skipped) >= {'Uniform'}
+        for result in skipped.values():
+            assert result['aic'] is None
+            assert 'tolerance units' in result['reason']
+        assert results[-len(skipped):] == list(skipped.values())
+        assert fitter.get_best_distribution(criterion='aic')['distribution'] == 'Gamma'
+
+        summary = fitter.summary()
+        assert set(summary.loc[summary['Status'] == 'skipped', 'Distribution']) == set(skipped)
+
+    def test_histogram_screening(self):
+        """Test screening discrete histogram data."""
+        counts = np.random.default_rng(4).poisson(4, size=5000)
+        fitter = DistributionFitter(CountHistogram.from_data(counts), dist_type='discrete')
+        results = fitter.fit(screening='aggressive')
+
+        assert 'Geometric' in _skipped(results)
+        assert fitter.get_best_distribution(criterion='aic')['distribution'] == 'Poisson'
+
+    def test_combined_with_racing(self, monkeypatch):
+        """Test that screening runs before racing."""
+        monkeypatch.setattr(DistributionFitter, 'RACE_MIN_SAMPLE', 500)
+        data = np.random.default_rng(5).gamma(2, 2, size=5000)
+        fitter = DistributionFitter(data, distributions=[Normal, Gamma, Exponential, Uniform])
+        results = fitter.fit(racing=True, screening='conservative')
+
+        statuses = {r['distribution']: r['status'] for r in results}
+        assert statuses['Uniform'] == 'skipped'
+        assert statuses['Gamma'] == 'fitted'
@@ -0,0 +1,148 @@
+"""Tests for serializing fitted models and result tables."""
+
+import json
+import math
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from bestdist import DistributionFitter, FittedModel, ResultTable
+from bestdist.core.model import family_key, resolve_family
+from bestdist.distributions.continuous import Gamma, Lognormal, Normal
+from bestdist.utils.packing import pack, unpack
+
+
+class ShiftedGamma(Gamma):
+    """A user-defined family, serialized by module and class name."""
+
+
+@pytest.fixture
+def fitter(gamma_data):
+    fitter = DistributionFitter(gamma_data, distributions=[Gamma, Lognormal, Normal])
+    fitter.fit(verbose=False)
+    return fitter
+
+
+def test_pack_round_trip():
+    """Test that packed values decode to equal Python values."""
+    value = {
+        'float': np.float64(1.5), 'int': np.int64(-3), 'flags': [True, False, None],
+        'text': 'gamma é', 'nested': {'inf': float('inf'), 'tuple': (1, 2)},
+    }
+    decoded, end = unpack(pack(value))
+
+    assert end == len(pack(value))
+    assert decoded['nested'] == {'inf': float('inf'), 'tuple': [1, 2]}
+    assert decoded['float'] == 1.5 and decoded['int'] == -3
+    assert decoded['flags'] == [True, False, None] and decoded['text'] == 'gamma é'
+    assert math.isnan(unpack(pack(float('nan')))[0])
+    with pytest.raises(ValueError):
+        unpack(pack(value)[:-4])
+    with pytest.raises(TypeError):
+        pack({1: 'not a string key'})
+
+
+@pytest.mark.parametrize('form', ['json', 'bytes'])
+def test_model_round_trip(fitter, form):
+    """Test that a loaded model evaluates like the fitted one, without refitting."""
+    model = fitter.get_best_distribution()['distribution_object']
+    if form == 'json':
+        loaded = FittedModel.from_json(model.to_json())
+    else:
+        loaded = FittedModel.from_bytes(model.to_bytes())
+
+    assert loaded.family is model.family
+    assert loaded.params == model.params
+    assert loaded.stats == model.stats
+    assert loaded.fit_info == model.fit_info
+    x = np.linspace(0.5, 8, 10)
+    np.testing.assert_array_equal(loaded.pdf(x), model.pdf(x))
+    assert len(model.to_bytes()) < len(model.to_json())
+
+
+def test_model_rejects_other_payloads(fitter):
+    """Test that unsupported versions and foreign payloads raise ValueError."""
+    model = fitter.results[0]['distribution_object']
+    state = model.to_dict()
+
+    with pytest.raises(ValueError):
+        FittedModel.from_dict({**state, 'version': 99})
+    with pytest.raises(ValueError):
+        FittedModel.from_bytes(fitter.result_table().to_bytes())
+    with pytest.raises(ValueError):
+        FittedModel.from_bytes(b'BD')
+    with pytest.raises(ValueError):
+        FittedModel.from_dict({**state, 'family': 'DistributionFitter'})
+
+
+def test_custom_family_key():
+    """Test that user-defined families are stored by import path."""
+    assert family_key(Gamma) == 'Gamma'
+    assert family_key(ShiftedGamma) == f'{__name__}:ShiftedGamma'
+    assert resolve_family(family_key(ShiftedGamma)) is ShiftedGamma
+    with pytest.raises(ValueError):
+        resolve_family('json:dumps')
+
+    model = FittedModel(ShiftedGamma, {'a': 2.0, 'loc': 0.0, 'scale': 1.0})
+    assert FittedModel.from_json(model.to_json()).cdf(1.0) == pytest.approx(model.cdf(1.0))
+
+
+@pytest.mark.parametrize('form', ['json', 'bytes'])
+def test_table_round_trip(gamma_data, form, monkeypatch):
+    """Test that a loaded table keeps the ranking, metrics, options and models."""
+    monkeypatch.setattr(DistributionFitter, 'RACE_MIN_SAMPLE', 100)
+    monkeypatch.setattr(DistributionFitter, 'RACE_FINALISTS', 2)
+    fitter = DistributionFitter(
+        gamma_data, distributions=[Gamma, Lognormal, Normal], fixed={'Gamma': {'loc': 0}}
+    )
+    fitter.fit(verbose=False, racing=True)
+    table = fitter.result_table()
+    if form == 'json':
+        loaded = ResultTable.from_json(table.to_json())
+    else:
+        loaded = ResultTable.from_bytes(table.to_bytes())
+
+    assert loaded.to_dict() == table.to_dict()
+    assert [r['distribution'] for r in loaded] == [r['distribution'] for r in fitter.results]
+    assert loaded.options['fixed'] == {'Gamma': {'loc': 0}}
+    assert loaded.options['n_observations'] == len(gamma_data)
+    for criterion in ('p_value', 'aic', 'bic'):
+        expected = fitter.get_best_distribution(criterion)
+        best = loaded.best(criterion)
+        assert best['distribution'] == expected['distribution']
+        assert best[criterion] == expected[criterion]
+        assert best['distribution_object'].params == expected['parameters']
+    pruned = loaded[-1]
+    assert pruned['status'] == 'pruned'
+    assert pruned['rung'] == fitter.results[-1]['rung']
+    assert pruned['distribution_object'].params == fitter.results[-1]['parameters']
+    assert list(loaded.models) == [r['distribution'] for r in fitter.results[:2]]
+    json.loads(table.to_json())
+
+
+def test_table_of_retained_distributions(gamma_data):
+    """Test that a table made from distribution objects stores the same models."""
+    fitter = DistributionFitter(gamma_data, distributions=[Gamma, Normal])
+    table = ResultTable(fitter.fit(verbose=False, retain_data=True))
+
+    assert all(isinstance(model, FittedModel) for model in table.models.values())
+    assert ResultTable.from_bytes(table.to_bytes()).best('aic')['distribution'] == 'Gamma'
+
+
+def test_load_without_pandas_or_matplotlib(fitter):
+    """Test that loading and evaluating a table imports neither pandas nor matplotlib."""
+    script = (
+        "import sys\n"
+        "from bestdist import ResultTable\n"
+        "table = ResultTable.from_bytes(sys.stdin.buffer.read())\n"
+        "table.best()['distribution_object'].cdf(1.0)\n"
+        "print([m for m in ('pandas', 'matplotlib') if m in sys.modules])"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', script], input=fitter.result_table().to_bytes(),
+        capture_output=True, check=True
+    ).stdout
+
+    assert output.decode().strip() == '[]'
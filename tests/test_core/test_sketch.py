@@ -0,0 +1,129 @@
+"""Tests for QuantileSketch and the approximate KS test."""
+
+import pytest
+import numpy as np
+from scipy.stats import gamma, ks_1samp
+from bestdist import DistributionFitter
+from bestdist.core.sketch import QuantileSketch
+from bestdist.distributions.continuous import Normal, Gamma
+
+
+@pytest.fixture
+def large_gamma_data():
+    """Generate a sample large enough to trigger compactions."""
+    rng = np.random.default_rng(7)
+    return rng.gamma(shape=2, scale=2, size=200_000)
+
+
+class TestQuantileSketch:
+    """Test suite for QuantileSketch."""
+
+    def test_small_data_is_exact(self, normal_data):
+        """Test that the sketch is exact before any compaction."""
+        sketch = QuantileSketch.from_data(normal_data)
+        assert sketch.rank_error_bound() == 0.0
+
+        cdf = gamma(2, scale=2).cdf
+        statistic, p_value = sketch.ks_test(cdf)
+        expected = ks_1samp(normal_data, cdf)
+        assert np.isclose(statistic, expected.statistic)
+        assert np.isclose(p_value, expected.pvalue)
+
+    def test_rank_error_within_bound(self, large_gamma_data):
+        """Test that the observed ECDF error respects the reported bound."""
+        sketch = QuantileSketch(seed=0)
+        for chunk in np.array_split(large_gamma_data, 50):
+            sketch.update(chunk)
+
+        grid = np.linspace(0, 30, 1000)
+        exact = np.searchsorted(np.sort(large_gamma_data), grid, side='right')
+        error = np.abs(sketch.cdf(grid) - exact / len(large_gamma_data))
+
+        assert sketch.n == len(large_gamma_data)
+        assert sketch.num_retained < 5 * sketch.k
+        assert error.max() <= sketch.rank_error_bound()
+
+    def test_ks_statistic_within_bound(self, large_gamma_data):
+        """Test the approximate KS statistic against scipy."""
+        sketch = QuantileSketch.from_data(large_gamma_data, seed=0)
+        cdf = gamma(2.1, scale=1.9).cdf
+
+        approximate = sketch.ks_statistic(cdf)
+        exact = ks_1samp(large_gamma_data, cdf).statistic
+        assert abs(approximate - exact) <= sketch.rank_error_bound()
+
+    def test_merge(self, large_gamma_data):
+        """Test that merged shard sketches track the full data."""
+        shards = [
+            QuantileSketch(seed=i).update(part)
+            for i, part in enumerate(np.array_split(large_gamma_data, 4))
+        ]
+        merged = shards[0]
+        for shard in shards[1:]:
+            merged.merge(shard)
+
+        assert merged.n == len(large_gamma_data)
+        median = merged.quantile(0.5)
+        assert abs(np.mean(large_gamma_data <= median) - 0.5) <= merged.rank_error_bound()
+        assert merged.quantile(0.0) == large_gamma_data.min()
+        assert merged.quantile(1.0) == large_gamma_data.max()
+
+    @pytest.mark.parametrize('form', ['bytes', 'json'])
+    def test_serialization_roundtrip(self, large_gamma_data, form):
+        """Test that serialized sketches answer identically."""
+        sketch = QuantileSketch.from_data(large_gamma_data, seed=0)
+        if form == 'bytes':
+            restored = QuantileSketch.from_bytes(sketch.to_bytes())
+        else:
+            restored = QuantileSketch.from_json(sketch.to_json())
+
+        grid = np.linspace(0, 30, 50)
+        np.testing.assert_array_equal(restored.cdf(grid), sketch.cdf(grid))
+        assert restored.n == sketch.n
+        assert restored.rank_error_bound() == sketch.rank_error_bound()
+
+    def test_invalid_payload(self):
+        """Test that foreign payloads are rejected."""
+        with pytest.raises(ValueError):
+            QuantileSketch.from_bytes(b'XXXX' + bytes(60))
+
+    def test_empty_sketch(self):
+        """Test that querying an empty sketch raises."""
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(0.5)
+
+
+class TestSketchGoodnessOfFit:
+    """Test the 'ks_sketch' goodness-of-fit method."""
+
+    def test_distribution_method(self, gamma_data):
+        """Test ks_sketch on a single distribution."""
+        dist = Gamma(gamma_data)
+        dist.fit()
+        statistic, p_value = dist.test_goodness_of_fit(method='ks_sketch')
+        exact_statistic, _ = dist.test_goodness_of_fit(method='ks')
+
+        assert np.isclose(statistic, exact_statistic)
+        assert 0 <= p_value <= 1
+
+    def test_fitter_shares_prebuilt_sketch(self, large_gamma_data):
+        """Test that the fitter ranks candidates from one shared sketch."""
+        sketch = QuantileSketch.from_data(large_gamma_data, seed=0)
+        fitter = DistributionFitter(
+            large_gamma_data,
+            distributions=[Normal, Gamma],
+            method='ks_sketch',
+            sketch=sketch
+        )
+        results = fitter.fit(verbose=False)
+
+        assert fitter.sketch is sketch
+        assert results[0]['distribution'] == 'Gamma'
+        assert results[0]['test_error_bound'] == sketch.rank_error_bound()
+
+    def test_fitter_rejects_discrete(self):
+        """Test that ks_sketch is refused for discrete candidates."""
+        counts = np.random.default_rng(0).poisson(3, size=1000)
+
+        with pytest.raises(ValueError, match="ks_sketch"):
+            DistributionFitter(counts, dist_type='discrete', method='ks_sketch')
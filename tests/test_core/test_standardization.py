@@ -0,0 +1,83 @@
+"""Tests for scale-normalized optimization of continuous fits."""
+
+import numpy as np
+import pytest
+from scipy import stats
+from bestdist import DistributionFitter
+from bestdist.distributions.continuous import Normal, Gamma, Weibull, Beta, StudentT
+
+
+@pytest.fixture
+def nanoseconds():
+    """Student-t latencies around 10^12 ns with a spread of 10^9."""
+    return np.random.default_rng(0).standard_t(5, size=5000) * 1e9 + 1e12
+
+
+class TestStandardization:
+    """Test suite for standardized fits."""
+
+    def test_shift_and_spread(self, nanoseconds):
+        """Test the robust location and scale of badly scaled data."""
+        shift, spread = StudentT(nanoseconds)._standardization()
+
+        assert shift == pytest.approx(np.median(nanoseconds))
+        assert spread == pytest.approx(1e9, rel=0.1)
+
+    def test_unit_scale_untouched(self, gamma_data):
+        """Test that well-scaled data and closed-form families aren't standardized."""
+        assert Gamma(gamma_data)._standardization() == (0.0, 1.0)
+        assert Normal(gamma_data * 1e9)._standardization() == (0.0, 1.0)
+
+    def test_better_optimum_on_badly_scaled_data(self, nanoseconds):
+        """Test that the back-transformed fit beats scipy's fit on raw values."""
+        params = StudentT(nanoseconds).fit()
+        raw = stats.t.fit(nanoseconds)
+
+        nll = stats.t.nnlf((params['df'], params['loc'], params['scale']), nanoseconds)
+        assert nll < stats.t.nnlf(raw, nanoseconds)
+        assert params['df'] == pytest.approx(5, rel=0.3)
+        assert params['loc'] == pytest.approx(1e12, rel=1e-3)
+
+    @pytest.mark.parametrize('dist_class, scipy_dist, sample', [
+        (Gamma, stats.gamma, lambda rng: rng.gamma(2.0, 2.0, 3000)),
+        (Weibull, stats.weibull_min, lambda rng: rng.weibull(1.5, 3000)),
+        (Beta, stats.beta, lambda rng: rng.beta(2.0, 5.0, 3000)),
+    ])
+    def test_equivariance(self, dist_class, scipy_dist, sample):
+        """Test that rescaling the data rescales loc and scale only."""
+        data = sample(np.random.default_rng(1))
+        unit = dist_class(data).fit()
+        scaled = dist_class(data * 1e6 + 5e6).fit()
+
+        names = list(unit)
+        assert scaled['loc'] == pytest.approx(unit['loc'] * 1e6 + 5e6, rel=1e-2, abs=1e4)
+        assert scaled['scale'] == pytest.approx(unit['scale'] * 1e6, rel=1e-2)
+        for name in names[:-2]:
+            assert scaled[name] == pytest.approx(unit[name], rel=1e-2)
+
+    def test_fixed_loc_is_mapped(self):
+        """Test that a fixed loc survives standardization."""
+        data = np.random.default_rng(2).gamma(3.0, 1e9, size=3000)
+        params = Gamma(data, fixed={'loc': 0}).fit()
+
+        assert params['loc'] == pytest.approx(0, abs=1e-3)
+        assert params['a'] == pytest.approx(3, rel=0.1)
+        assert params['scale'] == pytest.approx(1e9, rel=0.1)
+
+    def test_jacobian(self, nanoseconds):
+        """Test the log-likelihood correction of standardized values."""
+        dist = StudentT(nanoseconds)
+        shift, spread = dist._standardization()
+        theta = np.array([5.0, 1e12, 1e9])
+        z_theta = np.array([5.0, (1e12 - shift) / spread, 1e9 / spread])
+
+        nll = dist._negative_log_likelihood(stats.t, z_theta, (nanoseconds - shift) / spread, spread)
+        assert nll == pytest.approx(stats.t.nnlf(theta, nanoseconds))
+
+    def test_fitter_ranks_on_original_scale(self, nanoseconds):
+        """Test AIC of a standardized fit against the raw-scale likelihood."""
+        fitter = DistributionFitter(nanoseconds, distributions=[StudentT])
+        result = fitter.fit()[0]
+
+        dist = result['distribution_object']
+        assert result['aic'] == pytest.approx(6 - 2 * np.sum(dist.dist.logpdf(nanoseconds)), rel=1e-6)
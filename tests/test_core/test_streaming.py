@@ -0,0 +1,158 @@
+"""Tests for CountHistogram and StreamingDiscreteFitter."""
+
+import pickle
+
+import pytest
+import numpy as np
+from bestdist import CountHistogram, DistributionFitter, StreamingDiscreteFitter
+from bestdist.distributions.discrete import Poisson, NegativeBinomial
+
+
+@pytest.fixture
+def poisson_counts():
+    """Generate sample count data from a Poisson distribution."""
+    np.random.seed(42)
+    return np.random.poisson(lam=3.5, size=5000)
+
+
+class TestCountHistogram:
+    """Test suite for CountHistogram."""
+
+    def test_matches_unique(self, poisson_counts):
+        """Test that frequencies match np.unique on the raw data."""
+        hist = CountHistogram.from_data(poisson_counts)
+        values, counts = hist.frequencies()
+        expected_values, expected_counts = np.unique(poisson_counts, return_counts=True)
+
+        np.testing.assert_array_equal(values, expected_values)
+        np.testing.assert_array_equal(counts, expected_counts)
+        assert hist.n == len(poisson_counts)
+        assert np.isclose(hist.mean(), np.mean(poisson_counts))
+        assert np.isclose(hist.var(), np.var(poisson_counts))
+
+    def test_overflow_values(self):
+        """Test that values beyond max_bins go to the overflow table."""
+        data = np.array([0, 1, 1, 2, 5, 1000, 1000, 10**12])
+        hist = CountHistogram(max_bins=4).update(data)
+        values, counts = hist.frequencies()
+
+        np.testing.assert_array_equal(values, [0, 1, 2, 5, 1000, 10**12])
+        np.testing.assert_array_equal(counts, [1, 2, 1, 1, 2, 1])
+        assert hist.max() == 10**12
+
+    def test_merge_equals_single_pass(self, poisson_counts):
+        """Test that merging chunk histograms equals one big histogram."""
+        parts = np.array_split(poisson_counts, 4)
+        merged = CountHistogram(max_bins=5)
+        for part in parts:
+            merged.merge(CountHistogram(max_bins=8).update(part))
+        single = CountHistogram.from_data(poisson_counts)
+
+        for left, right in zip(merged.frequencies(), single.frequencies()):
+            np.testing.assert_array_equal(left, right)
+        assert merged.n == single.n
+
+    def test_quantile(self, poisson_counts):
+        """Test empirical quantiles against numpy."""
+        hist = CountHistogram.from_data(poisson_counts)
+        q = np.array([0.1, 0.5, 0.9])
+        expected = np.percentile(poisson_counts, q * 100, method='inverted_cdf')
+        np.testing.assert_array_equal(hist.quantile(q), expected)
+
+    def test_negative_values(self):
+        """Test that negative values are rejected."""
+        with pytest.raises(ValueError):
+            CountHistogram().update([1, -2, 3])
+
+    def test_nan_values_ignored(self):
+        """Test that NaN values are skipped."""
+        hist = CountHistogram().update([1.0, np.nan, 3.0])
+        assert hist.n == 2
+
+
+class TestStreamingDiscreteFitter:
+    """Test suite for StreamingDiscreteFitter."""
+
+    def test_matches_in_memory_fitter(self, poisson_counts):
+        """Test that streaming results equal the in-memory fitter."""
+        streaming = StreamingDiscreteFitter()
+        for chunk in np.array_split(poisson_counts, 10):
+            streaming.update(chunk)
+        streaming_results = streaming.fit(verbose=False)
+
+        fitter = DistributionFitter(poisson_counts, dist_type='discrete')
+        results = fitter.fit(verbose=False)
+
+        assert [r['distribution'] for r in streaming_results] == \
+            [r['distribution'] for r in results]
+        for left, right in zip(streaming_results, results):
+            for name, value in right['parameters'].items():
+                assert np.isclose(left['parameters'][name], value)
+            assert np.isclose(left['test_statistic'], right['test_statistic'])
+            assert np.isclose(left['aic'], right['aic'])
+            assert np.isclose(left['bic'], right['bic'])
+
+    def test_ks_from_histogram(self, poisson_counts):
+        """Test that the KS test from counts matches scipy on raw data."""
+        streaming = StreamingDiscreteFitter(distributions=[Poisson], method='ks')
+        streaming.update(poisson_counts)
+        fitter = DistributionFitter(
+            poisson_counts, distributions=[Poisson], dist_type='discrete', method='ks'
+        )
+
+        streaming_result = streaming.fit(verbose=False)[0]
+        result = fitter.fit(verbose=False)[0]
+
+        assert np.isclose(streaming_result['test_statistic'], result['test_statistic'])
+        assert np.isclose(streaming_result['p_value'], result['p_value'])
+
+    def test_merge_workers(self, poisson_counts):
+        """Test merging fitters built by separate (pickled) workers."""
+        workers = [
+            pickle.loads(pickle.dumps(StreamingDiscreteFitter().update(part)))
+            for part in np.array_split(poisson_counts, 3)
+        ]
+        combined = StreamingDiscreteFitter(distributions=[Poisson, NegativeBinomial])
+        for worker in workers:
+            combined.merge(worker)
+
+        assert combined.n_observations == len(poisson_counts)
+        best = combined.get_best_distribution()
+        assert np.isclose(best['parameters'].get('mu', 3.5), 3.5, atol=0.2)
+
+    def test_update_invalidates_results(self, poisson_counts):
+        """Test that new data triggers a refit on demand."""
+        fitter = StreamingDiscreteFitter(distributions=[Poisson])
+        fitter.update(poisson_counts)
+        first = fitter.get_best_distribution()['parameters']['mu']
+
+        fitter.update(np.full(5000, 10))
+        assert not fitter._fitted
+        second = fitter.get_best_distribution()['parameters']['mu']
+        assert second > first
+
+    def test_fit_options_forwarded(self, poisson_counts):
+        """Test that fit options reach DistributionFitter.fit."""
+        fitter = StreamingDiscreteFitter(distributions=[Poisson, NegativeBinomial])
+        fitter.update(poisson_counts)
+        serial = fitter.fit(verbose=False)
+        parallel = fitter.fit(verbose=False, n_jobs=2)
+
+        assert [r['distribution'] for r in parallel] == [r['distribution'] for r in serial]
+        assert parallel[0]['parameters'] == serial[0]['parameters']
+        with pytest.raises(TypeError):
+            fitter.fit(verbose=False, unknown_option=True)
+
+    def test_fit_empty(self):
+        """Test that fitting without data raises."""
+        with pytest.raises(ValueError):
+            StreamingDiscreteFitter().fit()
+
+    def test_summary_and_plot(self, poisson_counts):
+        """Test summary and plotting from a histogram."""
+        fitter = StreamingDiscreteFitter.from_chunks(np.array_split(poisson_counts, 5))
+        fitter.fit(verbose=False)
+
+        assert len(fitter.summary()) > 0
+        fig = fitter.plot_best_fit()
+        assert len(fig.axes) == 2
@@ -0,0 +1,131 @@
+"""Tests for warm-started fits and the parameter store."""
+
+import numpy as np
+import pytest
+from bestdist import DistributionFitter, ParameterStore
+from bestdist.distributions.continuous import Normal, Gamma, Beta, StudentT, Weibull, Cauchy
+
+
+@pytest.fixture
+def grown_gamma():
+    """Gamma data before and after new observations arrived."""
+    data = np.random.default_rng(1).gamma(2.0, 2.0, size=4000)
+    return data[:3000], data
+
+
+class TestWarmFit:
+    """Test suite for fit(initial=...) on distributions."""
+
+    @pytest.mark.parametrize('dist_class', [Gamma, StudentT])
+    def test_matches_cold_fit(self, dist_class, grown_gamma):
+        """Test that a warm start reaches the cold-start optimum."""
+        before, after = grown_gamma
+        prior = dist_class(before).fit()
+        cold = dist_class(after)
+        cold.fit()
+        warm = dist_class(after)
+        warm.fit(initial=prior)
+
+        nll = cold._get_scipy_dist().nnlf
+        assert nll(tuple(warm.params.values()), after) == pytest.approx(
+            nll(tuple(cold.params.values()), after), rel=1e-6
+        )
+
+    @pytest.mark.parametrize('dist_class', [Gamma, StudentT, Weibull, Cauchy])
+    def test_fewer_evaluations(self, dist_class):
+        """Test that a refit from earlier parameters needs far fewer likelihood evaluations."""
+        data = np.random.default_rng(2).weibull(1.5, size=4000) * 3
+        prior = dist_class(data[:3000]).fit()
+        cold = dist_class(data)
+        cold.fit()
+        warm = dist_class(data)
+        warm.fit(initial=prior)
+
+        assert warm.fit_info['warm_start']
+        assert warm.fit_info['converged']
+        assert warm.fit_info['nfev'] * 4 < cold.fit_info['nfev']
+
+    @pytest.mark.parametrize('derivatives', [True, False])
+    def test_unconverged_prior_falls_back(self, gamma_data, derivatives, monkeypatch):
+        """Test that a warm fit that doesn't converge is redone cold."""
+        if not derivatives:
+            # Nelder-Mead from the prior instead of Newton
+            monkeypatch.setattr('bestdist.core.base.has_derivatives', lambda dist: False)
+        far = {'a': 50.0, 'loc': -30.0, 'scale': 0.5}
+        cold = Gamma(gamma_data)
+        cold.fit(maxiter=5)
+        warm = Gamma(gamma_data)
+        warm.fit(initial=far, maxiter=5)
+
+        assert warm.fit_info['warm_start'] is False
+        assert warm.params == pytest.approx(cold.params)
+        assert warm.fit_info['nfev'] == cold.fit_info['nfev']
+
+    def test_invalid_prior_falls_back(self, beta_data):
+        """Test that unusable priors give the cold-start result."""
+        cold = Beta(beta_data).fit()
+        outside = {'a': 2.0, 'b': 5.0, 'loc': 0.5, 'scale': 0.1}
+
+        for prior in ({'a': 2.0}, {'a': np.nan, 'b': 1.0, 'loc': 0.0, 'scale': 1.0}, outside):
+            assert Beta(beta_data).fit(initial=prior) == pytest.approx(cold)
+
+    def test_ignored_without_support(self, normal_data):
+        """Test that closed-form families ignore priors."""
+        cold = Normal(normal_data).fit()
+        warm = Normal(normal_data).fit(initial={'loc': 0.0, 'scale': 1.0})
+
+        assert warm == cold
+
+
+class TestFitterWarmStart:
+    """Test suite for DistributionFitter.fit(warm_start=...)."""
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_priors_from_results(self, grown_gamma, n_jobs):
+        """Test passing the previous results as priors."""
+        before, after = grown_gamma
+        candidates = [Normal, Gamma]
+        previous = DistributionFitter(before, distributions=candidates).fit()
+        priors = {r['distribution']: r['parameters'] for r in previous}
+
+        cold = DistributionFitter(after, distributions=candidates).fit()
+        warm = DistributionFitter(after, distributions=candidates).fit(
+            warm_start=priors, n_jobs=n_jobs
+        )
+
+        assert [r['distribution'] for r in warm] == [r['distribution'] for r in cold]
+        for w, c in zip(warm, cold):
+            assert w['aic'] == pytest.approx(c['aic'], rel=1e-6)
+
+    def test_keyed_store(self, grown_gamma, tmp_path):
+        """Test reading priors from and saving fits to a local store."""
+        before, after = grown_gamma
+        store = ParameterStore(tmp_path / 'store.json')
+        DistributionFitter(before, distributions=[Gamma]).fit(
+            warm_start='latency', parameter_store=store
+        )
+
+        reopened = ParameterStore(tmp_path / 'store.json')
+        first = reopened.get('latency')['Gamma']
+        DistributionFitter(after, distributions=[Gamma]).fit(
+            warm_start='latency', parameter_store=reopened
+        )
+
+        assert 'latency' in ParameterStore(tmp_path / 'store.json')
+        assert reopened.get('latency')['Gamma'] != first
+        assert reopened.get('other') == {}
+
+    def test_default_store(self, gamma_data, tmp_path, monkeypatch):
+        """Test that the default store follows XDG_CACHE_HOME."""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        DistributionFitter(gamma_data, distributions=[Gamma]).fit(warm_start='x')
+
+        assert (tmp_path / 'bestdist' / 'warm_start.json').exists()
+        assert 'Gamma' in ParameterStore().get('x')
+
+    def test_corrupt_store(self, tmp_path):
+        """Test that an unreadable store starts empty."""
+        path = tmp_path / 'store.json'
+        path.write_text('{broken')
+
+        assert ParameterStore(path).get('latency') == {}
@@ -75,3 +75,24 @@ class TestBinomial:
         assert chi2_stat >= 0
         assert 0 <= p_value <= 1
 
+    
+    def test_binomial_known_n(self):
+        """Test fitting p with a known number of trials."""
+        np.random.seed(42)
+        data = np.random.binomial(n=12, p=0.3, size=1000)
+        
+        dist = Binomial(data, fixed={'n': 12})
+        params = dist.fit()
+        
+        assert params['n'] == 12
+        assert params['p'] == pytest.approx(data.mean() / 12)
+        assert dist.n_free_params == 1
+        
+    def test_binomial_known_n_too_small(self):
+        """Test that observations above the known n are rejected."""
+        from bestdist.utils.exceptions import FittingError
+        
+        with pytest.raises(FittingError, match="n=3"):
+            Binomial([1, 4, 2, 3], fixed={'n': 3}).fit()
+        with pytest.raises(ValueError, match="cannot fix"):
+            Binomial([1, 2, 3], fixed={'p': 0.5})
@@ -0,0 +1,107 @@
+"""Tests for input array conversion."""
+
+import pytest
+import numpy as np
+import pandas as pd
+from bestdist import DistributionFitter
+from bestdist.distributions.continuous import Normal
+from bestdist.distributions.discrete import Poisson
+from bestdist.utils.arrays import to_clean_array
+
+
+class TestToCleanArray:
+    """Test suite for to_clean_array."""
+
+    def test_numpy_without_nan_is_not_copied(self, normal_data):
+        """Test that clean numpy arrays are returned as is."""
+        assert to_clean_array(normal_data) is normal_data
+
+    def test_numpy_with_nan(self, data_with_nans):
+        """Test that NaN values are removed."""
+        arr = to_clean_array(data_with_nans)
+        assert not np.isnan(arr).any()
+        assert len(arr) == np.sum(~np.isnan(data_with_nans))
+
+    def test_list_with_none(self):
+        """Test lists with missing entries."""
+        np.testing.assert_array_equal(to_clean_array([1, None, 3]), [1.0, 3.0])
+
+    def test_numpy_backed_series_is_not_copied(self, pandas_series_data):
+        """Test that float64 Series share memory with the result."""
+        arr = to_clean_array(pandas_series_data)
+        assert np.shares_memory(arr, pandas_series_data.to_numpy())
+
+    @pytest.mark.parametrize('dtype, expected_kind', [('Int64', 'i'), ('Float64', 'f'), ('UInt8', 'u')])
+    def test_nullable_without_missing_is_zero_copy(self, dtype, expected_kind):
+        """Test that nullable columns without NA reuse their value buffer."""
+        series = pd.Series([1, 2, 3, 4], dtype=dtype)
+        arr = to_clean_array(series)
+
+        assert arr.dtype.kind == expected_kind
+        assert np.shares_memory(arr, series.array._data)
+        np.testing.assert_array_equal(arr, [1, 2, 3, 4])
+
+    @pytest.mark.parametrize('dtype', ['Int64', 'Float64'])
+    def test_nullable_with_missing(self, dtype):
+        """Test that masked values are dropped."""
+        series = pd.Series([1, None, 3, pd.NA, 5], dtype=dtype)
+        np.testing.assert_array_equal(to_clean_array(series), [1, 3, 5])
+
+    def test_pyarrow_arrays(self):
+        """Test Arrow arrays with and without nulls, including slices."""
+        pa = pytest.importorskip('pyarrow')
+        clean = pa.array(np.arange(10, dtype=np.int64))
+        arr = to_clean_array(clean)
+        assert arr.dtype == np.int64
+        np.testing.assert_array_equal(arr, np.arange(10))
+
+        with_nulls = pa.array([0.5, None, 2.5, None, 4.5, 5.5])[1:]
+        np.testing.assert_array_equal(to_clean_array(with_nulls), [2.5, 4.5, 5.5])
+
+        chunked = pa.chunked_array([[1, None], [3, 4]])
+        np.testing.assert_array_equal(to_clean_array(chunked), [1, 3, 4])
+
+    def test_arrow_backed_series(self):
+        """Test pandas columns backed by Arrow."""
+        pytest.importorskip('pyarrow')
+        series = pd.Series([1.0, None, 3.0], dtype='float64[pyarrow]')
+        np.testing.assert_array_equal(to_clean_array(series), [1.0, 3.0])
+
+    def test_polars_series(self):
+        """Test Polars Series with and without nulls."""
+        pl = pytest.importorskip('polars')
+        np.testing.assert_array_equal(to_clean_array(pl.Series([1, 2, 3])), [1, 2, 3])
+        np.testing.assert_array_equal(to_clean_array(pl.Series([1.0, None, 3.0])), [1.0, 3.0])
+
+
+class TestIngestion:
+    """Test nullable inputs through the fitter and distributions."""
+
+    def test_fitter_nullable_float(self, normal_data):
+        """Test fitting a Float64 column with missing values."""
+        series = pd.Series(normal_data, dtype='Float64')
+        series.iloc[::50] = pd.NA
+        fitter = DistributionFitter(series, distributions=[Normal])
+
+        assert len(fitter.data) == len(normal_data) - 20
+        assert fitter.data.dtype == np.float64
+        assert fitter.fit(verbose=False)[0]['distribution'] == 'Normal'
+
+    def test_fitter_nullable_int_discrete(self):
+        """Test fitting an Int64 count column with missing values."""
+        np.random.seed(42)
+        series = pd.Series(np.random.poisson(3, size=500), dtype='Int64')
+        series.iloc[::10] = pd.NA
+        fitter = DistributionFitter(series, dist_type='discrete', distributions=[Poisson])
+
+        assert len(fitter.data) == 450
+        assert fitter.fit(verbose=False)[0]['parameters']['mu'] > 0
+
+    def test_distribution_nullable_input(self, normal_data):
+        """Test distributions accept nullable columns directly."""
+        series = pd.Series(normal_data, dtype='Float64')
+        series.iloc[0] = pd.NA
+        dist = Normal(series)
+
+        assert len(dist.data) == len(normal_data) - 1
+        assert dist.data.dtype == np.float64